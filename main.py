@@ -8,6 +8,10 @@ Usage:
   python main.py scene.yaml --delta
   python main.py scene.yaml --serve --port 5050
   python main.py scene.yaml --no-ascii --no-gif
+  python main.py scene.yaml --preview-format apng
+  python main.py scene.yaml --profile --trace output/trace.json
+  python main.py --bench --bench-compare output/benchmark_baseline.json
+  python main.py --build "examples/**/*.yaml" --jobs 4
 """
 
 import argparse
@@ -15,11 +19,10 @@ import os
 import sys
 import time
 
-from oled_animator.dsl import parse_scene, DSLError
-from oled_animator.exporters.c_array import export_c_array
-from oled_animator.exporters.delta import export_delta
-from oled_animator.exporters.gif_preview import save_gif
-from oled_animator.exporters.ascii_preview import print_animation
+from oled_animator import profiler
+
+# Engine, exporters and Flask are imported lazily inside each CLI path so
+# `--help` and single small scenes start fast.
 
 
 BANNER = r"""
@@ -40,12 +43,37 @@ def main():
     parser.add_argument("--output-dir", "-o", default="output", help="Output directory (default: output)")
     parser.add_argument("--format", "-f", default=None, help="Byte format: horizontal, vertical, page")
     parser.add_argument("--delta", action="store_true", help="Enable delta compression export")
-    parser.add_argument("--no-gif", action="store_true", help="Skip GIF generation")
+    parser.add_argument("--display-list", action="store_true", help="Export unique bitmaps + per-frame draw ops with a C runtime")
+    parser.add_argument("--keyframes", action="store_true", help="Export keyframe curves + fixed-point C runtime (interpolated on the device)")
+    parser.add_argument("--no-gif", action="store_true", help="Skip preview (GIF/APNG/WebP/MP4) generation")
     parser.add_argument("--no-ascii", action="store_true", help="Skip ASCII terminal preview")
+    parser.add_argument("--ascii-mode", default=None, choices=("half", "braille", "block"), help="Terminal preview cells: half (1x2 px), braille (2x4 px) or block (1 px)")
     parser.add_argument("--scale", type=int, default=4, help="GIF/Web scale factor (default: 4)")
+    parser.add_argument("--preview-format", default=None, choices=("gif", "apng", "webp", "mp4"), help="Preview format (default: gif; mp4 needs ffmpeg)")
+    parser.add_argument("--preview-fg", default="white", help="Preview lit-pixel colour, e.g. '#4cc9ff' for a blue OLED (default: white)")
+    parser.add_argument("--preview-bg", default="black", help="Preview background colour (default: black)")
+    parser.add_argument("--gif-optimize", action="store_true", help="Let PIL make unchanged GIF pixels transparent (slower; smaller only for busy backgrounds)")
     parser.add_argument("--dithering", action="store_true", help="Force dithering on all sprites")
     parser.add_argument("--serve", action="store_true", help="Start Studio Dashboard")
     parser.add_argument("--port", type=int, default=5050, help="Web preview port (default: 5050)")
+    parser.add_argument("--live-idle", type=float, default=300, help="Evict idle Studio live-preview sessions after N seconds (default: 300)")
+    parser.add_argument("--profile", action="store_true", help="Print per-stage and per-element timing report")
+    parser.add_argument("--trace", default=None, help="Write Chrome trace-event JSON to this path (implies --profile)")
+    parser.add_argument("--build", nargs="+", metavar="PATTERN", help="Batch-build scenes matching directories/globs")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes for --build (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if outputs are up to date")
+    parser.add_argument("--import", dest="import_path", default=None, metavar="PATH", help="Convert an animated GIF/APNG/WebP or video (needs ffmpeg) instead of a scene")
+    parser.add_argument("--import-size", default="128x64", help="Target size WxH for --import (default: 128x64)")
+    parser.add_argument("--import-fps", type=float, default=None, help="Frame rate for --import (default: from the source)")
+    parser.add_argument("--import-scale", default="fit", help="Scale mode for --import: fit, stretch, center, original (default: fit)")
+    parser.add_argument("--import-dither", default="floyd-steinberg", help="Dithering for --import, or 'simple' threshold (default: floyd-steinberg)")
+    parser.add_argument("--invert", action="store_true", help="Invert imported frames")
+    parser.add_argument("--no-temporal", action="store_true", help="Dither imported frames independently (default: reuse pixels where the source is unchanged)")
+    parser.add_argument("--bench", action="store_true", help="Run the benchmark suite over examples/ and synthetic scenes")
+    parser.add_argument("--bench-out", default=os.path.join("output", "benchmark.json"), help="Benchmark results JSON path")
+    parser.add_argument("--bench-compare", default=None, help="Baseline benchmark JSON to check for regressions")
+    parser.add_argument("--bench-threshold", type=float, default=20.0, help="Regression threshold in percent (default: 20)")
+    parser.add_argument("--bench-repeats", type=int, default=3, help="Runs per case, best time is kept (default: 3)")
 
     args = parser.parse_args()
 
@@ -54,17 +82,36 @@ def main():
     # Studio Dashboard (standalone — no scene file needed)
     if args.serve:
         from web_preview.server import start_server
-        start_server(port=args.port)
+        start_server(port=args.port, live_idle_timeout=args.live_idle)
         return
 
+    # Batch build (standalone — scenes come from --build patterns)
+    if args.build:
+        sys.exit(run_build(args))
+
+    # Animation import (standalone — frames come from --import)
+    if args.import_path:
+        sys.exit(run_import(args))
+
+    # Benchmark suite (standalone — no scene file needed)
+    if args.bench:
+        sys.exit(run_benchmarks(args))
+
     # Scene file is required for all other modes
     if not args.scene:
         parser.error("A scene YAML file is required (or use --serve for the Studio Dashboard)")
 
+    prof = profiler.activate(profiler.Profiler()) if args.profile or args.trace else None
+    span = profiler.span
+
+    with span("import:dsl", category="import"):
+        from oled_animator.dsl import parse_scene, DSLError
+
     # Parse scene
     print(f"📄 Loading scene: {args.scene}")
     try:
-        scene = parse_scene(args.scene)
+        with span("parse"):
+            scene = parse_scene(args.scene)
     except DSLError as e:
         print(f"\n❌ DSL Error: {e}")
         sys.exit(1)
@@ -77,26 +124,35 @@ def main():
 
     fmt = args.format or output_opts.get("format", "horizontal")
     do_gif = not args.no_gif and output_opts.get("gif", True)
+    preview_fmt = args.preview_format or output_opts.get("preview_format", "gif")
     do_ascii = not args.no_ascii and output_opts.get("ascii_preview", True)
     do_c_array = output_opts.get("c_array", True)
     do_delta = args.delta or output_opts.get("delta_compression", False)
+    do_display_list = args.display_list or output_opts.get("display_list", False)
+    do_keyframes = args.keyframes or output_opts.get("keyframes", False)
+
+    output_dir = args.output_dir
+    os.makedirs(output_dir, exist_ok=True)
 
-    # Render
+    # Render; the preview (GIF by default) is written frame by frame, and
+    # the frame list is only kept for the exporters that need every frame
+    preview = start_preview(anim.fps, output_dir, preview_fmt, args) if do_gif else None
     print(f"🎨 Rendering {anim.total_frames} frames ({anim.width}x{anim.height} @ {anim.fps} FPS)...")
     t0 = time.time()
-    frames = anim.render_all()
+    with span("render"):
+        frames, preview = render_frames(anim, preview, keep=do_c_array or do_delta or do_ascii)
     elapsed = time.time() - t0
-    print(f"   Done in {elapsed:.2f}s ({elapsed / anim.total_frames * 1000:.1f}ms/frame)")
-
-    output_dir = args.output_dir
-    os.makedirs(output_dir, exist_ok=True)
+    print(f"   Done in {elapsed:.2f}s ({elapsed / max(anim.total_frames, 1) * 1000:.1f}ms/frame)")
 
     # C-Array export
     if do_c_array:
         h_path = os.path.join(output_dir, "animation.h")
-        result = export_c_array(
-            frames, h_path, anim.width, anim.height, anim.fps, fmt=fmt,
-        )
+        with span("import:exporters.c_array", category="import"):
+            from oled_animator.exporters.c_array import export_c_array
+        with span("export:c_array"):
+            result = export_c_array(
+                frames, h_path, anim.width, anim.height, anim.fps, fmt=fmt,
+            )
         print(f"\n📦 C-Array exported: {result['path']}")
         print(f"   Format: {fmt}")
         print(f"   {result['frame_count']} frames × {result['frame_size']} bytes = {result['total_kb']:.2f} KB")
@@ -104,28 +160,248 @@ def main():
     # Delta export
     if do_delta:
         delta_path = os.path.join(output_dir, "animation_delta.h")
-        result = export_delta(
-            frames, delta_path, anim.width, anim.height, anim.fps,
-        )
+        with span("import:exporters.delta", category="import"):
+            from oled_animator.exporters.delta import export_delta
+        with span("export:delta"):
+            result = export_delta(
+                frames, delta_path, anim.width, anim.height, anim.fps,
+                damage=anim.damage(),
+            )
         print(f"\n📦 Delta exported: {result['path']}")
         print(f"   Delta: {result['total_bytes']} bytes ({result['total_bytes'] / 1024:.2f} KB)")
         print(f"   Full would be: {result['full_bytes']} bytes ({result['full_bytes'] / 1024:.2f} KB)")
         print(f"   💾 Savings: {result['savings_pct']:.1f}%")
 
-    # GIF
-    if do_gif:
-        gif_path = os.path.join(output_dir, "preview.gif")
-        result = save_gif(frames, gif_path, anim.fps, scale=args.scale)
-        if result:
-            print(f"\n🎬 GIF saved: {result['path']}")
-            print(f"   {result['resolution']} | {result['frame_count']} frames | {result['duration_ms']}ms/frame")
+    # Display list export
+    if do_display_list:
+        dl_path = os.path.join(output_dir, "animation_dl.h")
+        with span("import:exporters.display_list", category="import"):
+            from oled_animator.exporters.display_list import export_display_list
+        with span("export:display_list"):
+            result = export_display_list(anim, dl_path)
+        print(f"\n📦 Display list exported: {result['path']} (+ {os.path.basename(result['runtime_path'])})")
+        print(f"   {result['bitmap_count']} bitmaps, {result['op_count']} ops, {result['unique_frames']} unique frames")
+        print(f"   Display list: {result['total_bytes']} bytes ({result['total_bytes'] / 1024:.2f} KB)")
+        print(f"   Full would be: {result['full_bytes']} bytes ({result['full_bytes'] / 1024:.2f} KB)")
+        print(f"   💾 Savings: {result['savings_pct']:.1f}%")
+        if result["verified"] is False:
+            print("   ⚠️  Replay does not match the rendered frames")
+
+    # Keyframe curve export
+    if do_keyframes:
+        kc_path = os.path.join(output_dir, "animation_kc.h")
+        with span("import:exporters.keyframes", category="import"):
+            from oled_animator.exporters.keyframes import export_keyframes
+        try:
+            with span("export:keyframes"):
+                result = export_keyframes(anim, kc_path)
+        except ValueError as e:
+            print(f"\n❌ Keyframe export: {e}")
+        else:
+            check = result["verify"]
+            print(f"\n📦 Keyframe curves exported: {result['path']} (+ {os.path.basename(result['runtime_path'])})")
+            print(f"   {result['element_count']} elements, {result['key_count']} keys")
+            print(f"   Curves: {result['total_bytes']} bytes ({result['total_bytes'] / 1024:.2f} KB)")
+            print(f"   Full would be: {result['full_bytes']} bytes ({result['full_bytes'] / 1024:.2f} KB)")
+            print(f"   💾 Savings: {result['savings_pct']:.1f}%")
+            print(f"   Fixed-point check: {check['differing_frames']}/{check['frames']} frames differ "
+                  f"(max {check['max_pixels']} px, {check['arg_mismatches']} arg mismatches)")
+
+    # Preview (GIF by default)
+    if preview is not None:
+        finish_preview(preview, preview_fmt)
 
     # ASCII preview
     if do_ascii:
         print(f"\n🖥️  ASCII Preview ({anim.fps} FPS):\n")
-        print_animation(frames, anim.fps, loops=1)
+        from oled_animator.exporters.ascii_preview import print_animation
+        with span("ascii_preview"):
+            print_animation(frames, anim.fps, loops=1, mode=args.ascii_mode)
+
+    if prof is not None:
+        print(f"\n⏱️  Profile:\n")
+        print(prof.report())
+        if args.trace:
+            prof.write_trace(args.trace)
+            print(f"\n   Trace written: {args.trace}")
+
+    print(f"\n✅ All done! Output in: {os.path.abspath(output_dir)}/")
+
+
+def render_frames(anim, preview, keep: bool = True) -> tuple:
+    """Render every frame, adding each to the `preview` writer as it is
+    drawn. Returns (frames, preview): frames is empty unless `keep`, and
+    preview is None if writing it failed."""
+    if preview is not None:
+        from oled_animator.exporters.preview import PreviewError
+    frames = []
+    ops = anim.compile()
+    for i in anim.frame_range():
+        canvas = anim.render_frame(i, ops)
+        if keep:
+            frames.append(canvas)
+        if preview is not None:
+            try:
+                preview.add(canvas)
+            except PreviewError as e:
+                preview.abort()
+                print(f"\n❌ Preview: {e}")
+                preview = None
+    return frames, preview
+
+
+def start_preview(fps: float, output_dir: str, fmt: str, args):
+    """Open the preview writer for `fmt`; None (after saying why) if it
+    cannot be written."""
+    span = profiler.span
+    with span("import:exporters.preview", category="import"):
+        from oled_animator.exporters.preview import open_preview, preview_path, PreviewError
+
+    options = {"scale": args.scale, "bg_color": args.preview_bg, "fg_color": args.preview_fg}
+    if fmt == "gif":
+        options["optimize"] = args.gif_optimize
+    try:
+        return open_preview(fmt, preview_path(output_dir, fmt), fps, **options)
+    except (PreviewError, ValueError) as e:
+        print(f"\n❌ Preview ({fmt}): {e}")
+        return None
+
+
+def finish_preview(writer, fmt: str):
+    """Close a preview writer and print a summary."""
+    from oled_animator.exporters.preview import PreviewError
+
+    if writer.frame_count == 0:
+        return
+    try:
+        with profiler.span(f"export:{fmt}"):
+            result = writer.close()
+    except PreviewError as e:
+        writer.abort()
+        print(f"\n❌ Preview ({fmt}): {e}")
+        return
+    print(f"\n🎬 Preview saved: {result['path']}")
+    print(f"   {result['resolution']} | {result['frame_count']} frames "
+          f"({result['unique_frames']} unique) | {result['duration_ms']}ms/frame | "
+          f"{result['bytes'] / 1024:.1f} KB")
+
+
+def export_preview(frames: list, fps: float, output_dir: str, fmt: str, args):
+    """Write already rendered frames as the preview in `fmt`."""
+    writer = start_preview(fps, output_dir, fmt, args)
+    if writer is None:
+        return
+    from oled_animator.exporters.preview import PreviewError
+    try:
+        for canvas in frames:
+            writer.add(canvas)
+    except PreviewError as e:
+        writer.abort()
+        print(f"\n❌ Preview ({fmt}): {e}")
+        return
+    finish_preview(writer, fmt)
+
+
+def run_build(args) -> int:
+    """Build all scenes matched by --build; returns the process exit code."""
+    from oled_animator.build import build
+
+    print(f"🏗️  Building {' '.join(args.build)} → {args.output_dir}/")
+    t0 = time.time()
+    summary = build(
+        args.build, args.output_dir, jobs=args.jobs, force=args.force,
+        fmt=args.format, delta=args.delta, gif=not args.no_gif, scale=args.scale,
+        preview_format=args.preview_format,
+    )
+    elapsed = time.time() - t0
+
+    if summary["scenes"] == 0:
+        print("\n❌ No scenes matched.")
+        return 1
+    print(
+        f"\n📦 {summary['built']} built, {summary['skipped']} up to date, "
+        f"{summary['failed']} failed in {elapsed:.2f}s"
+    )
+    return 1 if summary["failed"] else 0
+
+
+def run_import(args) -> int:
+    """Convert --import into exporter outputs; returns the process exit code."""
+    from oled_animator.importer import import_animation, ImportSourceError
+
+    try:
+        width, height = (int(v) for v in args.import_size.lower().split("x"))
+    except ValueError:
+        print(f"\n❌ Invalid --import-size: {args.import_size} (expected WxH)")
+        return 1
+    settings = {
+        "width": width,
+        "height": height,
+        "scale_mode": args.import_scale,
+        "dither": args.import_dither,
+        "invert": args.invert,
+        "temporal": not args.no_temporal,
+    }
+
+    print(f"🎞️  Importing: {args.import_path}")
+    t0 = time.time()
+    try:
+        result = import_animation(args.import_path, settings, fps=args.import_fps)
+    except ImportSourceError as e:
+        print(f"\n❌ Import Error: {e}")
+        return 1
+    frames, fps = result["frames"], result["fps"]
+    elapsed = time.time() - t0
+    print(f"   {len(frames)} frames ({width}x{height} @ {fps} FPS) in {elapsed:.2f}s")
+    if settings["temporal"]:
+        print(f"   Temporal dithering kept {result['reused_pct']:.1f}% of pixels")
+
+    output_dir = args.output_dir
+    os.makedirs(output_dir, exist_ok=True)
+    fmt = args.format or "horizontal"
+
+    from oled_animator.exporters.c_array import export_c_array
+    h_path = os.path.join(output_dir, "animation.h")
+    res = export_c_array(frames, h_path, width, height, fps, fmt=fmt)
+    print(f"\n📦 C-Array exported: {res['path']}")
+    print(f"   {res['frame_count']} frames × {res['frame_size']} bytes = {res['total_kb']:.2f} KB")
+
+    if args.delta:
+        from oled_animator.exporters.delta import export_delta
+        res = export_delta(frames, os.path.join(output_dir, "animation_delta.h"), width, height, fps)
+        print(f"\n📦 Delta exported: {res['path']}")
+        print(f"   💾 Savings: {res['savings_pct']:.1f}%")
+
+    if not args.no_gif:
+        export_preview(frames, fps, output_dir, args.preview_format or "gif", args)
 
     print(f"\n✅ All done! Output in: {os.path.abspath(output_dir)}/")
+    return 0
+
+
+def run_benchmarks(args) -> int:
+    """Run the benchmark suite; returns the process exit code."""
+    from oled_animator import benchmark
+
+    examples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples")
+    print(f"⏱️  Benchmarking ({args.bench_repeats} runs per case)...")
+    doc = benchmark.run(examples_dir, repeats=args.bench_repeats)
+    print()
+    print(benchmark.format_results(doc))
+
+    benchmark.save(doc, args.bench_out)
+    print(f"\n📊 Results saved: {args.bench_out}")
+
+    if args.bench_compare:
+        baseline = benchmark.load(args.bench_compare)
+        regressions = benchmark.compare(baseline, doc, threshold=args.bench_threshold / 100.0)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) over {args.bench_threshold:.0f}% vs {args.bench_compare}:\n")
+            print(benchmark.format_regressions(regressions))
+            return 1
+        print(f"\n✅ No regressions over {args.bench_threshold:.0f}% vs {args.bench_compare}")
+
+    return 0
 
 
 if __name__ == "__main__":
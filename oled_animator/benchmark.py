@@ -0,0 +1,255 @@
+"""
+Benchmark Suite — times every example scene and synthetic scaled scenes
+across rendering, dithering, packing and exporters, plus the image2cpp
+conversion pipelines side by side.
+
+Results are written as JSON; `compare()` flags regressions against a
+stored baseline.
+
+Usage:
+  python main.py --bench
+  python main.py --bench --bench-out output/benchmark.json
+  python main.py --bench --bench-compare baseline.json
+"""
+
+import glob
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+
+from PIL import Image
+
+from .canvas import FORMATS
+from .dither import apply_dithering
+from .dsl import parse_scene, DSLError
+from .engine import Animation
+from .image_converter import process_image
+from .exporters.delta import export_delta
+from .exporters.preview import save_preview, preview_path
+
+# Preview writers timed per scene (mp4 depends on ffmpeg, left out)
+PREVIEW_FORMATS = ("gif", "apng", "webp")
+
+DITHER_METHODS = ("floyd-steinberg", "atkinson", "stucki", "ordered", "blue-noise", "simple")
+
+# image2cpp pipelines compared by the convert:* cases
+PIPELINES = ("reference", "fast")
+CONVERT_METHODS = ("simple", "floyd-steinberg")
+
+# (name, width, height, elements, frames)
+SYNTHETIC_SCENES = (
+    ("synthetic_128x64_e10_f60", 128, 64, 10, 60),
+    ("synthetic_128x64_e60_f60", 128, 64, 60, 60),
+    ("synthetic_128x64_e10_f300", 128, 64, 10, 300),
+    ("synthetic_128x128_e30_f60", 128, 128, 30, 60),
+    ("synthetic_256x64_e30_f60", 256, 64, 30, 60),
+)
+
+
+def _best_of(fn, repeats: int) -> float:
+    """Best wall time of `repeats` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def synthetic_scene(width: int, height: int, n_elements: int, n_frames: int,
+                    seed: int = 0) -> Animation:
+    """A deterministic scene of moving rects, circles, lines and text.
+
+    Anti-aliasing is left to the example scenes: one AA element costs
+    more than the rest of a synthetic scene combined.
+    """
+    rng = random.Random(seed)
+    anim = Animation(width, height, 20, n_frames)
+    last = n_frames - 1
+
+    for i in range(n_elements):
+        elem_type = ("rect", "circle", "line", "text")[i % 4]
+        x0, x1 = rng.randrange(width), rng.randrange(width)
+        y0, y1 = rng.randrange(height), rng.randrange(height)
+        easing = rng.choice(("linear", "ease-in-out", "elastic-out", "bounce-out"))
+
+        if elem_type == "rect":
+            props = {"x": x0, "y": y0, "w": rng.randint(4, 20), "h": rng.randint(4, 20),
+                     "fill": rng.random() < 0.5}
+            keys = ("x", "y")
+        elif elem_type == "circle":
+            props = {"cx": x0, "cy": y0, "r": rng.randint(2, 10),
+                     "fill": rng.random() < 0.5}
+            keys = ("cx", "cy")
+        elif elem_type == "line":
+            props = {"x1": x0, "y1": y0, "x2": x1, "y2": y1}
+            keys = ("x1", "y1")
+        else:
+            props = {"x": x0, "y": y0, "text": f"T{i}", "font_size": 10}
+            keys = ("x", "y")
+
+        anim.add_element({
+            "type": elem_type,
+            "id": f"{elem_type}_{i}",
+            "props": props,
+            "keyframes": [
+                {"frame": 0, keys[0]: x0, keys[1]: y0, "easing": easing},
+                {"frame": last // 2, keys[0]: x1, keys[1]: y1, "easing": easing},
+                {"frame": last, keys[0]: x0, keys[1]: y0},
+            ],
+        })
+
+    return anim
+
+
+def _gradient(width: int, height: int) -> Image.Image:
+    """Horizontal gradient with a diagonal ramp — exercises every threshold."""
+    img = Image.linear_gradient("L").resize((width, height))
+    return Image.blend(img, img.rotate(90).resize((width, height)), 0.5)
+
+
+def _convert_sources() -> list:
+    """(label, encoded bytes) of typical asset-prep inputs: a large photo
+    and a transparent PNG icon."""
+    photo = _gradient(1600, 1200).convert("RGB")
+    icon = _gradient(512, 512).convert("RGBA")
+    icon.putalpha(_gradient(512, 512).rotate(180))
+    sources = []
+    for label, img, fmt in (("photo_1600x1200.jpg", photo, "JPEG"),
+                            ("icon_512x512.png", icon, "PNG")):
+        buf = io.BytesIO()
+        img.save(buf, format=fmt)
+        sources.append((label, buf.getvalue()))
+    return sources
+
+
+def bench_convert(repeats: int, log=print) -> dict:
+    """Time process_image on each source with every pipeline."""
+    results = {}
+    for label, data in _convert_sources():
+        for method in CONVERT_METHODS:
+            times = {}
+            for pipeline in PIPELINES:
+                settings = {"width": 128, "height": 64, "dither": method,
+                            "invert": True, "pipeline": pipeline}
+                times[pipeline] = _best_of(
+                    lambda: process_image(io.BytesIO(data), label, settings), repeats,
+                )
+                results[f"convert:{label}/{method}/{pipeline}"] = times[pipeline]
+            log(f"   ✓ convert:{label}/{method} "
+                f"(fast {times['reference'] / times['fast']:.1f}x)")
+    return results
+
+
+def bench_animation(name: str, anim: Animation, repeats: int, out_dir: str) -> dict:
+    results = {}
+    results[f"{name}/render_all"] = _best_of(anim.render_all, repeats)
+    results[f"{name}/render_damaged"] = _best_of(anim.render_damaged, repeats)
+
+    frames, damage = anim.render_damaged()
+    for fmt in FORMATS:
+        results[f"{name}/pack:{fmt}"] = _best_of(
+            lambda: [c.to_bytes(fmt) for c in frames], repeats,
+        )
+
+    delta_path = os.path.join(out_dir, "animation_delta.h")
+    results[f"{name}/export:delta"] = _best_of(
+        lambda: export_delta(frames, delta_path, anim.width, anim.height, anim.fps,
+                             damage=damage),
+        repeats,
+    )
+    for fmt in PREVIEW_FORMATS:
+        path = preview_path(out_dir, fmt)
+        results[f"{name}/export:{fmt}"] = _best_of(
+            lambda: save_preview(frames, path, anim.fps, fmt), repeats,
+        )
+    return results
+
+
+def run(examples_dir: str, repeats: int = 3, log=print) -> dict:
+    """Run the full suite and return the results document."""
+    results = {}
+    errors = {}
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        pattern = os.path.join(examples_dir, "**", "*.y*ml")
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            name = "scene:" + os.path.relpath(path, examples_dir).replace(os.sep, "/")
+            try:
+                anim = parse_scene(path)["animation"]
+                results.update(bench_animation(name, anim, repeats, out_dir))
+                log(f"   ✓ {name}")
+            except (DSLError, OSError) as e:
+                errors[name] = str(e)
+                log(f"   ✗ {name}: {e}")
+
+        for name, width, height, n_elements, n_frames in SYNTHETIC_SCENES:
+            anim = synthetic_scene(width, height, n_elements, n_frames)
+            results.update(bench_animation(name, anim, repeats, out_dir))
+            log(f"   ✓ {name}")
+
+    for width, height in ((128, 64), (128, 128), (256, 64)):
+        img = _gradient(width, height)
+        for method in DITHER_METHODS:
+            results[f"dither:{width}x{height}/{method}"] = _best_of(
+                lambda: apply_dithering(img, method), repeats,
+            )
+        log(f"   ✓ dither:{width}x{height}")
+
+    results.update(bench_convert(repeats, log))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeats": repeats,
+        },
+        "results": results,
+        "errors": errors,
+    }
+
+
+def save(doc: dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2,
+            min_delta: float = 0.001) -> list:
+    """Return [(case, old_s, new_s, ratio)] for every case that got slower
+    by more than `threshold` (fraction) and `min_delta` seconds."""
+    old_results = baseline.get("results", {})
+    regressions = []
+    for case, new in sorted(current.get("results", {}).items()):
+        old = old_results.get(case)
+        if old is None or old <= 0:
+            continue
+        if new > old * (1.0 + threshold) and new - old > min_delta:
+            regressions.append((case, old, new, new / old))
+    return regressions
+
+
+def format_results(doc: dict) -> str:
+    lines = [f"   {'Case':<56}{'ms':>10}"]
+    for case, seconds in sorted(doc["results"].items()):
+        lines.append(f"   {case:<56}{seconds * 1000:>10.2f}")
+    return "\n".join(lines)
+
+
+def format_regressions(regressions: list) -> str:
+    lines = [f"   {'Case':<56}{'old ms':>10}{'new ms':>10}{'ratio':>8}"]
+    for case, old, new, ratio in regressions:
+        lines.append(f"   {case:<56}{old * 1000:>10.2f}{new * 1000:>10.2f}{ratio:>7.2f}x")
+    return "\n".join(lines)
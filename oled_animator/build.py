@@ -0,0 +1,152 @@
+"""
+Batch Build — renders and exports many scenes in one process.
+
+Scenes are spread over a shared worker pool; every worker keeps its
+sprite and font caches across the scenes it renders. Scenes whose
+inputs (YAML, sprites, fonts) and outputs still match the output
+manifest are skipped.
+
+Usage:
+  python main.py --build "examples/**/*.yaml"
+  python main.py --build examples/ --jobs 4 --force
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import manifest as mf
+from .dsl import parse_scene, DSLError
+from .exporters.c_array import export_c_array
+from .exporters.delta import export_delta
+from .exporters.preview import save_preview, preview_path, PreviewError
+
+SCENE_EXTENSIONS = (".yaml", ".yml")
+
+
+def find_scenes(patterns: list) -> list:
+    """Expand directories and globs (with `**`) into sorted scene paths."""
+    found = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "**", "*")
+        for path in glob.glob(pattern, recursive=True):
+            if path.endswith(SCENE_EXTENSIONS) and os.path.isfile(path):
+                found.add(os.path.abspath(path))
+    return sorted(found)
+
+
+def build_scene(scene_path: str, scene_out_dir: str, options: dict) -> dict:
+    """Render and export one scene. Runs inside a pool worker.
+
+    Returns {"entry": manifest entry, "frames": n, "seconds": t}
+    or {"error": msg}.
+    """
+    try:
+        return _build_scene(scene_path, scene_out_dir, options)
+    except (DSLError, OSError, ValueError, PreviewError) as e:
+        return {"error": str(e)}
+    except Exception as e:  # one broken scene must not abort the whole build
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def _build_scene(scene_path: str, scene_out_dir: str, options: dict) -> dict:
+    t0 = time.perf_counter()
+    scene = parse_scene(scene_path)
+    anim = scene["animation"]
+    output_opts = scene["output"]
+
+    fmt = options["format"] or output_opts.get("format", "horizontal")
+    do_c_array = output_opts.get("c_array", True)
+    do_delta = options["delta"] or output_opts.get("delta_compression", False)
+    do_gif = options["gif"] and output_opts.get("gif", True)
+    preview_fmt = options["preview_format"] or output_opts.get("preview_format", "gif")
+
+    frames = anim.render_all()
+    os.makedirs(scene_out_dir, exist_ok=True)
+    outputs = []
+
+    if do_c_array:
+        path = os.path.join(scene_out_dir, "animation.h")
+        export_c_array(frames, path, anim.width, anim.height, anim.fps, fmt=fmt)
+        outputs.append(path)
+    if do_delta:
+        path = os.path.join(scene_out_dir, "animation_delta.h")
+        export_delta(frames, path, anim.width, anim.height, anim.fps, damage=anim.damage())
+        outputs.append(path)
+    if do_gif:
+        path = preview_path(scene_out_dir, preview_fmt)
+        save_preview(frames, path, anim.fps, preview_fmt, scale=options["scale"])
+        outputs.append(path)
+
+    inputs = [scene_path] + scene["dependencies"]
+    return {
+        "entry": mf.make_entry(inputs, outputs, mf.options_hash(options)),
+        "frames": anim.total_frames,
+        "seconds": time.perf_counter() - t0,
+    }
+
+
+def build(patterns: list, output_dir: str, jobs: int = None, force: bool = False,
+          fmt: str = None, delta: bool = False, gif: bool = True, scale: int = 4,
+          preview_format: str = None, log=print) -> dict:
+    """Build every scene matched by `patterns` into `output_dir`.
+
+    Each scene gets its own sub-directory mirroring its path relative to
+    the common root of all scenes. Returns counts of built/skipped/failed.
+    """
+    scenes = find_scenes(patterns)
+    summary = {"built": 0, "skipped": 0, "failed": 0, "scenes": len(scenes)}
+    if not scenes:
+        return summary
+
+    options = {"format": fmt, "delta": delta, "gif": gif, "scale": scale,
+               "preview_format": preview_format}
+    opts_hash = mf.options_hash(options)
+    output_dir = os.path.abspath(output_dir)
+    root = os.path.commonpath([os.path.dirname(p) for p in scenes])
+    manifest = mf.load_manifest(output_dir)
+    entries = manifest.setdefault("scenes", {})
+
+    todo = []
+    for path in scenes:
+        rel = os.path.relpath(path, root).replace(os.sep, "/")
+        reason = "forced" if force else mf.stale_reason(entries.get(rel), opts_hash)
+        if reason is None:
+            summary["skipped"] += 1
+            log(f"   ⏭️  {rel} (up to date)")
+            continue
+        scene_out_dir = os.path.join(output_dir, os.path.splitext(rel)[0])
+        todo.append((rel, path, scene_out_dir, reason))
+
+    def record(rel, reason, result):
+        if "error" in result:
+            summary["failed"] += 1
+            entries.pop(rel, None)
+            log(f"   ❌ {rel}: {result['error']}")
+            return
+        summary["built"] += 1
+        entries[rel] = result["entry"]
+        log(f"   ✅ {rel} ({reason}; {result['frames']} frames, {result['seconds']:.2f}s)")
+
+    # Saved even if the build is interrupted, so finished scenes stay recorded
+    try:
+        if jobs == 1 or len(todo) <= 1:
+            for rel, path, scene_out_dir, reason in todo:
+                record(rel, reason, build_scene(path, scene_out_dir, options))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [
+                    (rel, reason, pool.submit(build_scene, path, scene_out_dir, options))
+                    for rel, path, scene_out_dir, reason in todo
+                ]
+                for rel, reason, future in futures:
+                    try:
+                        result = future.result()
+                    except Exception as e:  # e.g. BrokenProcessPool after a worker crash
+                        result = {"error": f"{type(e).__name__}: {e}"}
+                    record(rel, reason, result)
+    finally:
+        mf.save_manifest(output_dir, manifest)
+    return summary
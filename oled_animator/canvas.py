@@ -7,10 +7,15 @@ Supports multiple byte-order export formats:
   - page: 8px page blocks (U8g2, U8x8)
 """
 
-from PIL import Image
+from PIL import Image, ImageDraw
+
+from .profiler import span
 
 FORMATS = ("horizontal", "vertical", "page")
 
+# Reverses the bit order of a byte (MSB-first <-> LSB-first)
+_REVERSE_BITS = bytes(int(f"{b:08b}"[::-1], 2) for b in range(256))
+
 
 class Canvas:
     """1-bit monochrome drawing surface."""
@@ -26,6 +31,17 @@ class Canvas:
     def get_image(self) -> Image.Image:
         return self.image.copy()
 
+    def copy(self) -> "Canvas":
+        other = Canvas.__new__(Canvas)
+        other.width = self.width
+        other.height = self.height
+        other.image = self.image.copy()
+        return other
+
+    def clear_rect(self, x0: int, y0: int, x1: int, y1: int):
+        """Clear an inclusive rectangle to 0."""
+        ImageDraw.Draw(self.image).rectangle((x0, y0, x1, y1), fill=0)
+
     def set_pixel(self, x: int, y: int, color: int = 1):
         if 0 <= x < self.width and 0 <= y < self.height:
             self.image.putpixel((x, y), color)
@@ -43,12 +59,16 @@ class Canvas:
             "vertical": self._to_vertical,
             "page": self._to_page,
         }
-        return converter[fmt]()
+        with span(f"pack:{fmt}"):
+            return converter[fmt]()
 
     def _to_horizontal(self) -> bytes:
         """Row-major: 1 byte = 8 horizontal pixels, MSB = leftmost.
         Used by Adafruit_GFX drawBitmap(), SSD1306.
         """
+        if self.width % 8 == 0:
+            # PIL packs mode "1" rows exactly this way
+            return self.image.tobytes()
         data = bytearray()
         pixels = self.image.load()
         for y in range(self.height):
@@ -65,6 +85,10 @@ class Canvas:
         """Column-major: 1 byte = 8 vertical pixels, LSB = top.
         Used by ST7565, SH1106.
         """
+        if self.height % 8 == 0:
+            # Each column becomes a packed row; flip to LSB = top
+            columns = self.image.transpose(Image.Transpose.TRANSPOSE).tobytes()
+            return columns.translate(_REVERSE_BITS)
         data = bytearray()
         pixels = self.image.load()
         for x in range(self.width):
@@ -81,9 +105,15 @@ class Canvas:
         """Page-based: 8px height pages, scanned left-to-right per page.
         Used by U8g2, U8x8.
         """
+        pages = self.height // 8
         data = bytearray()
+        if self.width % 8 == 0:
+            # A page is the vertical format of an 8px strip
+            for page in range(pages):
+                strip = self.image.crop((0, page * 8, self.width, page * 8 + 8))
+                data += strip.transpose(Image.Transpose.TRANSPOSE).tobytes()
+            return bytes(data.translate(_REVERSE_BITS))
         pixels = self.image.load()
-        pages = self.height // 8
         for page in range(pages):
             for x in range(self.width):
                 byte = 0
@@ -3,7 +3,20 @@ Dithering & threshold conversion for 1-bit displays.
 """
 
 from PIL import Image
-import numpy as np
+
+from .profiler import span
+
+_np = None
+
+
+def _numpy():
+    """Import NumPy on first use — only the dithering paths need it."""
+    global _np
+    if _np is None:
+        with span("import:numpy", category="import"):
+            import numpy
+        _np = numpy
+    return _np
 
 
 def apply_threshold(image: Image.Image, threshold: int = 128) -> Image.Image:
@@ -20,11 +33,40 @@ def apply_dithering(image: Image.Image, method: str = "floyd-steinberg") -> Imag
       - "atkinson": High-contrast error diffusion (HyperCard style).
       - "stucki": Clean, sharp error diffusion.
       - "ordered": Bayer 4x4 ordered dithering.
+      - "blue-noise": Fixed noise threshold (no pattern, no shimmer).
       - "simple": Simple threshold (no dithering).
     """
+    with span("dither"):
+        return _apply_dithering(image, method)
+
+
+DIFFUSION_KERNELS = {
+    "floyd-steinberg": [
+        (1, 0, 7/16),
+        (-1, 1, 3/16), (0, 1, 5/16), (1, 1, 1/16)
+    ],
+    "atkinson": [
+        (1, 0, 1/8), (2, 0, 1/8),
+        (-1, 1, 1/8), (0, 1, 1/8), (1, 1, 1/8),
+        (0, 2, 1/8)
+    ],
+    "stucki": [
+        (1, 0, 8/42), (2, 0, 4/42),
+        (-2, 1, 2/42), (-1, 1, 4/42), (0, 1, 8/42), (1, 1, 4/42), (2, 1, 2/42),
+        (-2, 2, 1/42), (-1, 2, 2/42), (0, 2, 4/42), (1, 2, 2/42), (2, 2, 1/42)
+    ],
+}
+
+# Source pixels within this many grey levels of the value they were last
+# dithered from keep their previous output in SequenceDitherer
+SEQUENCE_CHANGE_THRESHOLD = 8
+
+
+def _apply_dithering(image: Image.Image, method: str) -> Image.Image:
     if method == "simple":
         return apply_threshold(image)
 
+    np = _numpy()
     gray = image.convert("L")
     pixels = np.array(gray, dtype=np.float64)
     h, w = pixels.shape
@@ -43,39 +85,109 @@ def apply_dithering(image: Image.Image, method: str = "floyd-steinberg") -> Imag
                 threshold = bayer[y % 4, x % 4]
                 pixels[y, x] = 255.0 if pixels[y, x] > threshold else 0.0
 
-    elif method in ["floyd-steinberg", "atkinson", "stucki"]:
-        # Error diffusion loop
-        for y in range(h):
-            for x in range(w):
-                old_val = pixels[y, x]
-                new_val = 255.0 if old_val >= 128.0 else 0.0
-                pixels[y, x] = new_val
-                error = old_val - new_val
-
-                if method == "floyd-steinberg":
-                    propagate_error(pixels, x, y, w, h, error, [
-                        (1, 0, 7/16),
-                        (-1, 1, 3/16), (0, 1, 5/16), (1, 1, 1/16)
-                    ])
-
-                elif method == "atkinson":
-                    propagate_error(pixels, x, y, w, h, error, [
-                        (1, 0, 1/8), (2, 0, 1/8),
-                        (-1, 1, 1/8), (0, 1, 1/8), (1, 1, 1/8),
-                        (0, 2, 1/8)
-                    ])
-
-                elif method == "stucki":
-                    propagate_error(pixels, x, y, w, h, error, [
-                        (1, 0, 8/42), (2, 0, 4/42),
-                        (-2, 1, 2/42), (-1, 1, 4/42), (0, 1, 8/42), (1, 1, 4/42), (2, 1, 2/42),
-                        (-2, 2, 1/42), (-1, 2, 2/42), (0, 2, 4/42), (1, 2, 2/42), (2, 2, 1/42)
-                    ])
+    elif method == "blue-noise":
+        pixels = np.where(pixels > _noise_thresholds(w, h), 255.0, 0.0)
+
+    elif method in DIFFUSION_KERNELS:
+        _diffuse(pixels, DIFFUSION_KERNELS[method])
 
     result = np.clip(pixels, 0, 255).astype(np.uint8)
     return Image.fromarray(result, mode="L").convert("1")
 
 
+def _noise_thresholds(w: int, h: int):
+    """Per-pixel thresholds from interleaved gradient noise — a cheap,
+    deterministic stand-in for a blue-noise texture (no visible tiling,
+    mostly high-frequency), so the same pixel always gets the same
+    threshold."""
+    np = _numpy()
+    y, x = np.mgrid[0:h, 0:w].astype(np.float64)
+    noise = np.modf(52.9829189 * np.modf(0.06711056 * x + 0.00583715 * y)[0])[0]
+    return noise * 255.0
+
+
+def _diffuse(pixels, distribution, fixed=None):
+    """Error-diffuse `pixels` (float array, modified in place). Where the
+    `fixed` mask is set the pixel's current value is kept as its output
+    (already 0 or 255) and only the error against the diffused value
+    propagates."""
+    h, w = pixels.shape
+    for y in range(h):
+        for x in range(w):
+            old_val = pixels[y, x]
+            if fixed is not None and fixed[y, x] >= 0:
+                new_val = fixed[y, x]
+            else:
+                new_val = 255.0 if old_val >= 128.0 else 0.0
+            pixels[y, x] = new_val
+            error = old_val - new_val
+            propagate_error(pixels, x, y, w, h, error, distribution)
+
+
+class SequenceDitherer:
+    """Dithers the frames of a sequence so that static areas stay static.
+
+    Pixels whose source value moved by at most `change_threshold` grey
+    levels since they were last dithered keep their previous output;
+    error diffusion treats them as fixed and diffuses the remaining error
+    around them, and threshold methods ("simple", "ordered",
+    "blue-noise") re-threshold only the changed pixels. Independent
+    per-frame dithering makes diffusion patterns shimmer, which flips
+    pixels all over the frame and defeats delta compression.
+    """
+
+    def __init__(self, method: str = "floyd-steinberg", threshold: int = 128,
+                 change_threshold: int = SEQUENCE_CHANGE_THRESHOLD):
+        self.method = method
+        self.threshold = threshold  # for "simple"
+        self.change_threshold = change_threshold
+        self.reference = None  # source values the current output came from
+        self.output = None     # previous output (0.0 / 255.0)
+        self.pixels = 0        # totals over the sequence
+        self.reused = 0
+
+    @property
+    def reused_pct(self) -> float:
+        """Share of pixels that kept their previous output so far."""
+        return 100.0 * self.reused / self.pixels if self.pixels else 0.0
+
+    def dither(self, image: Image.Image) -> Image.Image:
+        """Dither the next frame; returns a mode "1" image."""
+        with span("dither"):
+            return self._dither(image)
+
+    def _dither(self, image: Image.Image) -> Image.Image:
+        np = _numpy()
+        gray = np.array(image.convert("L"), dtype=np.float64)
+
+        if self.reference is None or self.reference.shape != gray.shape:
+            keep = np.zeros(gray.shape, dtype=bool)
+        else:
+            keep = np.abs(gray - self.reference) <= self.change_threshold
+
+        if self.method in DIFFUSION_KERNELS:
+            fixed = None
+            if keep.any():
+                fixed = np.where(keep, self.output, -1.0)
+            pixels = gray.copy()
+            _diffuse(pixels, DIFFUSION_KERNELS[self.method], fixed)
+            output = pixels
+        else:
+            if self.method == "simple":
+                output = np.where(gray >= self.threshold, 255.0, 0.0)
+            else:
+                dithered = _apply_dithering(Image.fromarray(gray.astype(np.uint8)), self.method)
+                output = np.array(dithered.convert("L"), dtype=np.float64)
+            if keep.any():
+                output = np.where(keep, self.output, output)
+
+        self.reference = np.where(keep, self.reference, gray) if keep.any() else gray
+        self.output = output
+        self.pixels += keep.size
+        self.reused += int(keep.sum())
+        return Image.fromarray(output.astype(np.uint8), mode="L").convert("1")
+
+
 def propagate_error(pixels, x, y, w, h, error, distribution):
     """Helper to distribute error to neighboring pixels."""
     for dx, dy, factor in distribution:
@@ -2,13 +2,28 @@
 DSL Parser — reads YAML scene definitions and builds Animation objects.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+
 import yaml
 import os
 from .engine import Animation
+from .profiler import span
+
+try:  # libyaml is several times faster when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 REQUIRED_SCREEN_FIELDS = {"width", "height", "fps", "frames"}
-VALID_ELEMENT_TYPES = {"rect", "circle", "line", "text", "sprite"}
+VALID_ELEMENT_TYPES = {"rect", "circle", "line", "text", "sprite", "spritesheet"}
+
+# LRU of parsed scenes keyed by hash of (base_dir, YAML text)
+SCENE_CACHE_SIZE = 32
+_scene_cache = OrderedDict()
+_scene_cache_lock = threading.Lock()
 
 
 class DSLError(Exception):
@@ -23,16 +38,64 @@ def parse_scene(yaml_path: str) -> dict:
         {
             "animation": Animation instance (ready to render),
             "output": dict with export options,
-            "base_dir": directory of the YAML file (for relative paths)
+            "base_dir": directory of the YAML file (for relative paths),
+            "dependencies": external files the scene resolves
+                            (sprite and spritesheet `src`, text `font_path`),
+                            absolute paths
         }
     """
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        scene = yaml.safe_load(f)
+    with span("parse:yaml"):
+        with open(yaml_path, "r", encoding="utf-8") as f:
+            try:
+                scene = yaml.load(f, Loader=SafeLoader)
+            except yaml.YAMLError as e:
+                raise DSLError(f"Invalid YAML: {e}") from e
+
+    return parse_scene_dict(scene, os.path.dirname(os.path.abspath(yaml_path)))
 
-    base_dir = os.path.dirname(os.path.abspath(yaml_path))
 
-    screen = _validate_screen(scene)
-    elements = _validate_elements(scene, base_dir)
+def parse_scene_string(text: str, base_dir: str = ".", cache: bool = True) -> dict:
+    """Parse YAML scene text in memory; relative paths resolve against
+    `base_dir`. Returns the same dict as parse_scene().
+
+    Results are cached by text hash: repeated calls with the same text
+    skip parsing and return the same (shared, read-only) Animation.
+    """
+    base_dir = os.path.abspath(base_dir)
+    key = hashlib.sha1(f"{base_dir}\0{text}".encode("utf-8")).hexdigest()
+
+    if cache:
+        with _scene_cache_lock:
+            result = _scene_cache.get(key)
+            if result is not None:
+                _scene_cache.move_to_end(key)
+                return result
+
+    with span("parse:yaml"):
+        try:
+            scene = yaml.load(text, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            raise DSLError(f"Invalid YAML: {e}") from e
+
+    result = parse_scene_dict(scene, base_dir)
+
+    if cache:
+        with _scene_cache_lock:
+            _scene_cache[key] = result
+            while len(_scene_cache) > SCENE_CACHE_SIZE:
+                _scene_cache.popitem(last=False)
+    return result
+
+
+def parse_scene_dict(scene: dict, base_dir: str = ".") -> dict:
+    """Validate an already-loaded scene mapping and build its Animation."""
+    if not isinstance(scene, dict):
+        raise DSLError("Scene must be a YAML mapping.")
+    base_dir = os.path.abspath(base_dir)
+
+    with span("parse:validate"):
+        screen = _validate_screen(scene)
+        elements = _validate_elements(scene, base_dir)
     output = scene.get("output", {})
 
     anim = Animation(
@@ -49,9 +112,26 @@ def parse_scene(yaml_path: str) -> dict:
         "animation": anim,
         "output": output,
         "base_dir": base_dir,
+        "dependencies": collect_dependencies(elements),
     }
 
 
+def collect_dependencies(elements: list) -> list:
+    """Every external file the elements reference, in first-use order."""
+    deps = []
+    for elem in elements:
+        props = elem.get("props", {})
+        if elem["type"] in ("sprite", "spritesheet"):
+            path = props.get("src")
+        elif elem["type"] == "text":
+            path = props.get("font_path")
+        else:
+            path = None
+        if path and path not in deps:
+            deps.append(path)
+    return deps
+
+
 def _validate_screen(scene: dict) -> dict:
     screen = scene.get("screen")
     if not screen:
@@ -85,8 +165,10 @@ def _validate_elements(scene: dict, base_dir: str) -> list:
             )
 
         props = dict(elem.get("props", {}))
+        keyframes = elem.get("keyframes", [])
+        _validate_keyframes(i, keyframes)
 
-        if elem_type == "sprite" and "src" in props:
+        if elem_type in ("sprite", "spritesheet") and "src" in props:
             src = props["src"]
             if not os.path.isabs(src):
                 props["src"] = os.path.join(base_dir, src)
@@ -100,7 +182,20 @@ def _validate_elements(scene: dict, base_dir: str) -> list:
             "type": elem_type,
             "id": elem.get("id", f"element_{i}"),
             "props": props,
-            "keyframes": elem.get("keyframes", []),
+            "keyframes": keyframes,
         })
 
     return validated
+
+
+def _validate_keyframes(index: int, keyframes: list):
+    if not isinstance(keyframes, list):
+        raise DSLError(f"Element #{index} 'keyframes' must be a list.")
+    for j, kf in enumerate(keyframes):
+        if not isinstance(kf, dict) or "frame" not in kf:
+            raise DSLError(f"Element #{index} keyframe #{j} missing 'frame' field.")
+        frame = kf["frame"]
+        if isinstance(frame, bool) or not isinstance(frame, (int, float)):
+            raise DSLError(
+                f"Element #{index} keyframe #{j} has non-numeric frame {frame!r}."
+            )
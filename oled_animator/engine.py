@@ -2,9 +2,18 @@
 Animation Engine — timeline, keyframes, easing interpolation, frame rendering.
 """
 
+from bisect import bisect_left
+from functools import partial
+from time import perf_counter
+
 from .canvas import Canvas
-from .primitives import draw_rect, draw_circle, draw_line, draw_text, draw_sprite
+from .primitives import (
+    draw_rect, draw_circle, draw_line, draw_text, draw_sprite,
+    draw_spritesheet,
+    BBOX_DISPATCH, clip_bbox,
+)
 from .easing import get_easing
+from . import profiler
 
 
 DRAW_DISPATCH = {
@@ -13,9 +22,100 @@ DRAW_DISPATCH = {
     "line": draw_line,
     "text": draw_text,
     "sprite": draw_sprite,
+    "spritesheet": draw_spritesheet,
+}
+
+ANIMATABLE_PROPS = {
+    "x", "y", "cx", "cy", "r", "w", "h", "x1", "y1", "x2", "y2", "font_size", "cell",
 }
 
-ANIMATABLE_PROPS = {"x", "y", "cx", "cy", "r", "w", "h", "x1", "y1", "x2", "y2", "font_size"}
+# Draw-function arguments per element type: (name, default, converter)
+ARG_SPECS = {
+    "rect": (
+        ("x", 0, int), ("y", 0, int), ("w", 10, int), ("h", 10, int),
+        ("fill", True, None), ("anti_alias", False, None),
+    ),
+    "circle": (
+        ("cx", 0, int), ("cy", 0, int), ("r", 5, int),
+        ("fill", True, None), ("anti_alias", False, None),
+    ),
+    "line": (
+        ("x1", 0, int), ("y1", 0, int), ("x2", 0, int), ("y2", 0, int),
+        ("anti_alias", False, None),
+    ),
+    "text": (
+        ("x", 0, int), ("y", 0, int), ("text", "", str),
+        ("font_size", 10, int), ("font_path", None, None),
+    ),
+    "sprite": (
+        ("x", 0, int), ("y", 0, int), ("src", "", str),
+        ("dithering", False, None),
+    ),
+    "spritesheet": (
+        ("x", 0, int), ("y", 0, int), ("src", "", str), ("cell", 0, int),
+        ("cell_w", 0, int), ("cell_h", 0, int), ("dithering", False, None),
+    ),
+}
+
+
+class Track:
+    """Keyframes of one property, sorted by frame, ready to sample."""
+
+    __slots__ = ("frames", "values", "easings")
+
+    def __init__(self, keyframes: list, prop_name: str):
+        self.frames = [k["frame"] for k in keyframes]
+        self.values = [k[prop_name] for k in keyframes]
+        self.easings = [get_easing(k.get("easing", "linear")) for k in keyframes]
+
+    def value_at(self, frame: int):
+        frames = self.frames
+        if frame <= frames[0]:
+            return self.values[0]
+        if frame >= frames[-1]:
+            return self.values[-1]
+
+        # First segment i with frames[i] <= frame <= frames[i + 1]
+        i = bisect_left(frames, frame) - 1
+        span = frames[i + 1] - frames[i]
+        t = 1.0 if span == 0 else (frame - frames[i]) / span
+        val_start = self.values[i]
+        return val_start + (self.values[i + 1] - val_start) * self.easings[i](t)
+
+
+class DrawOp:
+    """An element compiled once into a draw call.
+
+    `draw` and `bbox` are bound to the static args; only the animated
+    args (`tracks`) are sampled per frame.
+    """
+
+    __slots__ = ("id", "type", "draw", "bbox", "tracks")
+
+    def __init__(self, element: dict):
+        elem_type = element["type"]
+        props = element.get("props", {})
+        keyframes = sorted(element.get("keyframes", []), key=lambda k: k["frame"])
+
+        static = {}
+        tracks = []
+        for name, default, conv in ARG_SPECS[elem_type]:
+            kf_with_prop = [k for k in keyframes if name in k] if name in ANIMATABLE_PROPS else []
+            if kf_with_prop:
+                tracks.append((name, Track(kf_with_prop, name)))
+            else:
+                value = props.get(name, default)
+                static[name] = conv(value) if conv else value
+
+        self.id = element.get("id")
+        self.type = elem_type
+        self.draw = partial(DRAW_DISPATCH[elem_type], **static)
+        self.bbox = partial(BBOX_DISPATCH[elem_type], **static)
+        self.tracks = tuple(tracks)
+
+    def args_at(self, frame: int) -> dict:
+        """Animated draw args at a frame (all animatable props are ints)."""
+        return {name: int(track.value_at(frame)) for name, track in self.tracks}
 
 
 class Animation:
@@ -43,111 +143,151 @@ class Animation:
         """
         self.elements.append(element)
 
-    def _interpolate(self, element: dict, frame: int) -> dict:
-        """Resolve all properties for an element at a given frame."""
-        props = dict(element.get("props", {}))
-        keyframes = element.get("keyframes", [])
+    def compile(self) -> list:
+        """Compile every element into a DrawOp, in drawing order."""
+        return [DrawOp(elem) for elem in self.elements]
+
+    def render_frame(self, frame_index: int, ops: list = None) -> Canvas:
+        """Render a single frame, returning a Canvas.
+
+        Pass `ops` from compile() when rendering many frames.
+        """
+        if ops is None:
+            ops = self.compile()
+        canvas = Canvas(self.width, self.height)
+
+        prof = profiler.active()
+        if prof is not None:
+            t0 = perf_counter()
+            args = [op.args_at(frame_index) for op in ops]
+            prof.add("interpolate", t0, perf_counter())
+            for op, a in zip(ops, args):
+                _draw_profiled(prof, op, canvas, a)
+            return canvas
 
-        if not keyframes:
-            return props
+        for op in ops:
+            op.draw(canvas, **op.args_at(frame_index))
 
-        sorted_kf = sorted(keyframes, key=lambda k: k["frame"])
+        return canvas
 
-        for prop_name in ANIMATABLE_PROPS:
-            kf_with_prop = [k for k in sorted_kf if prop_name in k]
-            if not kf_with_prop:
-                continue
+    def render_all(self) -> list:
+        """Render all frames, returning list of Canvas."""
+        ops = self.compile()
+        return [self.render_frame(i, ops) for i in range(self.total_frames)]
 
-            if frame <= kf_with_prop[0]["frame"]:
-                props[prop_name] = kf_with_prop[0][prop_name]
-                continue
+    def render_range(self, start: int = 0, stop: int = None, step: int = 1) -> list:
+        """Render frames `range(start, stop, step)` (clamped to the
+        timeline), returning list of Canvas.
 
-            if frame >= kf_with_prop[-1]["frame"]:
-                props[prop_name] = kf_with_prop[-1][prop_name]
-                continue
+        Lets previews draw the frame under the scrub head without
+        rendering the whole timeline.
+        """
+        ops = self.compile()
+        return [self.render_frame(i, ops) for i in self.frame_range(start, stop, step)]
 
-            for i in range(len(kf_with_prop) - 1):
-                kf_start = kf_with_prop[i]
-                kf_end = kf_with_prop[i + 1]
+    def frame_range(self, start: int = 0, stop: int = None, step: int = 1) -> range:
+        """`range(start, stop, step)` clamped to [0, total_frames)."""
+        if step < 1:
+            raise ValueError("step must be >= 1")
+        total = self.total_frames
+        stop = total if stop is None else min(max(stop, 0), total)
+        return range(min(max(start, 0), total), stop, step)
 
-                if kf_start["frame"] <= frame <= kf_end["frame"]:
-                    span = kf_end["frame"] - kf_start["frame"]
-                    if span == 0:
-                        t = 1.0
-                    else:
-                        t = (frame - kf_start["frame"]) / span
+    def render_damaged(self) -> tuple:
+        """Render all frames with damage tracking.
 
-                    easing_name = kf_start.get("easing", "linear")
-                    easing_fn = get_easing(easing_name)
-                    eased_t = easing_fn(t)
+        Each frame starts from the previous one; only the union of the old
+        and new bounding boxes of elements whose props changed is cleared,
+        and only elements intersecting those regions are redrawn.
 
-                    val_start = kf_start[prop_name]
-                    val_end = kf_end[prop_name]
-                    props[prop_name] = val_start + (val_end - val_start) * eased_t
-                    break
+        Returns (frames, damage), damage as from damage().
+        """
+        ops = self.compile()
+        frames = []
+        prof = profiler.active()
+        draw = _draw if prof is None else partial(_draw_profiled, prof)
 
-        return props
+        damage = []
+        for args, boxes, rects in self._damage(ops, prof):
+            damage.append(rects)
+            if rects is None:
+                canvas = Canvas(self.width, self.height)
+                for op, a, box in zip(ops, args, boxes):
+                    if box is not None:
+                        draw(op, canvas, a)
+            elif rects:
+                canvas = frames[-1].copy()
+                for r in rects:
+                    canvas.clear_rect(*r)
+                for op, a, box in zip(ops, args, boxes):
+                    if box is not None and any(_intersects(box, r) for r in rects):
+                        draw(op, canvas, a)
+            else:
+                canvas = frames[-1]
+            frames.append(canvas)
 
-    def render_frame(self, frame_index: int) -> Canvas:
-        """Render a single frame, returning a Canvas."""
-        canvas = Canvas(self.width, self.height)
+        return frames, damage
 
-        for elem in self.elements:
-            props = self._interpolate(elem, frame_index)
-            elem_type = elem["type"]
-
-            if elem_type == "rect":
-                draw_rect(
-                    canvas,
-                    x=int(props.get("x", 0)),
-                    y=int(props.get("y", 0)),
-                    w=int(props.get("w", 10)),
-                    h=int(props.get("h", 10)),
-                    fill=props.get("fill", True),
-                    anti_alias=props.get("anti_alias", False),
-                )
-
-            elif elem_type == "circle":
-                draw_circle(
-                    canvas,
-                    cx=int(props.get("cx", 0)),
-                    cy=int(props.get("cy", 0)),
-                    r=int(props.get("r", 5)),
-                    fill=props.get("fill", True),
-                    anti_alias=props.get("anti_alias", False),
-                )
-
-            elif elem_type == "line":
-                draw_line(
-                    canvas,
-                    x1=int(props.get("x1", 0)),
-                    y1=int(props.get("y1", 0)),
-                    x2=int(props.get("x2", 0)),
-                    y2=int(props.get("y2", 0)),
-                    anti_alias=props.get("anti_alias", False),
-                )
-
-            elif elem_type == "text":
-                draw_text(
-                    canvas,
-                    x=int(props.get("x", 0)),
-                    y=int(props.get("y", 0)),
-                    text=str(props.get("text", "")),
-                    font_size=int(props.get("font_size", 10)),
-                    font_path=props.get("font_path"),
-                )
-
-            elif elem_type == "sprite":
-                draw_sprite(
-                    canvas,
-                    x=int(props.get("x", 0)),
-                    y=int(props.get("y", 0)),
-                    src=str(props.get("src", "")),
-                    dithering=props.get("dithering", False),
-                )
+    def damage(self) -> list:
+        """Per-frame damage without rendering.
 
-        return canvas
+        damage[i] is the list of inclusive (x0, y0, x1, y1) rects that can
+        differ between frames i - 1 and i, or None for frame 0. An empty
+        list means the frame is unchanged.
+        """
+        return [rects for _, _, rects in self._damage(self.compile(), profiler.active())]
 
-    def render_all(self) -> list:
-        """Render all frames, returning list of Canvas."""
-        return [self.render_frame(i) for i in range(self.total_frames)]
+    def _damage(self, ops: list, prof):
+        """Yield (args, boxes, rects) per frame; rects as in damage()."""
+        prev_args = prev_boxes = None
+        for i in range(self.total_frames):
+            t0 = perf_counter()
+            args = [op.args_at(i) for op in ops]
+            boxes = [
+                clip_bbox(op.bbox(**a), self.width, self.height)
+                for op, a in zip(ops, args)
+            ]
+            if prof is not None:
+                prof.add("interpolate", t0, perf_counter())
+
+            if prev_args is None:
+                rects = None
+            else:
+                rects = []
+                for j, a in enumerate(args):
+                    if a != prev_args[j]:
+                        rects.extend(b for b in (prev_boxes[j], boxes[j]) if b)
+                rects = _merge_rects(rects)
+
+            yield args, boxes, rects
+            prev_args, prev_boxes = args, boxes
+
+
+def _draw(op: DrawOp, canvas: Canvas, args: dict):
+    op.draw(canvas, **args)
+
+
+def _draw_profiled(prof, op: DrawOp, canvas: Canvas, args: dict):
+    t0 = perf_counter()
+    op.draw(canvas, **args)
+    prof.add_element(op.id, op.type, t0, perf_counter())
+
+
+def _intersects(a: tuple, b: tuple) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _merge_rects(rects: list) -> list:
+    """Merge overlapping rects until none overlap."""
+    merged = []
+    for r in rects:
+        while True:
+            for k, m in enumerate(merged):
+                if _intersects(r, m):
+                    r = (min(r[0], m[0]), min(r[1], m[1]), max(r[2], m[2]), max(r[3], m[3]))
+                    del merged[k]
+                    break
+            else:
+                break
+        merged.append(r)
+    return merged
@@ -1,5 +1,12 @@
 """
 ASCII Preview — renders frames in the terminal.
+
+Pixels are packed into character cells: "half" draws two pixel rows per
+cell with ▀▄█ half-blocks, "braille" 2x4 pixels per cell, "block" one
+pixel per cell. Playback clears the screen once, then moves the cursor
+to the lines that changed and rewrites only those, sends each frame in
+one write and sleeps against a fixed schedule, so it keeps the scene
+FPS over SSH without flicker.
 """
 
 import os
@@ -7,45 +14,144 @@ import sys
 import time
 from ..canvas import Canvas
 
+# mode: (bit weight of each pixel in a cell, row by row; glyph per cell value)
+CELL_MODES = {
+    "block": (((1,),), " █"),
+    "half": (((2,), (1,)), " ▄▀█"),
+    "braille": (
+        ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80)),
+        " " + "".join(chr(0x2800 + i) for i in range(1, 256)),
+    ),
+}
+
+# Frame bytes in mode "L" are 0 or 255: translate to a pixel's bit weight
+_WEIGHTS = {
+    weight: bytes(weight if i else 0 for i in range(256))
+    for weights, _ in CELL_MODES.values() for row in weights for weight in row
+}
+_GLYPHS = {mode: dict(enumerate(glyphs)) for mode, (_, glyphs) in CELL_MODES.items()}
+
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+
+def frame_lines(canvas: Canvas, mode: str = "half") -> list:
+    """One string per row of character cells."""
+    weights, _ = CELL_MODES[mode]
+    cell_w, cell_h = len(weights[0]), len(weights)
+    w, h = canvas.width, canvas.height
+    cols = -(-w // cell_w)
+    data = canvas.image.convert("L").tobytes()
+    glyphs = _GLYPHS[mode]
+
+    lines = []
+    for cy in range(0, h, cell_h):
+        # OR the weighted pixels of every cell position into one big int,
+        # so each cell's value is a byte of it
+        cells = 0
+        for y, row_weights in zip(range(cy, min(cy + cell_h, h)), weights):
+            row = data[y * w:(y + 1) * w]
+            for dx, weight in enumerate(row_weights):
+                part = row[dx::cell_w].translate(_WEIGHTS[weight]).ljust(cols, b"\0")
+                cells |= int.from_bytes(part, "big")
+        lines.append(cells.to_bytes(cols, "big").decode("latin-1").translate(glyphs))
+    return lines
+
+
+def _framed(lines: list, border: bool) -> list:
+    if not border:
+        return lines
+    width = len(lines[0]) if lines else 0
+    return ["┌" + "─" * width + "┐"] + [f"│{line}│" for line in lines] + ["└" + "─" * width + "┘"]
+
 
 def print_frame(canvas: Canvas, chars: tuple = ("█", " "), border: bool = True):
     """Print a single frame to stdout using block characters."""
-    pixels = canvas.image.load()
     on, off = chars
+    data = canvas.image.convert("L").tobytes().decode("latin-1")
+    table = {255: on, 0: off}
+    w = canvas.width
+    lines = [data[y * w:(y + 1) * w].translate(table) for y in range(canvas.height)]
+    sys.stdout.write("\n".join(_framed(lines, border)) + "\n")
 
-    if border:
-        print("┌" + "─" * canvas.width + "┐")
 
-    for y in range(canvas.height):
-        row = ""
-        for x in range(canvas.width):
-            row += on if pixels[x, y] else off
-        if border:
-            print(f"│{row}│")
-        else:
-            print(row)
+def play(frames: list, fps: int, loops: int = 1, mode: str = "half",
+         border: bool = True, out=None) -> dict:
+    """Play frames in place on an ANSI terminal.
 
-    if border:
-        print("└" + "─" * canvas.width + "┘")
+    Returns:
+        Dict with keys: frames (shown), seconds, fps (achieved),
+        bytes (written to the terminal)
+    """
+    out = out or sys.stdout
+    delay = 1.0 / fps if fps > 0 else 0.1
+    if os.name == "nt":
+        os.system("")  # turns on ANSI escape handling in the Windows console
 
+    previous = []
+    shown = written = 0
+    start = deadline = time.perf_counter()
+    out.write(HIDE_CURSOR + CLEAR_SCREEN)
+    try:
+        for loop in range(loops):
+            for i, canvas in enumerate(frames):
+                lines = [f"  Frame {i + 1}/{len(frames)}  |  FPS: {fps}  |  Loop: {loop + 1}/{loops}"]
+                lines += _framed(frame_lines(canvas, mode), border)
+                buf = "".join(
+                    f"\x1b[{row + 1};1H{line}{CLEAR_LINE_END}"
+                    for row, line in enumerate(lines)
+                    if row >= len(previous) or previous[row] != line
+                )
+                out.write(buf)
+                out.flush()
+                previous = lines
+                shown += 1
+                written += len(buf.encode("utf-8"))
 
-def print_animation(frames: list, fps: int, loops: int = 1, compact: bool = True):
-    """Animate frames in terminal with clear between each.
+                # Sleep until this frame's slot ends; when rendering fell
+                # more than a frame behind, restart the schedule instead of
+                # rushing through the backlog
+                deadline += delay
+                remaining = deadline - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+                elif remaining < -delay:
+                    deadline = time.perf_counter()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        out.write(f"\x1b[{len(previous) + 1};1H{SHOW_CURSOR}")
+        out.flush()
+
+    seconds = time.perf_counter() - start
+    return {
+        "frames": shown,
+        "seconds": seconds,
+        "fps": shown / seconds if seconds > 0 else 0.0,
+        "bytes": written,
+    }
 
-    For large displays (>64px wide), use half-block chars for compact view.
-    """
-    delay = 1.0 / fps if fps > 0 else 0.1
 
-    if compact and frames and frames[0].width > 40:
-        chars = ("▓", " ")
-    else:
-        chars = ("█", " ")
+def print_animation(frames: list, fps: int, loops: int = 1, compact: bool = True,
+                    mode: str = None):
+    """Animate frames in the terminal.
+
+    `mode` is "half", "braille" or "block"; by default displays wider
+    than 40px use half-blocks. When stdout is not a terminal only the
+    first frame is printed.
+    """
+    if not frames:
+        return
+    if mode is None:
+        mode = "half" if compact and frames[0].width > 40 else "block"
 
-    for loop in range(loops):
-        for i, canvas in enumerate(frames):
-            os.system("clear" if os.name != "nt" else "cls")
-            print(f"  Frame {i + 1}/{len(frames)}  |  FPS: {fps}  |  Loop: {loop + 1}/{loops}")
-            print_frame(canvas, chars=chars)
-            time.sleep(delay)
+    if not sys.stdout.isatty():
+        sys.stdout.write("\n".join(_framed(frame_lines(frames[0], mode), True)) + "\n")
+        print(f"\n✓ Not a terminal: showed frame 1 of {len(frames)}.")
+        return
 
-    print(f"\n✓ Animation complete: {len(frames)} frames played.")
+    stats = play(frames, fps, loops, mode)
+    print(f"\n✓ Animation complete: {stats['frames']} frames played "
+          f"({stats['fps']:.1f} FPS, {stats['bytes'] / max(stats['frames'], 1) / 1024:.1f} KB/frame)")
@@ -6,7 +6,6 @@ Reports total memory usage in the header comment.
 """
 
 import os
-from ..canvas import Canvas
 
 
 def export_c_array(
@@ -29,7 +28,41 @@ def export_c_array(
         fmt: byte format ("horizontal", "vertical", "page")
         var_prefix: prefix for frame variable names
     """
-    frame_count = len(frames)
+    text = format_c_array(
+        [canvas.to_bytes(fmt) for canvas in frames], width, height, fps,
+        fmt=fmt, var_prefix=var_prefix,
+    )
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+    frame_size = (width * height) // 8
+    total_bytes = len(frames) * frame_size
+    return {
+        "path": output_path,
+        "frame_count": len(frames),
+        "frame_size": frame_size,
+        "total_bytes": total_bytes,
+        "total_kb": total_bytes / 1024.0,
+    }
+
+
+def format_c_array(
+    packed_frames: list,
+    width: int,
+    height: int,
+    fps: int,
+    fmt: str = "horizontal",
+    var_prefix: str = "frame",
+    labels: list = None,
+) -> str:
+    """C header text for frames already packed in `fmt`.
+
+    `labels` (e.g. source file names) are written as a comment above
+    each frame's array.
+    """
+    frame_count = len(packed_frames)
     frame_size = (width * height) // 8
     total_bytes = frame_count * frame_size
     total_kb = total_bytes / 1024.0
@@ -53,8 +86,9 @@ def export_c_array(
 
     bytes_per_row = width // 8 if fmt == "horizontal" else 16
 
-    for i, canvas in enumerate(frames):
-        data = canvas.to_bytes(fmt)
+    for i, data in enumerate(packed_frames):
+        if labels:
+            lines.append(f"// {labels[i]}")
         lines.append(f"const unsigned char PROGMEM {var_prefix}_{i}[] = {{")
 
         hex_values = [f"0x{b:02X}" for b in data]
@@ -80,14 +114,4 @@ def export_c_array(
     lines.append(f"const uint16_t FRAME_SIZE = {frame_size};")
     lines.append("")
 
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-
-    return {
-        "path": output_path,
-        "frame_count": frame_count,
-        "frame_size": frame_size,
-        "total_bytes": total_bytes,
-        "total_kb": total_kb,
-    }
+    return "\n".join(lines)
@@ -9,20 +9,24 @@ import os
 from ..canvas import Canvas
 
 
-def _compute_delta(prev: Canvas, curr: Canvas):
+def _compute_delta(prev: Canvas, curr: Canvas, window: tuple = None):
     """Find the bounding box of changed pixels between two frames.
 
+    If `window` (inclusive x0, y0, x1, y1) is given, only pixels inside
+    it are compared — every change is known to lie within it.
+
     Returns (x, y, w, h, changed_pixels) or None if identical.
     """
     pw = prev.image.load()
     cw = curr.image.load()
     width, height = prev.width, prev.height
+    x0, y0, x1, y1 = window or (0, 0, width - 1, height - 1)
 
     min_x, min_y = width, height
     max_x, max_y = -1, -1
 
-    for y in range(height):
-        for x in range(width):
+    for y in range(y0, y1 + 1):
+        for x in range(x0, x1 + 1):
             if pw[x, y] != cw[x, y]:
                 min_x = min(min_x, x)
                 min_y = min(min_y, y)
@@ -43,6 +47,13 @@ def _compute_delta(prev: Canvas, curr: Canvas):
     }
 
 
+def _union(rects: list) -> tuple:
+    return (
+        min(r[0] for r in rects), min(r[1] for r in rects),
+        max(r[2] for r in rects), max(r[3] for r in rects),
+    )
+
+
 def _extract_region_bytes(canvas: Canvas, x: int, y: int, w: int, h: int) -> bytes:
     """Extract horizontal-format bytes for a sub-region of the canvas."""
     pixels = canvas.image.load()
@@ -69,11 +80,15 @@ def export_delta(
     height: int,
     fps: int,
     var_prefix: str = "frame",
+    damage: list = None,
 ):
     """Export frames using delta compression.
 
     First frame is stored in full. Subsequent frames store only the
     bounding box of changed pixels.
+
+    `damage` is the per-frame rect list from Animation.damage();
+    when given, pixels are only compared inside the damaged regions.
     """
     frame_count = len(frames)
     full_frame_size = (width * height) // 8
@@ -110,7 +125,12 @@ def export_delta(
 
     deltas = []
     for i in range(1, frame_count):
-        delta = _compute_delta(frames[i - 1], frames[i])
+        if damage is None:
+            delta = _compute_delta(frames[i - 1], frames[i])
+        elif not damage[i]:
+            delta = None
+        else:
+            delta = _compute_delta(frames[i - 1], frames[i], _union(damage[i]))
 
         if delta is None:
             deltas.append(None)
@@ -0,0 +1,327 @@
+"""
+Display List Exporter — unique bitmaps plus per-frame draw ops instead of
+baked frames.
+
+Every element is rasterized on its own at its interpolated props and
+cropped to its set pixels; identical bitmaps (a sprite moving around, a
+static label, a glyph string) are stored once. Each frame is then a
+short list of (x, y, bitmap id) ops, and frames with identical lists
+share them. Since every primitive only sets pixels, OR-blitting a
+frame's ops onto a cleared screen reproduces the rendered frame exactly.
+
+Writes the scene header plus `oled_display_list.h`, a small runtime that
+draws a frame into an Adafruit_GFX display, a U8g2 display or a raw
+page-format (SSD1306/SH1106) buffer:
+
+  #include <Adafruit_SSD1306.h>
+  #include "animation_dl.h"
+
+  display.clearDisplay();
+  dl_draw_frame_gfx(display, &scene, frame, SSD1306_WHITE);
+  display.display();
+"""
+
+import os
+
+from ..canvas import Canvas
+
+RUNTIME_NAME = "oled_display_list.h"
+
+BITMAP_ENTRY_BYTES = 8  # dl_bitmap_t: uint32 offset, uint16 w, h
+OP_BYTES = 6            # dl_op_t: int16 x, y, uint16 id
+FRAME_ENTRY_BYTES = 4   # dl_frame_t: uint16 start, count
+
+RUNTIME = """\
+// ============================================================
+// oled_display_list.h — display-list runtime (remotionBinario)
+// Include Adafruit_GFX.h and/or U8g2lib.h before this header to
+// enable dl_draw_frame_gfx() / dl_draw_frame_u8g2().
+// ============================================================
+
+#ifndef OLED_DISPLAY_LIST_H
+#define OLED_DISPLAY_LIST_H
+
+#include <stdint.h>
+#include <string.h>
+
+#if defined(ARDUINO)
+#include <Arduino.h>
+#endif
+#if defined(__AVR__)
+#include <avr/pgmspace.h>
+#elif !defined(PROGMEM)
+#define PROGMEM
+#endif
+#ifndef memcpy_P
+#define memcpy_P memcpy
+#endif
+
+// Bitmaps are row-major, MSB first, rows padded to a byte
+// (the Adafruit_GFX drawBitmap / U8g2 drawBitmap layout).
+typedef struct { uint32_t offset; uint16_t w, h; } dl_bitmap_t;
+typedef struct { int16_t x, y; uint16_t id; } dl_op_t;
+typedef struct { uint16_t start, count; } dl_frame_t;
+
+typedef struct {
+  uint16_t width, height, frame_count;
+  uint8_t fps;
+  const uint8_t *data;          // PROGMEM
+  const dl_bitmap_t *bitmaps;   // PROGMEM
+  const dl_op_t *ops;           // PROGMEM
+  const dl_frame_t *frames;     // PROGMEM
+} dl_scene_t;
+
+typedef void (*dl_blit_fn)(int16_t x, int16_t y, const uint8_t *bitmap,
+                           uint16_t w, uint16_t h, void *ctx);
+
+// Call blit() for every op of a frame, in drawing order.
+static inline void dl_each_op(const dl_scene_t *s, uint16_t frame,
+                              dl_blit_fn blit, void *ctx) {
+  dl_frame_t f;
+  memcpy_P(&f, &s->frames[frame], sizeof f);
+  for (uint16_t i = 0; i < f.count; i++) {
+    dl_op_t op;
+    dl_bitmap_t b;
+    memcpy_P(&op, &s->ops[f.start + i], sizeof op);
+    memcpy_P(&b, &s->bitmaps[op.id], sizeof b);
+    blit(op.x, op.y, s->data + b.offset, b.w, b.h, ctx);
+  }
+}
+
+typedef struct { uint8_t *buf; uint16_t width; } dl_buffer_t;
+
+static inline void dl_blit_page(int16_t x, int16_t y, const uint8_t *bitmap,
+                                uint16_t w, uint16_t h, void *ctx) {
+  dl_buffer_t *b = (dl_buffer_t *)ctx;
+  uint16_t row_bytes = (w + 7) / 8;
+  for (uint16_t j = 0; j < h; j++) {
+    uint16_t py = y + j;
+    uint8_t *page = b->buf + (py / 8) * b->width + x;
+    uint8_t bit = 1 << (py & 7);
+    for (uint16_t i = 0; i < w; i++) {
+      uint8_t byte;
+      memcpy_P(&byte, bitmap + j * row_bytes + i / 8, 1);
+      if (byte & (0x80 >> (i & 7))) page[i] |= bit;
+    }
+  }
+}
+
+// OR a frame into a page-format buffer (SSD1306 / SH1106 / U8g2 full
+// buffer: one byte = 8 vertical pixels, LSB on top). Clear it first.
+static inline void dl_draw_frame_buffer(const dl_scene_t *s, uint16_t frame, uint8_t *buf) {
+  dl_buffer_t b = { buf, s->width };
+  dl_each_op(s, frame, dl_blit_page, &b);
+}
+
+#if defined(_ADAFRUIT_GFX_H)
+typedef struct { Adafruit_GFX *gfx; uint16_t color; } dl_gfx_t;
+
+static void dl_blit_gfx(int16_t x, int16_t y, const uint8_t *bitmap,
+                        uint16_t w, uint16_t h, void *ctx) {
+  dl_gfx_t *g = (dl_gfx_t *)ctx;
+  g->gfx->drawBitmap(x, y, bitmap, w, h, g->color);
+}
+
+static inline void dl_draw_frame_gfx(Adafruit_GFX &gfx, const dl_scene_t *s,
+                                     uint16_t frame, uint16_t color) {
+  dl_gfx_t g = { &gfx, color };
+  dl_each_op(s, frame, dl_blit_gfx, &g);
+}
+#endif
+
+#if defined(U8G2LIB_HH)
+static void dl_blit_u8g2(int16_t x, int16_t y, const uint8_t *bitmap,
+                         uint16_t w, uint16_t h, void *ctx) {
+  ((U8G2 *)ctx)->drawBitmap(x, y, (w + 7) / 8, h, bitmap);
+}
+
+static inline void dl_draw_frame_u8g2(U8G2 &u8g2, const dl_scene_t *s, uint16_t frame) {
+  u8g2.setBitmapMode(1);  // transparent: only set bits are drawn
+  dl_each_op(s, frame, dl_blit_u8g2, &u8g2);
+}
+#endif
+
+#endif // OLED_DISPLAY_LIST_H
+"""
+
+
+def build_display_list(anim) -> dict:
+    """Rasterize each element per frame and deduplicate the bitmaps.
+
+    Returns:
+        Dict with keys: bitmaps (list of mode "1" images), owners
+        (element id that first produced each bitmap), frames (per-frame
+        tuple of (x, y, bitmap id) ops in drawing order)
+    """
+    ops = anim.compile()
+    bitmaps, owners = [], []
+    bitmap_ids = {}   # (w, h, bytes) -> id
+    stamps = {}       # (op index, args) -> (x, y, id) or None
+    frames = []
+
+    for i in range(anim.total_frames):
+        frame_ops = []
+        for j, op in enumerate(ops):
+            args = op.args_at(i)
+            key = (j, tuple(sorted(args.items())))
+            if key not in stamps:
+                stamps[key] = _stamp(op, args, anim.width, anim.height,
+                                     bitmaps, owners, bitmap_ids)
+            if stamps[key] is not None:
+                frame_ops.append(stamps[key])
+        frames.append(tuple(frame_ops))
+
+    return {"bitmaps": bitmaps, "owners": owners, "frames": frames}
+
+
+def _stamp(op, args: dict, width: int, height: int,
+           bitmaps: list, owners: list, bitmap_ids: dict):
+    """Rasterize one element alone; (x, y, bitmap id) or None if empty."""
+    canvas = Canvas(width, height)
+    op.draw(canvas, **args)
+    box = canvas.image.getbbox()
+    if box is None:
+        return None
+    bitmap = canvas.image.crop(box)
+    key = (bitmap.width, bitmap.height, bitmap.tobytes())
+    bitmap_id = bitmap_ids.get(key)
+    if bitmap_id is None:
+        bitmap_id = bitmap_ids[key] = len(bitmaps)
+        bitmaps.append(bitmap)
+        owners.append(op.id)
+    return (box[0], box[1], bitmap_id)
+
+
+def replay(display_list: dict, width: int, height: int) -> list:
+    """Draw every frame of a display list back into Canvases."""
+    bitmaps = display_list["bitmaps"]
+    frames = []
+    for frame_ops in display_list["frames"]:
+        canvas = Canvas(width, height)
+        for x, y, bitmap_id in frame_ops:
+            canvas.image.paste(1, (x, y), mask=bitmaps[bitmap_id])
+        frames.append(canvas)
+    return frames
+
+
+def export_display_list(
+    anim,
+    output_path: str,
+    var_prefix: str = "scene",
+    verify: bool = True,
+):
+    """Export an Animation as bitmaps + per-frame ops, plus the runtime
+    header next to it.
+
+    With `verify`, the list is replayed and compared against the
+    rendered frames.
+    """
+    dl = build_display_list(anim)
+    bitmaps, frames = dl["bitmaps"], dl["frames"]
+
+    # Identical consecutive or repeated frames share one op range
+    ranges, op_list, seen = [], [], {}
+    for frame_ops in frames:
+        if frame_ops not in seen:
+            seen[frame_ops] = (len(op_list), len(frame_ops))
+            op_list.extend(frame_ops)
+        ranges.append(seen[frame_ops])
+
+    packed = [bitmap.tobytes() for bitmap in bitmaps]
+    offsets, data_bytes = [], 0
+    for chunk in packed:
+        offsets.append(data_bytes)
+        data_bytes += len(chunk)
+
+    if len(op_list) > 0xFFFF or len(bitmaps) > 0xFFFF:
+        raise ValueError("Display list too large for 16-bit op/bitmap indices")
+
+    verified = None
+    if verify:
+        rendered = anim.render_all()
+        verified = all(
+            a.image.tobytes() == b.image.tobytes()
+            for a, b in zip(replay(dl, anim.width, anim.height), rendered)
+        )
+
+    bitmap_table_bytes = len(bitmaps) * BITMAP_ENTRY_BYTES
+    op_bytes = len(op_list) * OP_BYTES
+    frame_table_bytes = len(frames) * FRAME_ENTRY_BYTES
+    total_bytes = data_bytes + bitmap_table_bytes + op_bytes + frame_table_bytes
+    full_bytes = len(frames) * (anim.width * anim.height) // 8
+
+    p = var_prefix
+    lines = []
+    lines.append(f"// ============================================================")
+    lines.append(f"// Auto-generated by remotionBinario — Display List")
+    lines.append(f"// Screen: {anim.width}x{anim.height} | Frames: {len(frames)} | FPS: {anim.fps}")
+    lines.append(f"// Bitmaps: {len(bitmaps)} unique ({data_bytes} + {bitmap_table_bytes} bytes)")
+    lines.append(f"// Ops: {len(op_list)} ({op_bytes} bytes) | Frame table: {frame_table_bytes} bytes")
+    lines.append(f"// Total: {total_bytes} bytes | Full frames would be: {full_bytes} bytes")
+    lines.append(f"// ============================================================")
+    lines.append("")
+    lines.append(f'#include "{RUNTIME_NAME}"')
+    lines.append("")
+
+    lines.append(f"const uint8_t PROGMEM {p}_data[] = {{")
+    for k, bitmap in enumerate(bitmaps):
+        hex_values = ", ".join(f"0x{b:02X}" for b in packed[k])
+        comma = "," if k < len(bitmaps) - 1 else ""
+        lines.append(f"  {hex_values}{comma}  // #{k} {bitmap.width}x{bitmap.height}")
+    if not bitmaps:
+        lines.append("  0x00")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const dl_bitmap_t PROGMEM {p}_bitmaps[] = {{")
+    for k, bitmap in enumerate(bitmaps):
+        lines.append(f"  {{{offsets[k]}, {bitmap.width}, {bitmap.height}}},  // #{k} {dl['owners'][k]}")
+    if not bitmaps:
+        lines.append("  {0, 0, 0}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const dl_op_t PROGMEM {p}_ops[] = {{")
+    for start in range(0, len(op_list), 6):
+        row = ", ".join(f"{{{x}, {y}, {b}}}" for x, y, b in op_list[start:start + 6])
+        comma = "," if start + 6 < len(op_list) else ""
+        lines.append(f"  {row}{comma}")
+    if not op_list:
+        lines.append("  {0, 0, 0}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const dl_frame_t PROGMEM {p}_frames[] = {{")
+    for start in range(0, len(ranges), 8):
+        row = ", ".join(f"{{{s}, {c}}}" for s, c in ranges[start:start + 8])
+        comma = "," if start + 8 < len(ranges) else ""
+        lines.append(f"  {row}{comma}")
+    if not ranges:
+        lines.append("  {0, 0}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const dl_scene_t {p} = {{")
+    lines.append(f"  {anim.width}, {anim.height}, {len(frames)}, {anim.fps},")
+    lines.append(f"  {p}_data, {p}_bitmaps, {p}_ops, {p}_frames")
+    lines.append("};")
+    lines.append("")
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    runtime_path = os.path.join(os.path.dirname(output_path), RUNTIME_NAME)
+    with open(runtime_path, "w", encoding="utf-8") as f:
+        f.write(RUNTIME)
+
+    return {
+        "path": output_path,
+        "runtime_path": runtime_path,
+        "bitmap_count": len(bitmaps),
+        "op_count": len(op_list),
+        "unique_frames": len(seen),
+        "total_bytes": total_bytes,
+        "full_bytes": full_bytes,
+        "savings_pct": (1 - total_bytes / full_bytes) * 100 if full_bytes > 0 else 0,
+        "verified": verified,
+    }
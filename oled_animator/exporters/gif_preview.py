@@ -1,10 +1,13 @@
 """
 GIF Preview — generates animated GIF from rendered frames.
+
+Frames are written with one fixed 2-colour palette (background, lit
+pixel), scaled as palette indices, and runs of identical frames are
+merged into one frame with the summed duration. See preview.py for the
+other preview formats.
 """
 
-import os
-from PIL import Image
-from ..canvas import Canvas
+from .preview import GifWriter
 
 
 def save_gif(
@@ -12,42 +15,21 @@ def save_gif(
     output_path: str,
     fps: int,
     scale: int = 4,
-    bg_color: int = 0,
-    fg_color: int = 255,
+    bg_color=0,
+    fg_color=255,
+    optimize: bool = False,
 ):
     """Save rendered frames as an animated GIF.
 
     Scales up the tiny OLED resolution for comfortable viewing.
-    128x64 @ scale=4 → 512x256 GIF.
+    128x64 @ scale=4 → 512x256 GIF. Colours are grey levels, (r, g, b)
+    tuples or strings such as "#4cc9ff" (blue OLED tint). See GifWriter
+    for `optimize`.
     """
     if not frames:
         return None
 
-    duration_ms = int(1000 / fps) if fps > 0 else 100
-    pil_frames = []
-
-    for canvas in frames:
-        img = canvas.get_image().convert("L")
-        scaled = img.resize(
-            (canvas.width * scale, canvas.height * scale),
-            Image.NEAREST,
-        )
-        pil_frames.append(scaled.convert("P"))
-
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-    pil_frames[0].save(
-        output_path,
-        save_all=True,
-        append_images=pil_frames[1:],
-        duration=duration_ms,
-        loop=0,
-        optimize=False,
-    )
-
-    return {
-        "path": output_path,
-        "frame_count": len(pil_frames),
-        "resolution": f"{frames[0].width * scale}x{frames[0].height * scale}",
-        "duration_ms": duration_ms,
-    }
+    with GifWriter(output_path, fps, scale, bg_color, fg_color, optimize) as writer:
+        for canvas in frames:
+            writer.add(canvas)
+    return writer.result
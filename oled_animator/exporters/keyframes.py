@@ -0,0 +1,560 @@
+"""
+Keyframe Curve Exporter — the compiled tracks and primitives as C structs,
+interpolated and drawn on the device.
+
+Instead of frames, the header holds each element's type, static args
+and keyframe tracks (frame, value, easing) plus the bitmaps of sprites,
+sprite-sheet cells and text strings. `oled_keyframes.h` evaluates the
+tracks in fixed point and draws with Adafruit_GFX or U8g2 primitives,
+so the size depends on the number of keyframes, not on the frame count.
+
+Fixed point: values are Q4 int16 and eased t is Q12 from a 129-entry
+LUT per easing (linear interpolation between entries), which keeps all
+products inside int32; linear segments are interpolated exactly. `verify_keyframes()`
+renders every frame with the Python engine and with the same
+fixed-point arithmetic and reports the pixel differences.
+"""
+
+import os
+
+from ..canvas import Canvas
+from ..easing import EASING_FUNCTIONS
+from ..primitives import draw_text, load_sprite, load_sheet_cells
+
+RUNTIME_NAME = "oled_keyframes.h"
+
+VALUE_SHIFT = 4   # keyframe values: Q4
+EASE_SHIFT = 12   # eased t: Q12
+LUT_BITS = 7      # 2^7 segments per easing LUT
+T_SHIFT = 16      # segment progress t: Q16
+
+KEY_BYTES = 6       # kc_key_t: uint16 frame, int16 value, uint8 easing (+pad)
+TRACK_BYTES = 6     # kc_track_t: uint8 slot, uint8 pad, uint16 first_key, key_count
+ELEMENT_BYTES = 18  # kc_element_t
+BITMAP_ENTRY_BYTES = 12  # kc_bitmap_t: uint32 offset, uint16 w, h, int8 dx, dy (+pad)
+
+# Draw-arg slots per element type (tracks override slots by index)
+SLOTS = {
+    "rect": ("x", "y", "w", "h"),
+    "circle": ("cx", "cy", "r"),
+    "line": ("x1", "y1", "x2", "y2"),
+    "text": ("x", "y"),
+    "sprite": ("x", "y"),
+    "spritesheet": ("x", "y", "cell"),
+}
+BITMAP_TYPES = ("text", "sprite", "spritesheet")
+
+_EASING_NAMES = {fn: name for name, fn in EASING_FUNCTIONS.items()}
+
+RUNTIME = """\
+// ============================================================
+// oled_keyframes.h — keyframe-curve runtime (remotionBinario)
+// Include Adafruit_GFX.h and/or U8g2lib.h before this header to
+// enable kc_draw_frame_gfx() / kc_draw_frame_u8g2().
+// ============================================================
+
+#ifndef OLED_KEYFRAMES_H
+#define OLED_KEYFRAMES_H
+
+#include <stdint.h>
+#include <string.h>
+
+#if defined(ARDUINO)
+#include <Arduino.h>
+#endif
+#if defined(__AVR__)
+#include <avr/pgmspace.h>
+#elif !defined(PROGMEM)
+#define PROGMEM
+#endif
+#ifndef memcpy_P
+#define memcpy_P memcpy
+#endif
+
+#define KC_VALUE_SHIFT 4
+#define KC_EASE_SHIFT 12
+#define KC_LUT_BITS 7
+#define KC_LUT_SIZE ((1 << KC_LUT_BITS) + 1)
+#define KC_T_SHIFT 16
+
+enum { KC_RECT, KC_CIRCLE, KC_LINE, KC_TEXT, KC_SPRITE, KC_SPRITESHEET };
+#define KC_FILL 0x01
+#define KC_AA   0x02  // drawn aliased on the device
+
+typedef struct { uint16_t frame; int16_t value; uint8_t easing; } kc_key_t;
+typedef struct { uint8_t slot; uint16_t first_key, key_count; } kc_track_t;
+typedef struct {
+  uint8_t type, flags;
+  int16_t args[4];       // static args; tracks override slots
+  uint16_t bitmap, bitmap_count;
+  uint16_t first_track;
+  uint8_t track_count;
+} kc_element_t;
+// Bitmaps: row-major, MSB first, rows padded to a byte; drawn at (x+dx, y+dy)
+typedef struct { uint32_t offset; uint16_t w, h; int8_t dx, dy; } kc_bitmap_t;
+
+typedef struct {
+  uint16_t width, height, frame_count;
+  uint8_t fps;
+  uint16_t element_count;
+  const kc_element_t *elements;  // PROGMEM
+  const kc_track_t *tracks;      // PROGMEM
+  const kc_key_t *keys;          // PROGMEM
+  const int16_t *luts;           // PROGMEM, KC_LUT_SIZE per easing id >= 1
+  const kc_bitmap_t *bitmaps;    // PROGMEM
+  const uint8_t *data;           // PROGMEM
+} kc_scene_t;
+
+// Eased t (Q12) for t in Q16; easing 0 is linear.
+static inline int32_t kc_ease(const kc_scene_t *s, uint8_t easing, uint32_t t) {
+  if (easing == 0) return (int32_t)(t >> (KC_T_SHIFT - KC_EASE_SHIFT));
+  const int16_t *lut = s->luts + (uint32_t)(easing - 1) * KC_LUT_SIZE;
+  uint16_t i = t >> (KC_T_SHIFT - KC_LUT_BITS);
+  int16_t a, b;
+  memcpy_P(&a, &lut[i], sizeof a);
+  if (i >= (1 << KC_LUT_BITS)) return a;
+  memcpy_P(&b, &lut[i + 1], sizeof b);
+  int32_t frac = t & ((1UL << (KC_T_SHIFT - KC_LUT_BITS)) - 1);
+  return a + (((int32_t)(b - a) * frac) >> (KC_T_SHIFT - KC_LUT_BITS));
+}
+
+// Integer value of a track at a frame (truncated toward zero).
+static inline int16_t kc_track_value(const kc_scene_t *s, const kc_track_t *tr, uint16_t frame) {
+  kc_key_t k0, k1;
+  memcpy_P(&k0, &s->keys[tr->first_key], sizeof k0);
+  if (frame <= k0.frame) return k0.value / (1 << KC_VALUE_SHIFT);
+  for (uint16_t i = 1; i < tr->key_count; i++) {
+    memcpy_P(&k1, &s->keys[tr->first_key + i], sizeof k1);
+    if (frame <= k1.frame) {
+      // frame > k0.frame here, so span >= 1
+      int32_t span = k1.frame - k0.frame, dv = k1.value - k0.value;
+      if (k0.easing == 0)  // exact: linear needs no LUT
+        return ((int32_t)k0.value * span + dv * (frame - k0.frame)) / (span << KC_VALUE_SHIFT);
+      uint32_t t = ((uint32_t)(frame - k0.frame) << KC_T_SHIFT) / span;
+      int32_t v = ((int32_t)k0.value << KC_EASE_SHIFT) + dv * kc_ease(s, k0.easing, t);
+      return v / (1L << (KC_VALUE_SHIFT + KC_EASE_SHIFT));
+    }
+    k0 = k1;
+  }
+  return k0.value / (1 << KC_VALUE_SHIFT);
+}
+
+// Draw args of element `index` at `frame`.
+static inline void kc_element_args(const kc_scene_t *s, uint16_t index, uint16_t frame,
+                                   kc_element_t *e, int16_t args[4]) {
+  memcpy_P(e, &s->elements[index], sizeof *e);
+  memcpy(args, e->args, sizeof e->args);
+  for (uint8_t i = 0; i < e->track_count; i++) {
+    kc_track_t tr;
+    memcpy_P(&tr, &s->tracks[e->first_track + i], sizeof tr);
+    args[tr.slot] = kc_track_value(s, &tr, frame);
+  }
+}
+
+// Bitmap to draw for a text/sprite/spritesheet element.
+static inline void kc_element_bitmap(const kc_scene_t *s, const kc_element_t *e,
+                                     const int16_t args[4], kc_bitmap_t *b) {
+  uint16_t id = e->bitmap;
+  if (e->type == KC_SPRITESHEET) {
+    int16_t n = e->bitmap_count, cell = args[2] % n;
+    id += cell < 0 ? cell + n : cell;
+  }
+  memcpy_P(b, &s->bitmaps[id], sizeof *b);
+}
+
+#if defined(_ADAFRUIT_GFX_H)
+static inline void kc_draw_frame_gfx(Adafruit_GFX &gfx, const kc_scene_t *s,
+                                     uint16_t frame, uint16_t color) {
+  for (uint16_t i = 0; i < s->element_count; i++) {
+    kc_element_t e;
+    int16_t a[4];
+    kc_element_args(s, i, frame, &e, a);
+    bool fill = e.flags & KC_FILL;
+    switch (e.type) {
+      case KC_RECT: {
+        int16_t x1 = a[0] + a[2] - 1, y1 = a[1] + a[3] - 1;
+        int16_t x0 = a[0] < x1 ? a[0] : x1, y0 = a[1] < y1 ? a[1] : y1;
+        int16_t w = (a[0] > x1 ? a[0] : x1) - x0 + 1, h = (a[1] > y1 ? a[1] : y1) - y0 + 1;
+        if (fill) gfx.fillRect(x0, y0, w, h, color); else gfx.drawRect(x0, y0, w, h, color);
+        break;
+      }
+      case KC_CIRCLE: {
+        int16_t r = a[2] < 0 ? -a[2] : a[2];
+        if (fill) gfx.fillCircle(a[0], a[1], r, color); else gfx.drawCircle(a[0], a[1], r, color);
+        break;
+      }
+      case KC_LINE:
+        gfx.drawLine(a[0], a[1], a[2], a[3], color);
+        break;
+      default: {
+        kc_bitmap_t b;
+        kc_element_bitmap(s, &e, a, &b);
+        gfx.drawBitmap(a[0] + b.dx, a[1] + b.dy, s->data + b.offset, b.w, b.h, color);
+      }
+    }
+  }
+}
+#endif
+
+#if defined(U8G2LIB_HH)
+// U8g2 coordinates are unsigned: elements must stay on screen.
+static inline void kc_draw_frame_u8g2(U8G2 &u8g2, const kc_scene_t *s, uint16_t frame) {
+  u8g2.setBitmapMode(1);
+  for (uint16_t i = 0; i < s->element_count; i++) {
+    kc_element_t e;
+    int16_t a[4];
+    kc_element_args(s, i, frame, &e, a);
+    bool fill = e.flags & KC_FILL;
+    switch (e.type) {
+      case KC_RECT: {
+        int16_t x1 = a[0] + a[2] - 1, y1 = a[1] + a[3] - 1;
+        int16_t x0 = a[0] < x1 ? a[0] : x1, y0 = a[1] < y1 ? a[1] : y1;
+        int16_t w = (a[0] > x1 ? a[0] : x1) - x0 + 1, h = (a[1] > y1 ? a[1] : y1) - y0 + 1;
+        if (fill) u8g2.drawBox(x0, y0, w, h); else u8g2.drawFrame(x0, y0, w, h);
+        break;
+      }
+      case KC_CIRCLE: {
+        int16_t r = a[2] < 0 ? -a[2] : a[2];
+        if (fill) u8g2.drawDisc(a[0], a[1], r); else u8g2.drawCircle(a[0], a[1], r);
+        break;
+      }
+      case KC_LINE:
+        u8g2.drawLine(a[0], a[1], a[2], a[3]);
+        break;
+      default: {
+        kc_bitmap_t b;
+        kc_element_bitmap(s, &e, a, &b);
+        u8g2.drawBitmap(a[0] + b.dx, a[1] + b.dy, (b.w + 7) / 8, b.h, s->data + b.offset);
+      }
+    }
+  }
+}
+#endif
+
+#endif // OLED_KEYFRAMES_H
+"""
+
+
+def easing_lut(name: str) -> list:
+    """Q12 samples of an easing at t = i / 2^LUT_BITS."""
+    fn = EASING_FUNCTIONS[name]
+    steps = 1 << LUT_BITS
+    return [round(fn(i / steps) * (1 << EASE_SHIFT)) for i in range(steps + 1)]
+
+
+def _tdiv(a: int, b: int) -> int:
+    """C integer division (truncates toward zero)."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def ease_fixed(lut, t: int) -> int:
+    """Eased t (Q12) for t in Q16, as the runtime computes it."""
+    if lut is None:
+        return t >> (T_SHIFT - EASE_SHIFT)
+    shift = T_SHIFT - LUT_BITS
+    i = t >> shift
+    if i >= 1 << LUT_BITS:
+        return lut[-1]
+    return lut[i] + (((lut[i + 1] - lut[i]) * (t & ((1 << shift) - 1))) >> shift)
+
+
+def track_value_fixed(keys: list, luts: dict, frame: int) -> int:
+    """Integer track value at a frame, as the runtime computes it.
+
+    `keys` is [(frame, Q4 value, easing name)].
+    """
+    f0, v0, e0 = keys[0]
+    if frame <= f0:
+        return _tdiv(v0, 1 << VALUE_SHIFT)
+    for f1, v1, e1 in keys[1:]:
+        if frame <= f1:
+            span = f1 - f0  # >= 1, since frame > f0
+            if e0 == "linear":
+                return _tdiv(v0 * span + (v1 - v0) * (frame - f0), span << VALUE_SHIFT)
+            t = ((frame - f0) << T_SHIFT) // span
+            v = (v0 << EASE_SHIFT) + (v1 - v0) * ease_fixed(luts.get(e0), t)
+            return _tdiv(v, 1 << (VALUE_SHIFT + EASE_SHIFT))
+        f0, v0, e0 = f1, v1, e1
+    return _tdiv(v0, 1 << VALUE_SHIFT)
+
+
+def compile_curves(anim) -> dict:
+    """Flatten the Animation's compiled DrawOps into the exported tables.
+
+    Returns:
+        Dict with keys: elements, tracks, keys, easings (names, id - 1
+        order), luts ({name: LUT}), bitmaps (list of (image, dx, dy))
+    """
+    elements, tracks, keys, bitmaps = [], [], [], []
+    easings = []
+
+    for op in anim.compile():
+        static = op.draw.keywords
+        slots = SLOTS[op.type]
+        animated = {name for name, _ in op.tracks}
+        unsupported = animated - set(slots)
+        if unsupported:
+            raise ValueError(
+                f"Element '{op.id}': animated {sorted(unsupported)} cannot be "
+                f"interpolated on the device"
+            )
+
+        first_bitmap, bitmap_count = len(bitmaps), 0
+        if op.type == "text":
+            bitmaps.append(_text_bitmap(static["text"], static["font_size"], static["font_path"]))
+            bitmap_count = 1
+        elif op.type == "sprite":
+            bitmaps.append((load_sprite(static["src"], static["dithering"]), 0, 0))
+            bitmap_count = 1
+        elif op.type == "spritesheet":
+            cells = load_sheet_cells(static["src"], static["cell_w"], static["cell_h"],
+                                     static["dithering"])
+            bitmaps.extend((cell, 0, 0) for cell in cells)
+            bitmap_count = len(cells)
+
+        first_track = len(tracks)
+        for name, track in op.tracks:
+            track_keys = []
+            for frame, value, easing_fn in zip(track.frames, track.values, track.easings):
+                if type(frame) is not int or not 0 <= frame <= 0xFFFF:
+                    raise ValueError(
+                        f"Element '{op.id}': {name} keyframe frame {frame!r} is not "
+                        f"an integer in 0..65535 (uint16 keyframe frames)"
+                    )
+                easing = _EASING_NAMES.get(easing_fn, "linear")
+                if easing != "linear" and easing not in easings:
+                    easings.append(easing)
+                fixed = round(value * (1 << VALUE_SHIFT))
+                if not -0x8000 <= fixed <= 0x7FFF:
+                    raise ValueError(
+                        f"Element '{op.id}': {name} = {value} is out of range for "
+                        f"Q{VALUE_SHIFT} int16 keyframe values"
+                    )
+                track_keys.append((frame, fixed, easing))
+            tracks.append((slots.index(name), len(keys), len(track_keys)))
+            keys.extend(track_keys)
+
+        for name in slots:
+            value = static.get(name, 0)
+            if not -0x8000 <= value <= 0x7FFF:
+                raise ValueError(
+                    f"Element '{op.id}': {name} = {value} is out of range for "
+                    f"int16 element args"
+                )
+
+        flags = (1 if static.get("fill") else 0) | (2 if static.get("anti_alias") else 0)
+        elements.append({
+            "id": op.id,
+            "type": op.type,
+            "flags": flags,
+            "args": [static.get(name, 0) for name in slots],
+            "bitmap": first_bitmap if bitmap_count else 0,
+            "bitmap_count": bitmap_count,
+            "first_track": first_track,
+            "track_count": len(tracks) - first_track,
+        })
+
+    return {
+        "elements": elements,
+        "tracks": tracks,
+        "keys": keys,
+        "easings": easings,
+        "luts": {name: easing_lut(name) for name in easings},
+        "bitmaps": bitmaps,
+    }
+
+
+def _text_bitmap(text: str, font_size: int, font_path: str) -> tuple:
+    """Text rasterized once: (bitmap, dx, dy) relative to the text origin."""
+    pad = font_size * 2
+    canvas = Canvas(max(8, pad * (len(text) + 1)), pad * 2)
+    draw_text(canvas, pad, pad, text, font_size, font_path)
+    box = canvas.image.getbbox()
+    if box is None:
+        return Canvas(1, 1).image, 0, 0
+    return canvas.image.crop(box), box[0] - pad, box[1] - pad
+
+
+def _draw_device(canvas: Canvas, op, elem: dict, args: dict, bitmaps: list):
+    """Draw an element the way the runtime does: exported bitmaps for
+    text/sprites, aliased shapes."""
+    if op.type in BITMAP_TYPES:
+        args = dict(zip(SLOTS[op.type], elem["args"]), **args)
+        index = elem["bitmap"]
+        if op.type == "spritesheet":
+            index += args["cell"] % elem["bitmap_count"]
+        image, dx, dy = bitmaps[index]
+        canvas.image.paste(1, (args["x"] + dx, args["y"] + dy), mask=image)
+    else:
+        op.draw(canvas, **dict(args, anti_alias=False))
+
+
+def verify_keyframes(anim, curves: dict = None) -> dict:
+    """Render every frame with the Python engine and as the device would
+    (fixed-point track values, exported bitmaps, no anti-aliasing), and
+    count the pixels that differ. Shapes are drawn with PIL, so
+    differences between PIL and the display library's rasterizers are
+    not measured.
+
+    Returns:
+        Dict with keys: frames, differing_frames, max_pixels (worst
+        frame), total_pixels, arg_mismatches (element args that differ)
+    """
+    curves = curves or compile_curves(anim)
+    ops = anim.compile()
+    keys, luts = curves["keys"], curves["luts"]
+    report = {"frames": anim.total_frames, "differing_frames": 0, "max_pixels": 0,
+              "total_pixels": 0, "arg_mismatches": 0}
+
+    for i in range(anim.total_frames):
+        expected = anim.render_frame(i, ops)
+        canvas = Canvas(anim.width, anim.height)
+        for op, elem in zip(ops, curves["elements"]):
+            args = op.args_at(i)
+            fixed = dict(args)
+            for slot, first_key, count in curves["tracks"][
+                elem["first_track"]:elem["first_track"] + elem["track_count"]
+            ]:
+                name = SLOTS[op.type][slot]
+                fixed[name] = track_value_fixed(keys[first_key:first_key + count], luts, i)
+            if fixed != args:
+                report["arg_mismatches"] += 1
+            _draw_device(canvas, op, elem, fixed, curves["bitmaps"])
+
+        diff = sum(
+            bin(a ^ b).count("1")
+            for a, b in zip(expected.image.tobytes(), canvas.image.tobytes())
+        )
+        if diff:
+            report["differing_frames"] += 1
+            report["max_pixels"] = max(report["max_pixels"], diff)
+            report["total_pixels"] += diff
+    return report
+
+
+def export_keyframes(
+    anim,
+    output_path: str,
+    var_prefix: str = "curves",
+    verify: bool = True,
+):
+    """Export an Animation as keyframe curves, plus the runtime header
+    next to it. With `verify`, the result includes verify_keyframes()."""
+    curves = compile_curves(anim)
+    elements, tracks, keys = curves["elements"], curves["tracks"], curves["keys"]
+    easing_ids = {name: k + 1 for k, name in enumerate(curves["easings"])}
+    easing_ids["linear"] = 0
+
+    packed, offsets, data_bytes = [], [], 0
+    for image, _, _ in curves["bitmaps"]:
+        packed.append(image.tobytes())
+        offsets.append(data_bytes)
+        data_bytes += len(packed[-1])
+
+    lut_entries = sum(len(lut) for lut in curves["luts"].values())
+    sizes = {
+        "elements": len(elements) * ELEMENT_BYTES,
+        "tracks": len(tracks) * TRACK_BYTES,
+        "keys": len(keys) * KEY_BYTES,
+        "luts": lut_entries * 2,
+        "bitmaps": data_bytes + len(packed) * BITMAP_ENTRY_BYTES,
+    }
+    total_bytes = sum(sizes.values())
+    full_bytes = anim.total_frames * (anim.width * anim.height) // 8
+
+    p = var_prefix
+    lines = []
+    lines.append(f"// ============================================================")
+    lines.append(f"// Auto-generated by remotionBinario — Keyframe Curves")
+    lines.append(f"// Screen: {anim.width}x{anim.height} | Frames: {anim.total_frames} | FPS: {anim.fps}")
+    lines.append(f"// Elements: {len(elements)} | Tracks: {len(tracks)} | Keys: {len(keys)} | "
+                 f"Easing LUTs: {len(curves['luts'])}")
+    lines.append(f"// Total: {total_bytes} bytes | Full frames would be: {full_bytes} bytes")
+    lines.append(f"// ============================================================")
+    lines.append("")
+    lines.append(f'#include "{RUNTIME_NAME}"')
+    lines.append("")
+
+    lines.append(f"const kc_element_t PROGMEM {p}_elements[] = {{")
+    for k, e in enumerate(elements):
+        args = ", ".join(str(int(a)) for a in (e["args"] + [0, 0, 0, 0])[:4])
+        comma = "," if k < len(elements) - 1 else ""
+        lines.append(
+            f"  {{KC_{e['type'].upper()}, {e['flags']}, {{{args}}}, "
+            f"{e['bitmap']}, {e['bitmap_count']}, {e['first_track']}, {e['track_count']}}}{comma}"
+            f"  // {e['id']}"
+        )
+    if not elements:
+        lines.append("  {0, 0, {0, 0, 0, 0}, 0, 0, 0, 0}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const kc_track_t PROGMEM {p}_tracks[] = {{")
+    rows = [f"{{{slot}, {first}, {count}}}" for slot, first, count in tracks] or ["{0, 0, 0}"]
+    for start in range(0, len(rows), 6):
+        comma = "," if start + 6 < len(rows) else ""
+        lines.append(f"  {', '.join(rows[start:start + 6])}{comma}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const kc_key_t PROGMEM {p}_keys[] = {{")
+    rows = [f"{{{f}, {v}, {easing_ids[e]}}}" for f, v, e in keys] or ["{0, 0, 0}"]
+    for start in range(0, len(rows), 6):
+        comma = "," if start + 6 < len(rows) else ""
+        lines.append(f"  {', '.join(rows[start:start + 6])}{comma}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const int16_t PROGMEM {p}_luts[] = {{")
+    for k, name in enumerate(curves["easings"]):
+        values = ", ".join(str(v) for v in curves["luts"][name])
+        comma = "," if k < len(curves["easings"]) - 1 else ""
+        lines.append(f"  {values}{comma}  // {easing_ids[name]}: {name}")
+    if not curves["easings"]:
+        lines.append("  0")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const kc_bitmap_t PROGMEM {p}_bitmaps[] = {{")
+    for k, (image, dx, dy) in enumerate(curves["bitmaps"]):
+        comma = "," if k < len(packed) - 1 else ""
+        lines.append(f"  {{{offsets[k]}, {image.width}, {image.height}, {dx}, {dy}}}{comma}")
+    if not packed:
+        lines.append("  {0, 0, 0, 0, 0}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const uint8_t PROGMEM {p}_data[] = {{")
+    for k, chunk in enumerate(packed):
+        comma = "," if k < len(packed) - 1 else ""
+        lines.append(f"  {', '.join(f'0x{b:02X}' for b in chunk)}{comma}")
+    if not packed:
+        lines.append("  0x00")
+    lines.append("};")
+    lines.append("")
+
+    lines.append(f"const kc_scene_t {p} = {{")
+    lines.append(f"  {anim.width}, {anim.height}, {anim.total_frames}, {anim.fps}, {len(elements)},")
+    lines.append(f"  {p}_elements, {p}_tracks, {p}_keys, {p}_luts, {p}_bitmaps, {p}_data")
+    lines.append("};")
+    lines.append("")
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    runtime_path = os.path.join(os.path.dirname(output_path), RUNTIME_NAME)
+    with open(runtime_path, "w", encoding="utf-8") as f:
+        f.write(RUNTIME)
+
+    return {
+        "path": output_path,
+        "runtime_path": runtime_path,
+        "element_count": len(elements),
+        "key_count": len(keys),
+        "sizes": sizes,
+        "total_bytes": total_bytes,
+        "full_bytes": full_bytes,
+        "savings_pct": (1 - total_bytes / full_bytes) * 100 if full_bytes > 0 else 0,
+        "verify": verify_keyframes(anim, curves) if verify else None,
+    }
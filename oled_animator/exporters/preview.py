@@ -0,0 +1,390 @@
+"""
+Preview Writers — streaming animated previews of rendered frames.
+
+Frames are handed to a writer one at a time as they are rendered and
+are not kept around: APNG is written straight to disk (1-bit palette
+PNG, each frame cropped to the rectangle that changed) and MP4 is piped
+into ffmpeg. Animated WebP and GIF are assembled by PIL on close from
+the frames buffered at native resolution. Runs of identical frames are
+merged into one frame with the summed duration.
+
+Formats: gif, apng (.png), webp (lossless), mp4 (needs ffmpeg).
+
+Usage:
+  python main.py scene.yaml --preview-format webp
+
+  with open_preview("apng", "output/preview.png", fps=20) as preview:
+      for i in anim.frame_range():
+          preview.add(anim.render_frame(i))
+  print(preview.result)
+"""
+
+import os
+import shutil
+import struct
+import subprocess
+import zlib
+
+from PIL import Image, ImageChops, ImageColor, features
+
+# Lit pixels of a mode "1" frame read 255 in mode "L": map them to index 1
+_INDEX_LUT = [0] * 255 + [1]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+DEFAULT_DURATION_MS = 100  # when fps is 0
+
+
+class PreviewError(Exception):
+    """Raised when a preview cannot be written (missing codec, ffmpeg failure)."""
+
+
+def rgb_color(color) -> tuple:
+    """(r, g, b) from a grey level, an (r, g, b) tuple or a colour string."""
+    if isinstance(color, str) and color.isdigit():
+        color = int(color)
+    if isinstance(color, int):
+        return (color, color, color)
+    if isinstance(color, str):
+        return ImageColor.getrgb(color)[:3]
+    return tuple(color)[:3]
+
+
+def _ticks(ms: float, resolution: int) -> int:
+    return round(ms / resolution)
+
+
+class PreviewWriter:
+    """Base class: merges repeated frames, tracks time and hands each
+    unique frame to `_write(image, start_ms, end_ms)` once its duration
+    is known. Subclasses round durations from the start/end times, so
+    rounding never drifts over a long animation."""
+
+    extension = ""
+
+    def __init__(self, output_path: str, fps: float, scale: int = 4,
+                 bg_color=0, fg_color=255):
+        self.output_path = output_path
+        self.fps = fps
+        self.scale = scale
+        self.palette = rgb_color(bg_color) + rgb_color(fg_color)
+        self.frame_count = 0
+        self.unique_frames = 0
+        self.size = None  # native (width, height)
+        self.result = None
+        self._clock = 0.0
+        self._pending = None  # (image, bytes, start_ms)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add(self, canvas, duration_ms: float = None):
+        """Append a frame shown for `duration_ms` (1/fps by default)."""
+        if duration_ms is None:
+            duration_ms = 1000 / self.fps if self.fps > 0 else DEFAULT_DURATION_MS
+        data = canvas.image.tobytes()
+        if self._pending is None or data != self._pending[1]:
+            self._flush()
+            self._pending = (canvas.image.copy(), data, self._clock)
+        self._clock += duration_ms
+        self.frame_count += 1
+
+    def close(self) -> dict:
+        """Write the last frame and finish the file; returns the result."""
+        if self.result is not None:
+            return self.result
+        self._flush()
+        if self.unique_frames == 0:
+            raise PreviewError("No frames to write")
+        self._finish()
+        width, height = self.scaled_size
+        self.result = {
+            "path": self.output_path,
+            "format": self.extension.lstrip("."),
+            "frame_count": self.frame_count,
+            "unique_frames": self.unique_frames,
+            "resolution": f"{width}x{height}",
+            "duration_ms": int(1000 / self.fps) if self.fps > 0 else DEFAULT_DURATION_MS,
+            "bytes": os.path.getsize(self.output_path),
+        }
+        return self.result
+
+    def abort(self):
+        """Give up after an error; the output file is left incomplete."""
+        self._abort()
+
+    @property
+    def scaled_size(self) -> tuple:
+        return (self.size[0] * self.scale, self.size[1] * self.scale)
+
+    def index_image(self, image: Image.Image, scale: int = None) -> Image.Image:
+        """Mode "P" copy of a 1-bit frame: index 0 background, 1 lit."""
+        scale = self.scale if scale is None else scale
+        indexed = image.convert("L").point(_INDEX_LUT)
+        if scale != 1:
+            indexed = indexed.resize((image.width * scale, image.height * scale), Image.NEAREST)
+        indexed.putpalette(self.palette)
+        return indexed
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        image, _, start = self._pending
+        self._pending = None
+        if self.size is None:
+            self.size = image.size
+            os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+            self._open()
+        elif image.size != self.size:
+            raise PreviewError(f"Frame size {image.size} differs from {self.size}")
+        self._write(image, start, self._clock)
+        self.unique_frames += 1
+
+    def _open(self):
+        """Called once, before the first frame, when the size is known."""
+
+    def _write(self, image: Image.Image, start_ms: float, end_ms: float):
+        raise NotImplementedError
+
+    def _finish(self):
+        raise NotImplementedError
+
+    def _abort(self):
+        """Release resources after an error; the output is left incomplete."""
+
+
+class GifWriter(PreviewWriter):
+    """Animated GIF with one fixed 2-colour palette. `optimize` lets PIL
+    make unchanged pixels transparent in each frame, which only pays off
+    when small parts change over a busy background and is about 10x
+    slower to encode."""
+
+    extension = ".gif"
+
+    def __init__(self, output_path: str, fps: float, scale: int = 4,
+                 bg_color=0, fg_color=255, optimize: bool = False):
+        super().__init__(output_path, fps, scale, bg_color, fg_color)
+        self.optimize = optimize
+        self._frames = []
+        self._durations = []
+
+    def _write(self, image, start_ms, end_ms):
+        # GIF delays are in 10 ms units
+        self._frames.append(image)
+        self._durations.append((_ticks(end_ms, 10) - _ticks(start_ms, 10)) * 10)
+
+    def _finish(self):
+        frames = [self.index_image(image) for image in self._frames]
+        frames[0].save(
+            self.output_path,
+            save_all=True,
+            append_images=frames[1:],
+            duration=self._durations,
+            loop=0,
+            optimize=self.optimize,
+        )
+
+
+class WebpWriter(PreviewWriter):
+    """Lossless animated WebP."""
+
+    extension = ".webp"
+
+    def __init__(self, output_path: str, fps: float, scale: int = 4,
+                 bg_color=0, fg_color=255):
+        if not features.check("webp"):
+            raise PreviewError("This Pillow build has no WebP support")
+        super().__init__(output_path, fps, scale, bg_color, fg_color)
+        self._frames = []
+        self._durations = []
+
+    def _write(self, image, start_ms, end_ms):
+        self._frames.append(image)
+        self._durations.append(_ticks(end_ms, 1) - _ticks(start_ms, 1))
+
+    def _finish(self):
+        frames = [self.index_image(image).convert("RGB") for image in self._frames]
+        frames[0].save(
+            self.output_path,
+            format="WEBP",
+            save_all=True,
+            append_images=frames[1:],
+            duration=self._durations,
+            loop=0,
+            lossless=True,
+        )
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+class ApngWriter(PreviewWriter):
+    """Animated PNG written as frames arrive: 1-bit palette image data,
+    and every frame after the first only covers the rectangle that
+    changed (dispose none, blend source). The frame count in acTL is
+    patched in on close."""
+
+    extension = ".png"
+
+    def __init__(self, output_path: str, fps: float, scale: int = 4,
+                 bg_color=0, fg_color=255):
+        super().__init__(output_path, fps, scale, bg_color, fg_color)
+        self._file = None
+        self._actl_offset = 0
+        self._sequence = 0
+        self._previous = None
+
+    def _open(self):
+        width, height = self.scaled_size
+        self._file = open(self.output_path, "wb")
+        self._file.write(PNG_SIGNATURE)
+        # 1-bit depth, colour type 3 (palette)
+        self._file.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 1, 3, 0, 0, 0)))
+        self._file.write(_png_chunk(b"PLTE", bytes(self.palette)))
+        self._actl_offset = self._file.tell()
+        self._file.write(_png_chunk(b"acTL", struct.pack(">II", 0, 0)))
+
+    def _write(self, image, start_ms, end_ms):
+        first = self._previous is None
+        if first:
+            box = (0, 0) + image.size
+        else:
+            box = ImageChops.logical_xor(self._previous, image).getbbox()
+        self._previous = image
+
+        s = self.scale
+        region = image.crop(box)
+        if s != 1:
+            region = region.resize((region.width * s, region.height * s), Image.NEAREST)
+        # Mode "1" raw data is already PNG's 1-bit layout; prefix each row
+        # with filter type 0
+        raw = region.tobytes()
+        stride = (region.width + 7) // 8
+        scanlines = b"".join(
+            b"\x00" + raw[i:i + stride] for i in range(0, len(raw), stride)
+        )
+
+        delay, denominator = _ticks(end_ms, 1) - _ticks(start_ms, 1), 1000
+        if delay > 0xFFFF:
+            delay, denominator = min(round(delay / 10), 0xFFFF), 100
+        self._file.write(_png_chunk(b"fcTL", struct.pack(
+            ">IIIIIHHBB", self._sequence, region.width, region.height,
+            box[0] * s, box[1] * s, delay, denominator, 0, 0,
+        )))
+        self._sequence += 1
+
+        data = zlib.compress(scanlines, 9)
+        if first:
+            self._file.write(_png_chunk(b"IDAT", data))
+        else:
+            self._file.write(_png_chunk(b"fdAT", struct.pack(">I", self._sequence) + data))
+            self._sequence += 1
+
+    def _finish(self):
+        self._file.write(_png_chunk(b"IEND", b""))
+        self._file.seek(self._actl_offset)
+        self._file.write(_png_chunk(b"acTL", struct.pack(">II", self.unique_frames, 0)))
+        self._file.close()
+
+    def _abort(self):
+        if self._file is not None:
+            self._file.close()
+
+
+class Mp4Writer(PreviewWriter):
+    """H.264 MP4 through an ffmpeg pipe. Frames are sent at native
+    resolution (repeated to fill their duration at `fps`) and scaled by
+    ffmpeg with nearest-neighbour, padded to even dimensions."""
+
+    extension = ".mp4"
+
+    def __init__(self, output_path: str, fps: float, scale: int = 4,
+                 bg_color=0, fg_color=255):
+        self.ffmpeg = shutil.which("ffmpeg")
+        if self.ffmpeg is None:
+            raise PreviewError("ffmpeg not found (install ffmpeg for MP4 previews)")
+        super().__init__(output_path, fps or 1000 / DEFAULT_DURATION_MS, scale,
+                         bg_color, fg_color)
+        self._proc = None
+
+    def _open(self):
+        width, height = self.size
+        cmd = [
+            self.ffmpeg, "-v", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+            "-r", str(self.fps), "-i", "pipe:0",
+            "-vf", f"scale=iw*{self.scale}:ih*{self.scale}:flags=neighbor,"
+                   "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+            "-pix_fmt", "yuv420p", "-movflags", "+faststart", self.output_path,
+        ]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def _write(self, image, start_ms, end_ms):
+        frame_ms = 1000 / self.fps
+        repeat = _ticks(end_ms, frame_ms) - _ticks(start_ms, frame_ms)
+        if repeat <= 0:
+            return
+        data = self.index_image(image, scale=1).convert("RGB").tobytes()
+        try:
+            for _ in range(repeat):
+                self._proc.stdin.write(data)
+        except BrokenPipeError:
+            self._wait()
+
+    def _finish(self):
+        self._wait()
+
+    def _wait(self):
+        self._proc.stdin.close()
+        stderr = self._proc.stderr.read().decode("utf-8", "replace").strip()
+        self._proc.stderr.close()
+        if self._proc.wait() != 0:
+            raise PreviewError(f"ffmpeg failed: {stderr or self._proc.returncode}")
+
+    def _abort(self):
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+
+
+PREVIEW_WRITERS = {
+    "gif": GifWriter,
+    "apng": ApngWriter,
+    "webp": WebpWriter,
+    "mp4": Mp4Writer,
+}
+
+
+def preview_path(output_dir: str, fmt: str, name: str = "preview") -> str:
+    """`output_dir/name` with the extension of `fmt`."""
+    return os.path.join(output_dir, name + PREVIEW_WRITERS[fmt].extension)
+
+
+def open_preview(fmt: str, output_path: str, fps: float, **options) -> PreviewWriter:
+    """Writer for `fmt`; options are passed to its constructor."""
+    try:
+        writer = PREVIEW_WRITERS[fmt]
+    except KeyError:
+        raise PreviewError(
+            f"Unknown preview format: {fmt} (expected {', '.join(PREVIEW_WRITERS)})"
+        ) from None
+    return writer(output_path, fps, **options)
+
+
+def save_preview(frames: list, output_path: str, fps: float, fmt: str = "gif",
+                 **options):
+    """Write a list of rendered frames; returns the writer result, or
+    None when there are no frames."""
+    if not frames:
+        return None
+    with open_preview(fmt, output_path, fps, **options) as writer:
+        for canvas in frames:
+            writer.add(canvas)
+    return writer.result
@@ -4,17 +4,27 @@ Supports single images and ZIP archives.
 """
 
 import io
+import multiprocessing
 import os
 import zipfile
-from PIL import Image, ImageOps
-from typing import List, Dict, Union, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageChops, ImageOps
+from typing import Iterator, List, Dict, Union, Tuple
 
-from .dither import apply_dithering, apply_threshold
+from .dither import apply_dithering, apply_threshold, SequenceDitherer
 from .canvas import Canvas
 
 
 VALID_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff", ".webp")
 
+# Large downscales shrink by an integer factor first (box filter), then
+# LANCZOS the rest; 3.0 is visually indistinguishable from plain LANCZOS
+RESIZE_REDUCING_GAP = 3.0
+
+# ZIPs with fewer images are converted in-process (pool startup costs more)
+PARALLEL_MIN_IMAGES = 8
+
 
 def process_image(
     file_stream: Union[str, bytes, io.BytesIO],
@@ -31,10 +41,11 @@ def process_image(
             - width, height (int)
             - background (str): "white", "black", "transparent"
             - scale_mode (str): "original", "fit", "stretch", "center"
-            - dither (str): "floyd-steinberg", "atkinson", "ordered", "simple"
+            - dither (str): "floyd-steinberg", "atkinson", "ordered", "blue-noise", "simple"
             - threshold (int): 0-255
             - invert (bool)
             - rotate (int): 0, 90, 180, 270
+            - pipeline (str): "fast" (default) or "reference"
 
     Returns:
         Dict with keys: name, canvas, preview_image, width, height
@@ -42,10 +53,151 @@ def process_image(
     # Load image
     try:
         img = Image.open(file_stream)
+        if (img.format == "JPEG" and settings.get("pipeline", "fast") == "fast"
+                and settings.get("scale_mode", "fit") in ("fit", "stretch")):
+            # Let the decoder go straight to grayscale at a reduced scale
+            # (never below the target in either orientation)
+            side = max(settings.get("width", 128), settings.get("height", 64))
+            img.draft("L", (side, side))
         img.load()  # Ensure loaded
     except Exception as e:
         return {"error": str(e), "name": filename}
 
+    return convert_image(img, filename, settings)
+
+
+def convert_image(
+    img: Image.Image,
+    filename: str,
+    settings: Dict,
+    ditherer: SequenceDitherer = None,
+) -> Dict:
+    """
+    Convert an already-loaded image into a 1-bit Canvas (the processing
+    half of process_image; same settings and return value).
+
+    Pass the same `ditherer` for every frame of a sequence to dither it
+    temporally coherently instead of frame by frame. settings["pipeline"]
+    selects "fast" (default) or the original step-by-step "reference"
+    pipeline; they differ only by resampling rounding.
+    """
+    target_w = settings.get("width", 128)
+    target_h = settings.get("height", 64)
+
+    if settings.get("pipeline", "fast") == "reference":
+        processed = _reference_pipeline(img, settings, ditherer)
+    else:
+        processed = _fast_pipeline(img, settings, ditherer)
+
+    canvas = Canvas(target_w, target_h)
+    canvas.image = processed
+    
+    return {
+        "name": filename,
+        "canvas": canvas,
+        "preview_image": processed,
+        "width": target_w,
+        "height": target_h
+    }
+
+
+_ROTATIONS = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+
+def _threshold_lut(threshold: int, invert: bool) -> List[int]:
+    on, off = (0, 255) if invert else (255, 0)
+    return [on if p >= threshold else off for p in range(256)]
+
+
+def _contain_size(size: Tuple[int, int], target: Tuple[int, int]) -> Tuple[int, int]:
+    """Size ImageOps.contain would produce."""
+    w, h = size
+    target_w, target_h = target
+    im_ratio, dest_ratio = w / h, target_w / target_h
+    if im_ratio > dest_ratio:
+        new_h = round(h / w * target_w)
+        if new_h != target_h:
+            return target_w, new_h
+    elif im_ratio < dest_ratio:
+        new_w = round(w / h * target_h)
+        if new_w != target_w:
+            return new_w, target_h
+    return target_w, target_h
+
+
+def _fast_pipeline(img: Image.Image, settings: Dict, ditherer=None) -> Image.Image:
+    """Grayscale once, one resample, one paste, then a LUT threshold with
+    invert folded in (no per-pixel Python) or dithering.
+
+    Rotation is a lossless transpose applied to whichever side of the
+    resample is smaller; a single affine transform would save nothing
+    and PIL's transform() has no antialiasing filter for downscaling.
+    """
+    target_w = settings.get("width", 128)
+    target_h = settings.get("height", 64)
+    bg_value = 255 if settings.get("background", "black") == "white" else 0
+    scale_mode = settings.get("scale_mode", "fit")
+    dither_method = settings.get("dither", "floyd-steinberg")
+    threshold = settings.get("threshold", 128)
+    invert = settings.get("invert", False)
+    transpose = _ROTATIONS.get(settings.get("rotate", 0))
+
+    # 1. Grayscale + alpha composite onto the background, in L
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        la = img.convert("LA")
+        gray = Image.new("L", img.size, bg_value)
+        gray.paste(la.getchannel("L"), mask=la.getchannel("A"))
+    else:
+        gray = img if img.mode == "L" else img.convert("L")
+
+    # 2. Rotate + scale: one LANCZOS resample
+    swap = transpose in (Image.Transpose.ROTATE_90, Image.Transpose.ROTATE_270)
+    rotated_size = gray.size[::-1] if swap else gray.size
+    if scale_mode == "fit":
+        size = _contain_size(rotated_size, (target_w, target_h))
+    elif scale_mode == "stretch":
+        size = (target_w, target_h)
+    else:
+        size = rotated_size
+
+    if size != rotated_size:
+        if transpose is not None and size[0] * size[1] > gray.width * gray.height:
+            gray = gray.transpose(transpose)  # upscaling: rotate the smaller side
+            transpose = None
+        elif swap:
+            size = size[::-1]
+        gray = gray.resize(size, resample=Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+    if transpose is not None:
+        gray = gray.transpose(transpose)
+
+    # 3. Pad / crop onto the target canvas
+    if gray.size != (target_w, target_h):
+        canvas_img = Image.new("L", (target_w, target_h), bg_value)
+        if scale_mode == "original":
+            canvas_img.paste(gray, (0, 0))
+        else:
+            canvas_img.paste(gray, ((target_w - gray.width) // 2, (target_h - gray.height) // 2))
+    else:
+        canvas_img = gray
+
+    # 4. Threshold (invert folded into the LUT) or dither
+    if ditherer is None and dither_method == "simple":
+        return canvas_img.point(_threshold_lut(threshold, invert), "1")
+    if ditherer is not None:
+        processed = ditherer.dither(canvas_img)
+    else:
+        processed = apply_dithering(canvas_img, dither_method)
+    # 5. Invert the 1-bit result in place of the L round-trip
+    return ImageChops.invert(processed) if invert else processed
+
+
+def _reference_pipeline(img: Image.Image, settings: Dict, ditherer=None) -> Image.Image:
+    """The original step-by-step pipeline (RGB composite, resample in RGB,
+    paste, dither, invert round-trip); kept for comparison."""
     target_w = settings.get("width", 128)
     target_h = settings.get("height", 64)
     bg_color = settings.get("background", "black")  # default to black background
@@ -113,7 +265,9 @@ def process_image(
 
     # 5. Dithering / Threshold
     # We apply specific threshold if method is simple
-    if dither_method == "simple":
+    if ditherer is not None:
+        processed = ditherer.dither(canvas_img)
+    elif dither_method == "simple":
         # Custom threshold logic (apply_threshold uses a fixed val, let's just use point)
         processed = canvas_img.point(lambda p: 255 if p >= threshold else 0).convert("1")
     else:
@@ -126,17 +280,7 @@ def process_image(
     if invert:
         processed = ImageOps.invert(processed.convert("L")).convert("1")
 
-    # 7. Create Canvas Object
-    canvas = Canvas(target_w, target_h)
-    canvas.image = processed
-    
-    return {
-        "name": filename,
-        "canvas": canvas,
-        "preview_image": processed,
-        "width": target_w,
-        "height": target_h
-    }
+    return processed
 
 
 def process_zip(file_stream: Union[str, bytes, io.BytesIO], settings: Dict) -> List[Dict]:
@@ -159,6 +303,87 @@ def process_zip(file_stream: Union[str, bytes, io.BytesIO], settings: Dict) -> L
     return results
 
 
+def _is_image_member(filename: str) -> bool:
+    name = filename.lower()
+    return name.endswith(VALID_EXTENSIONS) and not name.startswith("__macosx")
+
+
+def _convert_member(data: bytes, filename: str, settings: Dict, fmt: str) -> Tuple:
+    """Pool worker: (name, packed frame bytes, None) or (name, None, error)."""
+    res = process_image(io.BytesIO(data), filename, settings)
+    if "error" in res:
+        return filename, None, res["error"]
+    return filename, res["canvas"].to_bytes(fmt), None
+
+
+def iter_zip_frames(
+    file_stream: Union[str, io.IOBase],
+    settings: Dict,
+    fmt: str = "horizontal",
+    jobs: int = None,
+) -> Iterator[Tuple]:
+    """Convert every image in a ZIP, yielding (name, packed bytes, error)
+    in name order as soon as each is ready.
+
+    Members are read one at a time and spread over a process pool; at most
+    two per worker are in flight, so memory stays bounded however large
+    the archive is. `file_stream` only needs to be seekable.
+    """
+    with zipfile.ZipFile(file_stream) as z:
+        names = sorted(n for n in z.namelist() if _is_image_member(n))
+        workers = jobs or os.cpu_count() or 1
+
+        if workers == 1 or len(names) < PARALLEL_MIN_IMAGES:
+            for name in names:
+                yield _convert_member(z.read(name), name, settings, fmt)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            in_flight = deque()
+            for name in names:
+                in_flight.append(pool.submit(_convert_member, z.read(name), name, settings, fmt))
+                if len(in_flight) >= 2 * workers:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+
+def convert_zip(
+    file_stream: Union[str, io.IOBase],
+    settings: Dict,
+    fmt: str = "horizontal",
+    jobs: int = None,
+) -> Dict:
+    """Convert a ZIP of images into one packed multi-frame array.
+
+    Returns:
+        Dict with keys: names (converted members, in order), errors
+        ([{"name", "error"}]), width, height, fmt, frame_size and data
+        (all frames concatenated, `frame_size` bytes each)
+    """
+    names, errors, chunks = [], [], []
+    for name, packed, error in iter_zip_frames(file_stream, settings, fmt, jobs):
+        if error is not None:
+            errors.append({"name": name, "error": error})
+            continue
+        names.append(name)
+        chunks.append(packed)
+
+    width = settings.get("width", 128)
+    height = settings.get("height", 64)
+    return {
+        "names": names,
+        "errors": errors,
+        "width": width,
+        "height": height,
+        "fmt": fmt,
+        "frame_size": len(chunks[0]) if chunks else (width * height) // 8,
+        "data": b"".join(chunks),
+    }
+
+
 def bytes_to_image(
     hex_string: str, 
     width: int, 
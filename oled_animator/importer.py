@@ -0,0 +1,156 @@
+"""
+Importer — streams animated images and video into 1-bit frames.
+
+Animated GIF, APNG and WebP are decoded frame by frame with
+PIL.ImageSequence; video is piped through ffmpeg as raw grayscale
+frames. Each source frame goes through the image2cpp pipeline (scale
+mode, dithering, invert) as soon as it is decoded and is then dropped,
+so only the small 1-bit Canvases are kept, however long the clip.
+
+Frames are dithered as a sequence by default (settings "temporal"):
+areas whose source did not change keep their previous pixels instead
+of shimmering, which is what keeps delta exports small.
+
+Usage:
+  python main.py --import clip.gif
+  python main.py --import clip.mp4 --import-fps 15 --import-size 128x64
+"""
+
+import json
+import shutil
+import subprocess
+from typing import Dict, Iterator, Tuple
+
+from PIL import Image, ImageSequence
+
+from .dither import SequenceDitherer
+from .image_converter import convert_image
+
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".m4v", ".mkv", ".avi", ".webm", ".mpg", ".mpeg")
+DEFAULT_FPS = 15
+
+
+class ImportSourceError(Exception):
+    """Raised when a source cannot be decoded."""
+
+
+def is_video(path: str) -> bool:
+    return path.lower().endswith(VIDEO_EXTENSIONS)
+
+
+def make_ditherer(settings: Dict):
+    """SequenceDitherer for the settings, or None when "temporal" is off."""
+    if not settings.get("temporal", True):
+        return None
+    return SequenceDitherer(
+        settings.get("dither", "floyd-steinberg"), settings.get("threshold", 128),
+    )
+
+
+def iter_image_frames(path: str, settings: Dict, ditherer=None) -> Iterator[Tuple]:
+    """Yield (Canvas, duration_ms) for every frame of an animated (or
+    still) GIF, APNG or WebP."""
+    try:
+        img = Image.open(path)
+    except OSError as e:
+        raise ImportSourceError(str(e)) from e
+
+    with img:
+        for i, frame in enumerate(ImageSequence.Iterator(img)):
+            duration = frame.info.get("duration") or 0
+            # convert() copies the composited frame, so the decoder can move on
+            res = convert_image(frame.convert("RGBA"), f"{path}#{i}", settings, ditherer)
+            yield res["canvas"], duration
+
+
+def probe_video(path: str) -> Tuple[int, int, float]:
+    """(width, height, fps) of the first video stream, via ffprobe."""
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is None:
+        raise ImportSourceError("ffprobe not found (install ffmpeg to import video)")
+    cmd = [
+        ffprobe, "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "stream=width,height,avg_frame_rate", "-of", "json", path,
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True, text=True).stdout
+        stream = json.loads(out)["streams"][0]
+    except (subprocess.CalledProcessError, ValueError, LookupError) as e:
+        raise ImportSourceError(f"Cannot read video stream: {path}") from e
+
+    num, _, den = stream.get("avg_frame_rate", "0/1").partition("/")
+    fps = float(num) / float(den or 1) if float(den or 1) else 0.0
+    return int(stream["width"]), int(stream["height"]), fps or DEFAULT_FPS
+
+
+def iter_video_frames(path: str, settings: Dict, fps: float = None,
+                      ditherer=None) -> Iterator[Tuple]:
+    """Yield (Canvas, duration_ms) for a video decoded by ffmpeg into raw
+    8-bit grayscale frames at `fps` (the source rate by default)."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise ImportSourceError("ffmpeg not found (install ffmpeg to import video)")
+    width, height, source_fps = probe_video(path)
+    fps = fps or source_fps
+
+    cmd = [
+        ffmpeg, "-v", "error", "-i", path,
+        "-vf", f"fps={fps}", "-f", "rawvideo", "-pix_fmt", "gray", "pipe:1",
+    ]
+    frame_size = width * height
+    duration = round(1000 / fps)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        index = 0
+        while True:
+            data = proc.stdout.read(frame_size)
+            if len(data) < frame_size:
+                break
+            img = Image.frombytes("L", (width, height), data)
+            yield convert_image(img, f"{path}#{index}", settings, ditherer)["canvas"], duration
+            index += 1
+    finally:
+        proc.stdout.close()
+        proc.kill()
+        stderr = proc.stderr.read().decode("utf-8", "replace").strip()
+        proc.stderr.close()
+        if proc.wait() not in (0, -9) and stderr:
+            raise ImportSourceError(f"ffmpeg failed: {stderr}")
+
+
+def iter_frames(path: str, settings: Dict, fps: float = None,
+                ditherer=None) -> Iterator[Tuple]:
+    """Yield (Canvas, duration_ms) for any supported source."""
+    if is_video(path):
+        return iter_video_frames(path, settings, fps, ditherer)
+    return iter_image_frames(path, settings, ditherer)
+
+
+def import_animation(path: str, settings: Dict, fps: float = None) -> Dict:
+    """Decode a whole source into frames ready for the exporters.
+
+    Returns:
+        Dict with keys: frames (Canvas list), fps, width, height and
+        reused_pct (pixels kept by temporal dithering, 0 when off)
+    """
+    ditherer = make_ditherer(settings)
+    frames, durations = [], []
+    for canvas, duration in iter_frames(path, settings, fps, ditherer):
+        frames.append(canvas)
+        durations.append(duration)
+    if not frames:
+        raise ImportSourceError(f"No frames decoded from {path}")
+
+    if not fps:
+        # Animated images: average frame delay (GIF delays are per frame)
+        total_ms = sum(d for d in durations if d > 0)
+        timed = sum(1 for d in durations if d > 0)
+        fps = round(1000 * timed / total_ms) if total_ms else DEFAULT_FPS
+
+    return {
+        "frames": frames,
+        "fps": max(1, round(fps)),
+        "width": frames[0].width,
+        "height": frames[0].height,
+        "reused_pct": ditherer.reused_pct if ditherer else 0.0,
+    }
@@ -0,0 +1,132 @@
+"""
+Incremental Renderer — re-renders only the frames affected by an edit.
+
+Keeps the element list and frames of the previous render. The next render
+diffs the new element list against the old one: keyframe edits only dirty
+the spans between their neighbouring keyframes, every other frame is
+reused from the previous render. A sprite, sprite sheet or font whose
+size or mtime changed on disk dirties every frame.
+"""
+
+import copy
+import math
+
+from .dsl import collect_dependencies
+from .engine import ANIMATABLE_PROPS
+from .manifest import file_stat
+
+
+class IncrementalRenderer:
+    """Caches the last render of a scene and re-renders only dirty frames."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.size = None
+        self.elements = None
+        self.dependencies = None
+        self.frames = []
+        self.rendered = 0  # frames actually drawn by the last render()
+
+    def render(self, anim, start: int = 0, stop: int = None, step: int = 1) -> list:
+        """Render frames `range(start, stop, step)` of `anim` (all by
+        default), reusing every frame the edit did not touch.
+
+        Dirty frames outside the range are dropped from the cache and
+        rendered by a later call that asks for them.
+        """
+        total = anim.total_frames
+        size = (anim.width, anim.height)
+        dependencies = dependency_stats(anim.elements)
+
+        if self.elements is None or size != self.size or dependencies != self.dependencies:
+            dirty = set(range(total))
+        else:
+            dirty = dirty_frames(self.elements, anim.elements, total)
+
+        frames = self.frames[:total] + [None] * max(0, total - len(self.frames))
+        for i in dirty:
+            frames[i] = None
+
+        indices = anim.frame_range(start, stop, step)
+        todo = [i for i in indices if frames[i] is None]
+        if todo:
+            ops = anim.compile()
+            for i in todo:
+                frames[i] = anim.render_frame(i, ops)
+
+        self.rendered = len(todo)
+        self.size = size
+        self.elements = copy.deepcopy(anim.elements)
+        self.dependencies = dependencies
+        self.frames = frames
+        return [frames[i] for i in indices]
+
+
+def dependency_stats(elements: list) -> dict:
+    """{path: (size, mtime_ns) or None} of every file the elements load
+    (sprites, sprite sheets, fonts); compare two to detect asset edits."""
+    return {path: file_stat(path) for path in collect_dependencies(elements)}
+
+
+def dirty_frames(old_elements: list, new_elements: list, total_frames: int) -> set:
+    """Return the set of frame indices whose pixels may differ between
+    two element lists."""
+    all_frames = set(range(total_frames))
+
+    if len(old_elements) != len(new_elements):
+        return all_frames
+
+    dirty = set()
+    for old, new in zip(old_elements, new_elements):
+        if old == new:
+            continue
+        if old["type"] != new["type"] or old.get("props") != new.get("props"):
+            return all_frames
+        dirty |= _keyframe_dirty_frames(
+            old.get("keyframes", []), new.get("keyframes", []), total_frames,
+        )
+        if len(dirty) == total_frames:
+            break
+
+    return dirty
+
+
+def _keyframe_dirty_frames(old_kf: list, new_kf: list, total_frames: int) -> set:
+    """Frames affected by a keyframe edit: for every added, removed or
+    modified keyframe, the span between its neighbouring keyframes of each
+    property it animates (in both the old and the new timeline)."""
+    old_keys = [_kf_key(k) for k in old_kf]
+    new_keys = [_kf_key(k) for k in new_kf]
+
+    if sorted(old_keys) == sorted(new_keys):
+        # Same keyframes, different order: only matters when two keyframes
+        # share a frame, since the engine keeps the original order for those.
+        if _sorted_by_frame(old_kf) == _sorted_by_frame(new_kf):
+            return set()
+        return set(range(total_frames))
+
+    changed = [k for k, key in zip(old_kf, old_keys) if key not in new_keys]
+    changed += [k for k, key in zip(new_kf, new_keys) if key not in old_keys]
+
+    last = total_frames - 1
+    dirty = set()
+    for kf in changed:
+        frame = kf["frame"]
+        for prop_name in ANIMATABLE_PROPS.intersection(kf):
+            for timeline in (old_kf, new_kf):
+                prop_frames = [k["frame"] for k in timeline if prop_name in k]
+                prev = max((f for f in prop_frames if f < frame), default=0)
+                nxt = min((f for f in prop_frames if f > frame), default=last)
+                dirty.update(range(max(0, math.floor(prev)), min(last, math.ceil(nxt)) + 1))
+
+    return dirty
+
+
+def _kf_key(kf: dict) -> str:
+    return repr(sorted(kf.items()))
+
+
+def _sorted_by_frame(keyframes: list) -> list:
+    return [_kf_key(k) for k in sorted(keyframes, key=lambda k: k["frame"])]
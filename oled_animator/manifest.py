@@ -0,0 +1,98 @@
+"""
+Build Manifest — records every input file (scene YAML, sprites, fonts)
+and output of a scene with its size, mtime and content hash.
+
+Deciding whether outputs are stale costs one stat() per recorded file;
+files are only re-hashed when their stat changed (e.g. touched but
+identical content).
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = "build_manifest.json"
+
+
+def hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_record(path: str):
+    """{"size", "mtime_ns", "sha256"} for a file, or None if it is missing."""
+    try:
+        st = os.stat(path)
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": hash_file(path)}
+    except OSError:
+        return None
+
+
+def file_stat(path: str):
+    """(size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def file_changed(path: str, record) -> bool:
+    """True if `path` no longer matches its manifest record."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return record is not None
+    if record is None or st.st_size != record["size"]:
+        return True
+    if st.st_mtime_ns == record["mtime_ns"]:
+        return False
+    return hash_file(path) != record["sha256"]
+
+
+def make_entry(inputs: list, outputs: list, options_hash: str) -> dict:
+    return {
+        "options": options_hash,
+        "inputs": {p: file_record(p) for p in inputs},
+        "outputs": {p: file_record(p) for p in outputs},
+    }
+
+
+def stale_reason(entry, options_hash: str):
+    """Why a scene must be rebuilt, or None if all its outputs are fresh."""
+    if not entry:
+        return "never built"
+    if entry.get("options") != options_hash:
+        return "build options changed"
+    for path, record in entry.get("inputs", {}).items():
+        if file_changed(path, record):
+            return f"{os.path.basename(path)} changed"
+    for path, record in entry.get("outputs", {}).items():
+        if record is None or file_changed(path, record):
+            return f"{os.path.basename(path)} missing or modified"
+    return None
+
+
+def options_hash(options: dict) -> str:
+    return hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_dir: str) -> dict:
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"scenes": {}}
+
+
+def save_manifest(output_dir: str, manifest: dict):
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -1,25 +1,49 @@
 """
 Drawing primitives for OLED canvas.
 
-Supports: rect, circle, line, text (TTF), sprite (PNG).
+Supports: rect, circle, line, text (TTF), sprite (PNG),
+spritesheet (PNG sheet or svg2sprite C header, sliced into cells).
 Anti-aliasing via 4x supersampling + dithering on edges.
 """
 
+import os
+import re
+from functools import lru_cache
+
 from PIL import Image, ImageDraw, ImageFont
 from .canvas import Canvas
 from .dither import apply_dithering, apply_threshold
+from .profiler import span
 
-DEFAULT_FONT = ImageFont.load_default()
 AA_SCALE = 4
+AA_MARGIN = 4  # LANCZOS downsampling bleeds up to 3px past the shape edge
+
+# svg2sprite C headers: "// Size: WxH" and one row-major, MSB-first array
+_HEADER_SIZE_RE = re.compile(r"//\s*Size:\s*(\d+)\s*x\s*(\d+)")
+_HEADER_ARRAY_RE = re.compile(r"\{([^}]*)\}")
 
 
 def _load_font(font_path: str = None, font_size: int = 10) -> ImageFont.ImageFont:
+    """Load a TTF, cached until the file changes; PIL's font if it fails."""
     if font_path:
         try:
-            return ImageFont.truetype(font_path, font_size)
+            st = os.stat(font_path)
+            return _load_truetype(font_path, font_size, st.st_mtime_ns, st.st_size)
         except (IOError, OSError):
             pass
-    return DEFAULT_FONT
+    return default_font()
+
+
+@lru_cache(maxsize=64)
+def _load_truetype(font_path: str, font_size: int, mtime_ns: int, size: int):
+    return ImageFont.truetype(font_path, font_size)
+
+
+@lru_cache(maxsize=1)
+def default_font() -> ImageFont.ImageFont:
+    """PIL's built-in font, loaded on first text draw rather than at import."""
+    with span("font:load_default"):
+        return ImageFont.load_default()
 
 
 def _normalize_coords(x0, y0, x1, y1):
@@ -110,25 +134,190 @@ def draw_text(canvas: Canvas, x: int, y: int, text: str,
 
 def draw_sprite(canvas: Canvas, x: int, y: int, src: str,
                 dithering: bool = False):
-    """Paste a PNG sprite onto the canvas at (x, y).
+    """Paste a PNG sprite onto the canvas at (x, y)."""
+    canvas.image.paste(1, (x, y), mask=load_sprite(src, dithering))
+
+
+def load_sprite(src: str, dithering: bool = False) -> Image.Image:
+    """Decode a sprite into a 1-bit mask, cached until the file changes.
 
     Handles RGBA images by compositing onto black background first.
+    The returned image is shared — do not modify it.
     """
+    st = os.stat(src)
+    return _load_sprite_mask(src, dithering, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_sprite_mask(src: str, dithering: bool, mtime_ns: int, size: int) -> Image.Image:
     sprite = Image.open(src).convert("RGBA")
     bg = Image.new("RGBA", sprite.size, (0, 0, 0, 255))
     composited = Image.alpha_composite(bg, sprite).convert("L")
 
     if dithering:
-        mono = apply_dithering(composited)
+        return apply_dithering(composited)
+    return apply_threshold(composited)
+
+
+def draw_spritesheet(canvas: Canvas, x: int, y: int, src: str, cell: int = 0,
+                     cell_w: int = 0, cell_h: int = 0, dithering: bool = False):
+    """Paste one cell of a sprite sheet onto the canvas at (x, y)."""
+    canvas.image.paste(1, (x, y), mask=sheet_cell(src, cell, cell_w, cell_h, dithering))
+
+
+def sheet_cell(src: str, cell: int, cell_w: int = 0, cell_h: int = 0,
+               dithering: bool = False) -> Image.Image:
+    """1-bit mask of a sheet cell. Cells are read row by row; the index
+    wraps around, so a `cell` track can loop a cycle. `cell_h` defaults
+    to the sheet height and `cell_w` to `cell_h` (square cells)."""
+    cells = load_sheet_cells(src, cell_w, cell_h, dithering)
+    return cells[cell % len(cells)]
+
+
+def load_sheet_cells(src: str, cell_w: int = 0, cell_h: int = 0,
+                     dithering: bool = False) -> tuple:
+    """Decode and slice a sheet once, cached until the file changes.
+
+    The returned masks are shared — do not modify them.
+    """
+    st = os.stat(src)
+    return _load_sheet_cells(src, cell_w, cell_h, dithering, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _load_sheet_cells(src: str, cell_w: int, cell_h: int, dithering: bool,
+                      mtime_ns: int, size: int) -> tuple:
+    if src.lower().endswith(".h"):
+        sheet = load_c_bitmap(src)
     else:
-        mono = apply_threshold(composited)
-
-    mono_pixels = mono.load()
-    sw, sh = sprite.size
-    for sy in range(sh):
-        for sx in range(sw):
-            px = x + sx
-            py = y + sy
-            if 0 <= px < canvas.width and 0 <= py < canvas.height:
-                if mono_pixels[sx, sy]:
-                    canvas.set_pixel(px, py, 1)
+        sheet = load_sprite(src, dithering)
+
+    cell_h = cell_h if cell_h > 0 else sheet.height
+    cell_w = cell_w if cell_w > 0 else cell_h
+    cols, rows = sheet.width // cell_w, sheet.height // cell_h
+    if cols == 0 or rows == 0:
+        raise ValueError(
+            f"Sprite sheet {src} ({sheet.width}x{sheet.height}) is smaller "
+            f"than one {cell_w}x{cell_h} cell"
+        )
+    return tuple(
+        sheet.crop((c * cell_w, r * cell_h, (c + 1) * cell_w, (r + 1) * cell_h))
+        for r in range(rows) for c in range(cols)
+    )
+
+
+def load_c_bitmap(path: str) -> Image.Image:
+    """Read a C header written by svg2sprite back into a 1-bit image."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    size = _HEADER_SIZE_RE.search(text)
+    array = _HEADER_ARRAY_RE.search(text)
+    if size is None or array is None:
+        raise ValueError(f"{path}: expected a '// Size: WxH' comment and a byte array")
+
+    width, height = int(size.group(1)), int(size.group(2))
+    data = bytes(int(v, 16) for v in re.findall(r"0[xX]([0-9a-fA-F]{1,2})", array.group(1)))
+    expected = (width + 7) // 8 * height
+    if len(data) < expected:
+        raise ValueError(f"{path}: {len(data)} bytes, {width}x{height} needs {expected}")
+    # Mode "1" raw data is row-major, MSB first, rows padded to a byte
+    return Image.frombytes("1", (width, height), data[:expected])
+
+
+# ───────────────────────────────────
+# Bounding boxes (inclusive x0, y0, x1, y1)
+# ───────────────────────────────────
+
+def bbox_rect(x: int, y: int, w: int, h: int, fill: bool = True, **_) -> tuple:
+    x0, y0, x1, y1 = _normalize_coords(x, y, x + w - 1, y + h - 1)
+    if not fill:
+        # PIL outlines a one-pixel-thin rectangle one pixel past its coords
+        if x0 == x1:
+            x0, x1 = x0 - 1, x1 + 1
+        if y0 == y1:
+            y0, y1 = y0 - 1, y1 + 1
+    return (x0, y0, x1, y1)
+
+
+def bbox_circle(cx: int, cy: int, r: int, anti_alias: bool = False, **_) -> tuple:
+    r = abs(r)
+    pad = AA_MARGIN if anti_alias else 0
+    return (cx - r - pad, cy - r - pad, cx + r + pad, cy + r + pad)
+
+
+def bbox_line(x1: int, y1: int, x2: int, y2: int, anti_alias: bool = False, **_) -> tuple:
+    pad = AA_MARGIN if anti_alias else 1
+    x0, y0, x1, y1 = _normalize_coords(x1, y1, x2, y2)
+    return (x0 - pad, y0 - pad, x1 + pad, y1 + pad)
+
+
+def bbox_text(x: int, y: int, text: str, font_size: int = 10,
+              font_path: str = None, **_) -> tuple:
+    extent = _text_extent(text, _load_font(font_path, font_size))
+    if extent is None:
+        return None
+    left, top, right, bottom = extent
+    return (x + left, y + top, x + right, y + bottom)
+
+
+@lru_cache(maxsize=256)
+def _text_extent(text: str, font):
+    """Pixels draw_text sets, relative to (x, y), or None if it sets none.
+
+    font.getbbox() undershoots the 1-bit glyphs (e.g. the tail of "j"),
+    so the text is drawn once the way draw_text does and measured.
+    """
+    if not text:
+        return None
+    draw = ImageDraw.Draw(Image.new("1", (1, 1)))
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    pad = bottom - top + 2
+    image = Image.new("1", (right - left + 2 * pad, bottom - top + 2 * pad), 0)
+    ImageDraw.Draw(image).text((pad - left, pad - top), text, fill=1, font=font)
+    box = image.getbbox()
+    if box is None:
+        return None
+    x0, y0, x1, y1 = box
+    dx, dy = left - pad, top - pad
+    return (x0 + dx, y0 + dy, x1 - 1 + dx, y1 - 1 + dy)
+
+
+def bbox_sprite(x: int, y: int, src: str, dithering: bool = False, **_) -> tuple:
+    sw, sh = load_sprite(src, dithering).size
+    return (x, y, x + sw - 1, y + sh - 1)
+
+
+def bbox_spritesheet(x: int, y: int, src: str, cell: int = 0, cell_w: int = 0,
+                     cell_h: int = 0, dithering: bool = False, **_) -> tuple:
+    sw, sh = sheet_cell(src, cell, cell_w, cell_h, dithering).size
+    return (x, y, x + sw - 1, y + sh - 1)
+
+
+BBOX_DISPATCH = {
+    "rect": bbox_rect,
+    "circle": bbox_circle,
+    "line": bbox_line,
+    "text": bbox_text,
+    "sprite": bbox_sprite,
+    "spritesheet": bbox_spritesheet,
+}
+
+
+def element_bbox(elem_type: str, args: dict, width: int, height: int):
+    """Bounding box of an element's pixels, clipped to the canvas.
+
+    Returns None when the element cannot touch any pixel.
+    """
+    return clip_bbox(BBOX_DISPATCH[elem_type](**args), width, height)
+
+
+def clip_bbox(box: tuple, width: int, height: int):
+    """Clip an inclusive bbox to the canvas, None if nothing is left."""
+    if box is None:
+        return None
+    x0, y0, x1, y1 = box
+    x0, y0 = max(0, x0), max(0, y0)
+    x1, y1 = min(width - 1, x1), min(height - 1, y1)
+    if x0 > x1 or y0 > y1:
+        return None
+    return (x0, y0, x1, y1)
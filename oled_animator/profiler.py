@@ -0,0 +1,120 @@
+"""
+Profiler — per-stage and per-element render timing.
+
+Disabled by default: `span()` returns a shared no-op context manager
+until a Profiler is activated, so instrumented code costs ~nothing.
+Reports can be printed as a sorted table or dumped as Chrome
+trace-event JSON (open in chrome://tracing or ui.perfetto.dev).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+_active = None
+_NULL_SPAN = nullcontext()
+
+
+class Profiler:
+    """Collects timings per stage and per element id."""
+
+    def __init__(self):
+        self.stages = {}    # name -> [total_s, calls, category]
+        self.elements = {}  # id -> [total_s, calls, type]
+        self.events = []    # Chrome trace "complete" events
+        self._origin = time.perf_counter()
+
+    def add(self, name: str, start: float, end: float, category: str = "stage"):
+        """Record a finished span (perf_counter timestamps)."""
+        entry = self.stages.setdefault(name, [0.0, 0, category])
+        entry[0] += end - start
+        entry[1] += 1
+        self._event(name, category, start, end)
+
+    def add_element(self, elem_id: str, elem_type: str, start: float, end: float):
+        """Record one draw of an element (also counted under draw:<type>)."""
+        entry = self.elements.setdefault(elem_id, [0.0, 0, elem_type])
+        entry[0] += end - start
+        entry[1] += 1
+        self.add(f"draw:{elem_type}", start, end, category="draw")
+        self.events[-1]["args"] = {"id": elem_id}
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage"):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter(), category)
+
+    def _event(self, name, category, start, end):
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        })
+
+    def report(self, top: int = 20) -> str:
+        """Sorted stage, import and element tables. Stage times are inclusive
+        (e.g. `dither` inside an anti-aliased draw counts in both)."""
+        ranked_stages = sorted(self.stages.items(), key=lambda kv: -kv[1][0])
+        lines = [f"   {'Stage':<28}{'Total ms':>10}{'Calls':>8}{'Avg ms':>10}"]
+        for name, (total, calls, category) in ranked_stages:
+            if category != "import":
+                lines.append(f"   {name:<28}{total * 1000:>10.1f}{calls:>8}{total * 1000 / calls:>10.3f}")
+
+        imports = [(name, total) for name, (total, _, category) in ranked_stages if category == "import"]
+        if imports:
+            lines.append("")
+            lines.append(f"   {'Import':<28}{'Total ms':>10}")
+            for name, total in imports:
+                lines.append(f"   {name:<28}{total * 1000:>10.1f}")
+
+        if self.elements:
+            lines.append("")
+            lines.append(f"   {'Element':<20}{'Type':<8}{'Total ms':>10}{'Calls':>8}{'Avg ms':>10}")
+            ranked = sorted(self.elements.items(), key=lambda kv: -kv[1][0])
+            for elem_id, (total, calls, elem_type) in ranked[:top]:
+                lines.append(
+                    f"   {str(elem_id):<20}{elem_type:<8}{total * 1000:>10.1f}"
+                    f"{calls:>8}{total * 1000 / calls:>10.3f}"
+                )
+            if len(ranked) > top:
+                lines.append(f"   ... {len(ranked) - top} more elements")
+
+        return "\n".join(lines)
+
+    def write_trace(self, path: str):
+        """Write Chrome trace-event JSON."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+
+def activate(profiler: Profiler) -> Profiler:
+    global _active
+    _active = profiler
+    return profiler
+
+
+def deactivate():
+    global _active
+    _active = None
+
+
+def active():
+    """The active Profiler, or None when profiling is off."""
+    return _active
+
+
+def span(name: str, category: str = "stage"):
+    """Time a block under `name` if profiling is on, else do nothing."""
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, category)
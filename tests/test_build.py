@@ -0,0 +1,41 @@
+"""A broken scene fails on its own; the rest of the build is recorded."""
+
+import json
+
+import pytest
+
+from oled_animator.build import build
+from oled_animator.manifest import MANIFEST_NAME
+
+
+GOOD = """\
+screen: {width: 16, height: 8, fps: 10, frames: 4}
+elements:
+  - type: rect
+    props: {x: 0, y: 0, w: 4, h: 4}
+    keyframes:
+      - {frame: 0, x: 0}
+      - {frame: 3, x: 8}
+"""
+
+BROKEN = {
+    "bad_yaml.yaml": "screen: {width: 16, height: 8\nelements: [",
+    "no_frame.yaml": GOOD.replace("{frame: 3, x: 8}", "{x: 8}"),
+}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_broken_scenes_fail_alone_and_manifest_is_saved(tmp_path, jobs):
+    scenes = tmp_path / "scenes"
+    scenes.mkdir()
+    (scenes / "good.yaml").write_text(GOOD)
+    for name, text in BROKEN.items():
+        (scenes / name).write_text(text)
+    out = tmp_path / "out"
+
+    summary = build([str(scenes)], str(out), jobs=jobs, gif=False, log=lambda msg: None)
+
+    assert summary == {"built": 1, "skipped": 0, "failed": 2, "scenes": 3}
+    manifest = json.loads((out / MANIFEST_NAME).read_text())
+    assert list(manifest["scenes"]) == ["good.yaml"]
+    assert (out / "good" / "animation.h").is_file()
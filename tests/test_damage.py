@@ -0,0 +1,96 @@
+"""render_damaged() must produce exactly the frames render_all() does."""
+
+import random
+
+import pytest
+
+from oled_animator.engine import Animation
+
+
+TEXTS = ("Hello jpq", "gjpq", "Wi-Fi", "A", "0:42", "|_|")
+
+
+def _keyframes(rng, total, props):
+    frames = sorted(rng.sample(range(total), 3))
+    return [
+        dict({name: rng.randint(lo, hi) for name, (lo, hi) in props.items()},
+             frame=f, easing=rng.choice(("linear", "ease-in-out", "bounce")))
+        for f in frames
+    ]
+
+
+def _random_element(rng, total):
+    kind = rng.choice(("rect", "outline", "thin", "circle", "line", "text", "text"))
+    if kind == "text":
+        return {
+            "type": "text",
+            "props": {"text": rng.choice(TEXTS), "x": 0, "y": 0},
+            "keyframes": _keyframes(rng, total, {"x": (-20, 130), "y": (-10, 66)}),
+        }
+    if kind == "circle":
+        return {
+            "type": "circle",
+            "props": {"r": rng.randint(1, 12), "fill": rng.random() < 0.5,
+                      "anti_alias": rng.random() < 0.2},
+            "keyframes": _keyframes(rng, total, {"cx": (-10, 138), "cy": (-10, 74)}),
+        }
+    if kind == "line":
+        return {
+            "type": "line",
+            "keyframes": _keyframes(rng, total, {
+                "x1": (-10, 138), "y1": (-10, 74), "x2": (-10, 138), "y2": (-10, 74),
+            }),
+        }
+    # Filled, outlined and one-pixel-thin outlined rects
+    size = (-3, 3) if kind == "thin" else (-20, 40)
+    return {
+        "type": "rect",
+        "props": {"fill": kind == "rect"},
+        "keyframes": _keyframes(rng, total, {
+            "x": (-10, 128), "y": (-10, 64), "w": size, "h": size,
+        }),
+    }
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_render_damaged_matches_render_all(seed):
+    rng = random.Random(seed)
+    anim = Animation(128, 64, fps=24, total_frames=30)
+    for _ in range(rng.randint(1, 6)):
+        anim.add_element(_random_element(rng, anim.total_frames))
+
+    damaged, _ = anim.render_damaged()
+    full = anim.render_all()
+
+    assert len(damaged) == len(full)
+    for i, (a, b) in enumerate(zip(damaged, full)):
+        assert a.image.tobytes() == b.image.tobytes(), f"frame {i} differs"
+
+
+def test_moving_descender_text_leaves_no_trail():
+    anim = Animation(128, 64, fps=24, total_frames=40)
+    anim.add_element({
+        "type": "text",
+        "props": {"text": "Hello jpq", "y": 20, "font_size": 12},
+        "keyframes": [{"frame": 0, "x": 10}, {"frame": 39, "x": 90}],
+    })
+    damaged, _ = anim.render_damaged()
+    full = anim.render_all()
+    assert [c.image.tobytes() for c in damaged] == [c.image.tobytes() for c in full]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_delta_with_damage_matches_full_compare(seed, tmp_path):
+    from oled_animator.exporters.delta import export_delta
+
+    rng = random.Random(seed)
+    anim = Animation(128, 64, fps=24, total_frames=30)
+    for _ in range(rng.randint(1, 6)):
+        anim.add_element(_random_element(rng, anim.total_frames))
+    frames = anim.render_all()
+
+    full = tmp_path / "full.h"
+    damaged = tmp_path / "damaged.h"
+    export_delta(frames, str(full), 128, 64, 24)
+    export_delta(frames, str(damaged), 128, 64, 24, damage=anim.damage())
+    assert damaged.read_text() == full.read_text()
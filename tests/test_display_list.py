@@ -0,0 +1,23 @@
+"""Display-list export emits valid C for every scene."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from oled_animator.engine import Animation
+from oled_animator.exporters.display_list import export_display_list
+
+
+@pytest.mark.parametrize("total_frames", [0, 3])
+def test_header_compiles(tmp_path, total_frames):
+    anim = Animation(16, 8, fps=10, total_frames=total_frames)
+    anim.add_element({"type": "rect", "props": {"x": 1, "y": 1, "w": 3, "h": 3}})
+    result = export_display_list(anim, str(tmp_path / "scene_dl.h"))
+    assert result["op_count"] == (1 if total_frames else 0)
+
+    if shutil.which("gcc") is None:
+        pytest.skip("gcc not installed")
+    main = tmp_path / "main.c"
+    main.write_text('#include "scene_dl.h"\nint main(void) { return scene.frame_count; }\n')
+    subprocess.run(["gcc", "-std=c99", "-pedantic-errors", "-fsyntax-only", str(main)], check=True)
@@ -0,0 +1,46 @@
+"""IncrementalRenderer re-renders frames when a sprite changes on disk."""
+
+import os
+
+from PIL import Image
+
+from oled_animator.engine import Animation
+from oled_animator.incremental import IncrementalRenderer
+
+
+def _anim(src):
+    anim = Animation(32, 16, fps=10, total_frames=6)
+    anim.add_element({
+        "type": "sprite",
+        "props": {"src": src, "y": 2},
+        "keyframes": [{"frame": 0, "x": 0}, {"frame": 5, "x": 20}],
+    })
+    return anim
+
+
+def _pixels(frames):
+    return [c.image.tobytes() for c in frames]
+
+
+def test_unchanged_scene_reuses_every_frame(tmp_path):
+    src = str(tmp_path / "a.png")
+    Image.new("1", (4, 4), 1).save(src)
+    renderer = IncrementalRenderer()
+    renderer.render(_anim(src))
+    renderer.render(_anim(src))
+    assert renderer.rendered == 0
+
+
+def test_sprite_rewritten_on_disk_dirties_all_frames(tmp_path):
+    src = str(tmp_path / "a.png")
+    Image.new("1", (4, 4), 1).save(src)
+    renderer = IncrementalRenderer()
+    renderer.render(_anim(src))
+
+    st = os.stat(src)
+    Image.new("1", (8, 8), 1).save(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    frames = renderer.render(_anim(src))
+    assert renderer.rendered == 6
+    assert _pixels(frames) == _pixels(_anim(src).render_all())
@@ -0,0 +1,101 @@
+"""Render jobs: reuse across edits and recovery from a crashed worker."""
+
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from oled_animator.dsl import parse_scene_string
+from web_preview.jobs import JobManager
+
+
+SCENE = """\
+screen: {{width: 32, height: 16, fps: 10, frames: 6}}
+elements:
+  - type: sprite
+    props: {{src: "{src}", y: 2}}
+    keyframes:
+      - {{frame: 0, x: 0}}
+      - {{frame: 5, x: 20}}
+"""
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+def _run(manager, text, base_dir):
+    job = manager.submit(text, base_dir)
+    version = -1
+    while not job.finished:
+        version = job.wait(version, 30)
+    return job
+
+
+def test_sprite_rewritten_on_disk_is_rendered_again(manager, tmp_path):
+    src = tmp_path / "a.png"
+    Image.new("1", (4, 4), 1).save(src)
+    text = SCENE.format(src=src.as_posix())
+    assert _run(manager, text, str(tmp_path)).rendered == 6
+    assert _run(manager, text, str(tmp_path)).rendered == 0
+
+    st = os.stat(src)
+    Image.new("1", (8, 8), 1).save(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    job = _run(manager, text, str(tmp_path))
+    assert job.status == "done" and job.rendered == 6
+    anim = parse_scene_string(text, str(tmp_path), cache=False)["animation"]
+    assert job.frames == [c.to_bytes("horizontal") for c in anim.render_all()]
+
+
+SLOW = """\
+screen: {width: 128, height: 64, fps: 10, frames: 400}
+elements:
+  - type: circle
+    props: {cy: 32, r: 20, anti_alias: true}
+    keyframes:
+      - {frame: 0, cx: 0}
+      - {frame: 399, cx: 128}
+"""
+
+
+def test_crashed_worker_fails_only_its_job(manager, tmp_path):
+    job = manager.submit(SLOW, str(tmp_path))
+    version = job.wait(-1, 30)
+    while not job.completed and not job.finished:
+        version = job.wait(version, 30)
+    for process in list(manager.pool._processes.values()):
+        process.kill()
+    while not job.finished:
+        version = job.wait(version, 30)
+    assert job.status == "error"
+
+    src = tmp_path / "a.png"
+    Image.new("1", (4, 4), 1).save(src)
+    assert _run(manager, SCENE.format(src=src.as_posix()), str(tmp_path)).status == "done"
+
+
+def test_export_renders_in_a_job_and_downloads_the_file():
+    from web_preview.server import create_app
+
+    client = create_app().test_client()
+    text = SLOW.replace("frames: 400", "frames: 4").replace("frame: 399", "frame: 3")
+    response = client.post("/api/export", json={"yaml": text, "type": "c_array"})
+    assert response.status_code == 202
+    job_id = response.get_json()["id"]
+
+    info = response.get_json()
+    while info["status"] == "running":
+        time.sleep(0.05)
+        info = client.get(f"/api/jobs/{job_id}").get_json()
+    assert info["status"] == "done"
+
+    exported = client.get(f"/api/jobs/{job_id}/export?type=c_array&format=page")
+    assert exported.status_code == 200
+    assert b"Frames: 4" in exported.data
+    assert client.post("/api/export", json={"yaml": text, "type": "svg"}).status_code == 400
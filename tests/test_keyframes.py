@@ -0,0 +1,46 @@
+"""Keyframe curve export rejects frames that do not fit the C tables."""
+
+import pytest
+
+from oled_animator.engine import Animation
+from oled_animator.exporters.keyframes import compile_curves, export_keyframes
+
+
+def _anim(frame):
+    anim = Animation(128, 64, fps=24, total_frames=30)
+    anim.add_element({
+        "type": "circle",
+        "id": "ball",
+        "props": {"cy": 32, "r": 4},
+        "keyframes": [{"frame": 0, "cx": 10}, {"frame": frame, "cx": 100}],
+    })
+    return anim
+
+
+@pytest.mark.parametrize("frame", [2.5, 20.0, -1, 65536, True])
+def test_compile_curves_rejects_bad_keyframe_frames(frame):
+    with pytest.raises(ValueError, match=r"Element 'ball': cx keyframe frame"):
+        compile_curves(_anim(frame))
+
+
+def test_export_keyframes_accepts_uint16_frames(tmp_path):
+    curves = compile_curves(_anim(65535))
+    assert [frame for frame, _, _ in curves["keys"]] == [0, 65535]
+    export_keyframes(_anim(20), str(tmp_path / "animation_kf.h"))
+
+
+@pytest.mark.parametrize("props, keyframe", [
+    ({"cx": 40000}, {"cy": 10}),      # static arg
+    ({"cx": -32769}, {"cy": 10}),
+    ({"cx": 10}, {"cy": 5000}),       # keyframed value (Q4 int16)
+])
+def test_compile_curves_rejects_args_outside_int16(props, keyframe):
+    anim = Animation(128, 64, fps=24, total_frames=30)
+    anim.add_element({
+        "type": "circle",
+        "id": "ball",
+        "props": dict(props, r=4),
+        "keyframes": [dict(keyframe, frame=0), {"frame": 10, "cy": 20}],
+    })
+    with pytest.raises(ValueError, match=r"Element 'ball': c[xy] = -?\d+ is out of range"):
+        compile_curves(anim)
@@ -0,0 +1,112 @@
+"""Live preview sessions: render errors and sprites changed on disk."""
+
+import json
+import os
+import time
+
+from PIL import Image
+
+from web_preview.server import create_app
+
+
+SCENE = """\
+screen:
+  width: 32
+  height: 16
+  fps: 10
+  frames: 12
+
+elements:
+  - type: sprite
+    props:
+      src: "{src}"
+    keyframes:
+      - frame: 0
+        x: 0
+      - frame: 11
+        x: 20
+"""
+
+
+def _events(response, timeout):
+    """Yield (event, data) from an SSE response, failing after `timeout`s."""
+    deadline = time.monotonic() + timeout
+    event = None
+    for chunk in response.response:
+        for line in chunk.decode("utf-8").splitlines():
+            if line.startswith(": heartbeat"):
+                assert time.monotonic() < deadline, "live session stopped rendering"
+            elif line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                yield event, json.loads(line[len("data: "):])
+
+
+def _wait_for(events, predicate):
+    for event, data in events:
+        if event == "update" and predicate(data):
+            return data
+
+
+def _patch(client, session_id, base, offset, length, text):
+    response = client.patch(f"/api/live/{session_id}", json={
+        "base": base, "edits": [[{"offset": offset, "length": length, "text": text}]],
+    })
+    assert response.status_code == 200
+    return response.get_json()["version"]
+
+
+def test_render_error_is_reported_and_next_patch_renders(tmp_path):
+    Image.new("1", (4, 4), 1).save(tmp_path / "a.png")
+    Image.new("1", (8, 8), 1).save(tmp_path / "b.png")
+    text = SCENE.format(src=(tmp_path / "a.png").as_posix())
+    name = text.index("a.png")
+
+    client = create_app().test_client()
+    created = client.post("/api/live", json={"yaml": text}).get_json()
+    stream = client.get(f"/api/live/{created['id']}/events", buffered=False)
+    events = _events(stream, timeout=10)
+    _wait_for(events, lambda u: u["pending"] == 0 and not u["error"])
+
+    # Half-typed sprite path: "a.png" -> "b.pn" parses, then fails to render
+    version = _patch(client, created["id"], created["version"], name, 5, "b.pn")
+    failed = _wait_for(events, lambda u: u["error"])
+    assert "Render failed" in failed["error"]
+
+    version = _patch(client, created["id"], version, name + 4, 0, "g")
+    fixed = []
+    done = _wait_for(events, lambda u: fixed.extend(u["frames"]) or (
+        u["version"] == version and u["pending"] == 0
+    ))
+    assert done["error"] is None
+    assert {i for i, _ in fixed} == set(range(12))
+
+    stream.close()
+    client.delete(f"/api/live/{created['id']}")
+
+
+def test_sprite_rewritten_on_disk_is_rendered_on_next_edit(tmp_path):
+    src = tmp_path / "a.png"
+    Image.new("1", (4, 4), 1).save(src)
+    text = SCENE.format(src=src.as_posix())
+
+    client = create_app().test_client()
+    created = client.post("/api/live", json={"yaml": text}).get_json()
+    stream = client.get(f"/api/live/{created['id']}/events", buffered=False)
+    events = _events(stream, timeout=10)
+    _wait_for(events, lambda u: u["pending"] == 0 and not u["error"])
+
+    st = os.stat(src)
+    Image.new("1", (8, 8), 1).save(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    # An edit that does not touch the sprite element still re-renders it
+    version = _patch(client, created["id"], created["version"], 0, 0, "# edit\n")
+    redrawn = []
+    _wait_for(events, lambda u: redrawn.extend(u["frames"]) or (
+        u["version"] == version and u["pending"] == 0
+    ))
+    assert {i for i, _ in redrawn} == set(range(12))
+
+    stream.close()
+    client.delete(f"/api/live/{created['id']}")
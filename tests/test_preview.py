@@ -0,0 +1,28 @@
+"""The CLI streams rendered frames into the preview writer."""
+
+from main import render_frames
+from oled_animator.engine import Animation
+from oled_animator.exporters.preview import open_preview, save_preview
+
+
+def _anim():
+    anim = Animation(32, 16, fps=10, total_frames=8)
+    anim.add_element({
+        "type": "rect",
+        "props": {"y": 4, "w": 6, "h": 6},
+        "keyframes": [{"frame": 0, "x": 0}, {"frame": 5, "x": 20}],
+    })
+    return anim
+
+
+def test_render_frames_feeds_the_writer_without_keeping_frames(tmp_path):
+    streamed = tmp_path / "streamed.gif"
+    writer = open_preview("gif", str(streamed), 10)
+    frames, writer = render_frames(_anim(), writer, keep=False)
+    result = writer.close()
+
+    assert frames == []
+    assert result["frame_count"] == 8
+    listed = tmp_path / "listed.gif"
+    save_preview(_anim().render_all(), str(listed), 10)
+    assert streamed.read_bytes() == listed.read_bytes()
@@ -0,0 +1,19 @@
+"""Scene thumbnails."""
+
+from PIL import Image
+
+from oled_animator.manifest import hash_file
+from web_preview.thumbnails import ThumbnailCache
+
+
+def test_zero_frame_scene_gets_a_blank_thumbnail(tmp_path):
+    scene = tmp_path / "empty.yaml"
+    scene.write_text("screen: {width: 16, height: 8, fps: 10, frames: 0}\n")
+    entry = {"path": str(scene), "sha256": hash_file(str(scene)), "dependencies": []}
+
+    path, key = ThumbnailCache(str(tmp_path / "cache")).path(entry)
+
+    assert key is not None
+    with Image.open(path) as image:
+        assert image.size == (16, 8)
+        assert image.getbbox() is None
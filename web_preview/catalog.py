@@ -0,0 +1,172 @@
+"""
+Catalog — cached, indexed listings of Studio scenes and assets.
+
+Each file's metadata (size, mtime, content hash, scene screen settings
+or image dimensions) is computed once and kept until the file's stat
+changes. The tree is re-scanned only when the filesystem watcher
+(watchdog, if installed) reports a change, or at most every
+`poll_interval` seconds without it; a scan only stats files.
+"""
+
+import os
+import threading
+import time
+
+from PIL import Image
+
+from oled_animator.dsl import parse_scene, DSLError
+from oled_animator.manifest import hash_file
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+POLL_INTERVAL_S = 2.0
+SCENE_EXTENSIONS = (".yaml", ".yml")
+IMAGE_EXTENSIONS = (".png", ".bmp", ".gif", ".jpg", ".jpeg", ".webp")
+
+
+def describe_scene(path: str) -> dict:
+    """Screen settings, element count and dependencies of a scene file."""
+    try:
+        scene = parse_scene(path)
+    except (DSLError, OSError, ValueError) as e:
+        return {"error": str(e)}
+    anim = scene["animation"]
+    return {
+        "width": anim.width,
+        "height": anim.height,
+        "fps": anim.fps,
+        "frames": anim.total_frames,
+        "elements": len(anim.elements),
+        "dependencies": scene["dependencies"],
+    }
+
+
+def describe_asset(path: str) -> dict:
+    """File type, plus dimensions (read from the header only) for images."""
+    info = {"type": os.path.splitext(path)[1].lower()}
+    if info["type"] in IMAGE_EXTENSIONS:
+        try:
+            with Image.open(path) as img:
+                info.update(width=img.width, height=img.height)
+        except OSError as e:
+            info["error"] = str(e)
+    return info
+
+
+if Observer is not None:
+    class _ChangeHandler(FileSystemEventHandler):
+        def __init__(self, catalog):
+            self.catalog = catalog
+
+        def on_any_event(self, event):
+            # Reads (including the catalog's own) change nothing
+            if event.event_type not in ("opened", "closed_no_write"):
+                self.catalog.invalidate()
+
+
+class Catalog:
+    """Cached listing of the files under `root` with the given extensions
+    (all files when `extensions` is None)."""
+
+    def __init__(self, root: str, describe, extensions: tuple = None,
+                 recursive: bool = True, poll_interval: float = POLL_INTERVAL_S):
+        self.root = root
+        self.describe = describe
+        self.extensions = extensions
+        self.recursive = recursive
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.entries = {}      # relative path -> entry
+        self.dirty = True
+        self.last_scan = 0.0
+        self.observer = None
+        self.watching = False
+
+    def invalidate(self):
+        """Force a re-scan on the next access."""
+        self.dirty = True
+
+    def list(self) -> list:
+        """Entries sorted by path, re-scanning first if needed."""
+        with self.lock:
+            if not self.watching and Observer is not None:
+                self._watch()
+            stale = self.dirty or (
+                not self.watching and time.monotonic() - self.last_scan >= self.poll_interval
+            )
+            if stale:
+                self._scan()
+            return [self.entries[rel] for rel in sorted(self.entries)]
+
+    def get(self, rel: str):
+        self.list()
+        return self.entries.get(rel)
+
+    def _watch(self):
+        """Start the watchdog observer; polling stays on if it fails
+        (e.g. inotify watch limit reached)."""
+        self.watching = True
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_ChangeHandler(self), self.root, recursive=self.recursive)
+            observer.start()
+            self.observer = observer
+        except OSError:
+            self.watching = False
+
+    def _scan(self):
+        # Clear first: events during the scan trigger another one
+        self.dirty = False
+        self.last_scan = time.monotonic()
+
+        found = {}
+        for rel, st in self._walk():
+            entry = self.entries.get(rel)
+            if entry is None or (entry["size"], entry["mtime_ns"]) != (st.st_size, st.st_mtime_ns):
+                entry = self._make_entry(rel, st)
+            found[rel] = entry
+        self.entries = found
+
+    def _walk(self):
+        """Yield (relative path, stat) of matching files."""
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    items = list(it)
+            except OSError:
+                continue
+            for item in items:
+                try:
+                    if item.is_dir():
+                        if self.recursive:
+                            stack.append(item.path)
+                    elif item.is_file() and (
+                        self.extensions is None or item.name.lower().endswith(self.extensions)
+                    ):
+                        rel = os.path.relpath(item.path, self.root).replace(os.sep, "/")
+                        yield rel, item.stat()
+                except OSError:
+                    continue
+
+    def _make_entry(self, rel: str, st) -> dict:
+        path = os.path.join(self.root, rel)
+        entry = {
+            "name": rel,
+            "path": path,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        try:
+            entry["sha256"] = hash_file(path)
+        except OSError:
+            entry["sha256"] = None
+        entry.update(self.describe(path))
+        return entry
@@ -0,0 +1,220 @@
+"""
+Render Jobs — non-blocking Studio renders on a process pool.
+
+A job renders a scene in frame chunks spread over the pool; clients poll
+its status or stream progress over Server-Sent Events. Submitting a new
+job for the same editor session cancels the previous one, and only the
+frames dirtied since that session's last finished render are rendered
+(all of them when a sprite or font it uses changed on disk).
+"""
+
+import copy
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from oled_animator.dsl import parse_scene_string
+from oled_animator.incremental import dependency_stats, dirty_frames
+
+CHUNK_FRAMES = 16
+MAX_JOBS = 64
+MAX_SESSIONS = 16
+
+
+def render_frames(yaml_text: str, base_dir: str, frame_indices: list) -> list:
+    """Pool worker: render frames and return them packed (horizontal).
+
+    Each worker's parse cache means a scene is parsed once per worker,
+    not once per chunk.
+    """
+    anim = parse_scene_string(yaml_text, base_dir)["animation"]
+    ops = anim.compile()
+    return [anim.render_frame(i, ops).to_bytes("horizontal") for i in frame_indices]
+
+
+class Job:
+    """One render request: packed frames filled in as chunks complete."""
+
+    def __init__(self, session: str, anim):
+        self.id = uuid.uuid4().hex[:12]
+        self.session = session
+        self.width = anim.width
+        self.height = anim.height
+        self.fps = anim.fps
+        self.total = anim.total_frames
+        self.elements = copy.deepcopy(anim.elements)
+        self.dependencies = dependency_stats(anim.elements)
+        self.frames = [None] * anim.total_frames
+        self.status = "running"  # running | done | error | cancelled
+        self.completed = 0       # frames available (rendered or reused)
+        self.rendered = 0        # frames actually rendered by this job
+        self.error = None
+        self.futures = []
+        self.created = time.time()
+        self.version = 0         # bumped on every change, for waiters
+        self.cond = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status != "running"
+
+    def info(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "completed": self.completed,
+            "total": self.total,
+            "rendered": self.rendered,
+            "error": self.error,
+        }
+
+    def wait(self, version: int, timeout: float) -> int:
+        """Block until the job changes past `version` (or timeout)."""
+        with self.cond:
+            if self.version == version:
+                self.cond.wait(timeout)
+            return self.version
+
+
+class JobManager:
+    """Schedules render jobs on a process pool sized to the machine."""
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers or os.cpu_count()
+        self.pool = self._new_pool()
+        self.lock = threading.Lock()
+        self.jobs = OrderedDict()       # id -> Job
+        self.active = {}                # session -> running Job
+        self.last_render = OrderedDict()  # session -> finished Job
+
+    def submit(self, yaml_text: str, base_dir: str, session: str = "default") -> Job:
+        """Start rendering; raises DSLError/OSError for invalid scenes."""
+        anim = parse_scene_string(yaml_text, base_dir)["animation"]
+        job = Job(session, anim)
+
+        with self.lock:
+            previous = self.active.pop(session, None)
+            last = self.last_render.get(session)
+            self.active[session] = job
+            self.jobs[job.id] = job
+            self._trim()
+        if previous is not None:
+            self.cancel(previous.id)
+
+        if last is not None and (last.width, last.height, last.dependencies) == (
+            job.width, job.height, job.dependencies
+        ):
+            dirty = dirty_frames(last.elements, job.elements, job.total)
+            for i in range(min(job.total, last.total)):
+                if i not in dirty:
+                    job.frames[i] = last.frames[i]
+        todo = [i for i in range(job.total) if job.frames[i] is None]
+        job.completed = job.total - len(todo)
+
+        if not todo:
+            self._finish(job, "done")
+            return job
+
+        for start in range(0, len(todo), CHUNK_FRAMES):
+            chunk = todo[start:start + CHUNK_FRAMES]
+            pool, future = self._submit(yaml_text, base_dir, chunk)
+            job.futures.append(future)
+            future.add_done_callback(partial(self._on_chunk, job, chunk, pool))
+        return job
+
+    def get(self, job_id: str):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        for future in job.futures:
+            future.cancel()  # chunks already running finish and are ignored
+        self._finish(job, "cancelled")
+        return True
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_chunk(self, job: Job, chunk: list, pool, future):
+        if future.cancelled() or job.finished:
+            return
+        error = future.exception()
+        if error is not None:
+            if isinstance(error, BrokenProcessPool):
+                # A worker died: fail this job, not every later one. The
+                # broken pool fails the other chunks itself (cancelling
+                # them here would race its management thread).
+                self._replace_pool(pool)
+            else:
+                for f in job.futures:
+                    f.cancel()
+            job.error = str(error)
+            self._finish(job, "error")
+            return
+
+        with job.cond:
+            for i, data in zip(chunk, future.result()):
+                job.frames[i] = data
+            job.completed += len(chunk)
+            job.rendered += len(chunk)
+            job.version += 1
+            job.cond.notify_all()
+        if job.completed == job.total:
+            self._finish(job, "done")
+
+    def _finish(self, job: Job, status: str):
+        with job.cond:
+            if job.finished:
+                return
+            job.status = status
+            job.version += 1
+            job.cond.notify_all()
+
+        with self.lock:
+            if self.active.get(job.session) is job:
+                del self.active[job.session]
+            if status == "done":
+                self.last_render.pop(job.session, None)
+                self.last_render[job.session] = job
+                while len(self.last_render) > MAX_SESSIONS:
+                    self.last_render.popitem(last=False)
+
+    def _submit(self, yaml_text: str, base_dir: str, chunk: list) -> tuple:
+        """Queue a chunk; returns (pool, future). A pool broken by a dead
+        worker is replaced first."""
+        pool = self.pool
+        try:
+            return pool, pool.submit(render_frames, yaml_text, base_dir, chunk)
+        except BrokenProcessPool:
+            self._replace_pool(pool)
+            pool = self.pool
+            return pool, pool.submit(render_frames, yaml_text, base_dir, chunk)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _replace_pool(self, broken: ProcessPoolExecutor):
+        """Swap in a fresh pool unless `broken` was already replaced."""
+        with self.lock:
+            if self.pool is not broken:
+                return
+            self.pool = self._new_pool()
+        broken.shutdown(wait=False)
+
+    def _trim(self):
+        """Forget the oldest finished jobs beyond MAX_JOBS (lock held)."""
+        excess = len(self.jobs) - MAX_JOBS
+        for job_id in [j.id for j in self.jobs.values() if j.finished][:max(0, excess)]:
+            del self.jobs[job_id]
@@ -0,0 +1,290 @@
+"""
+Live Preview — server-side editor sessions for the Studio.
+
+A session keeps the scene text, the parsed elements, the compiled draw
+ops and the packed frames of the last render. The editor sends text
+patches instead of the whole YAML; a background thread re-renders only
+the frames the edit dirtied (nearest the scrub head first) and every
+listener on the session's event stream receives only the frames whose
+pixels changed, as XOR deltas against what it was sent before.
+
+Sessions idle for longer than `idle_timeout` seconds are evicted.
+"""
+
+import base64
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from oled_animator.dsl import parse_scene_string, DSLError
+from oled_animator.incremental import dependency_stats, dirty_frames
+
+IDLE_TIMEOUT_S = 300
+MAX_LIVE_SESSIONS = 32
+RENDER_CHUNK = 8  # frames rendered between notifications
+
+
+class PatchConflict(Exception):
+    """The patch was made against a different version of the text."""
+
+
+def apply_patches(text: str, edits: list) -> str:
+    """Apply edit batches in order. Each batch is a list of
+    {"offset", "length", "text"} changes relative to the text before that
+    batch (like one Monaco content-change event); offsets count UTF-16
+    code units, as in the browser."""
+    buf = text.encode("utf-16-le")
+    for batch in edits:
+        for change in sorted(batch, key=lambda c: c["offset"], reverse=True):
+            start = int(change["offset"]) * 2
+            end = start + int(change.get("length", 0)) * 2
+            if start < 0 or end < start or end > len(buf):
+                raise ValueError("Patch out of range")
+            buf = buf[:start] + change.get("text", "").encode("utf-16-le") + buf[end:]
+    return buf.decode("utf-16-le")
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    size = len(b)
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(size, "big")
+
+
+class LiveSession:
+    """One editor's scene, render cache and render thread."""
+
+    def __init__(self, base_dir: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.base_dir = base_dir
+        self.text = ""
+        self.version = 0          # bumped on every text change
+        self.error = None         # last parse or render error (frames are kept)
+        self.anim = None
+        self.ops = None
+        self.elements = None
+        self.dependencies = None  # (size, mtime_ns) of the sprites/fonts used
+        self.frames = []          # packed horizontal bytes, None = pending
+        self.frame_seq = []       # seq at which each frame last changed
+        self.pending = []         # frames to render, in priority order
+        self.stale = set()        # frames dropped by a failed render
+        self.layout = 0           # bumped when size or frame count change
+        self.generation = 0       # bumped when pending work is replaced
+        self.seq = 0              # bumped on every change listeners see
+        self.closed = False
+        self.last_seen = time.monotonic()
+        self.edit_lock = threading.Lock()
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def touch(self):
+        self.last_seen = time.monotonic()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.seq += 1
+            self.cond.notify_all()
+
+    def update(self, text: str = None, edits: list = None, base: int = None,
+               focus: int = 0) -> int:
+        """Replace the text, or apply `edits` made against version `base`.
+        Returns the new version; raises PatchConflict or ValueError."""
+        with self.edit_lock:
+            if edits is not None:
+                if base != self.version:
+                    raise PatchConflict(f"Session is at version {self.version}")
+                text = apply_patches(self.text, edits)
+
+            try:
+                anim = parse_scene_string(text, self.base_dir)["animation"]
+                error = None
+            except (DSLError, OSError, ValueError) as e:
+                anim, error = None, str(e)
+
+            with self.cond:
+                self.touch()
+                self.text = text
+                self.version += 1
+                self.error = error
+                if anim is not None:
+                    self._schedule(anim, focus)
+                self.seq += 1
+                self.cond.notify_all()
+                return self.version
+
+    def _schedule(self, anim, focus: int):
+        """Queue the frames `anim` changes (cond held)."""
+        total = anim.total_frames
+        dependencies = dependency_stats(anim.elements)
+        if self.anim is None or (anim.width, anim.height, total) != (
+            self.anim.width, self.anim.height, len(self.frames)
+        ):
+            self.layout += 1
+            self.frames = [None] * total
+            self.frame_seq = [self.seq + 1] * total
+            dirty = set(range(total))
+        else:
+            if anim.fps != self.anim.fps:
+                self.layout += 1  # listeners re-read the scene info
+            if dependencies != self.dependencies:
+                dirty = set(range(total))  # a sprite or font changed on disk
+            else:
+                dirty = dirty_frames(self.elements, anim.elements, total)
+                dirty |= set(self.pending) | self.stale
+
+        self.anim = anim
+        self.ops = anim.compile()
+        self.elements = copy.deepcopy(anim.elements)
+        self.dependencies = dependencies
+        self.pending = sorted(dirty, key=lambda i: (abs(i - focus), i))
+        self.stale = set()
+        self.generation += 1
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.pending and not self.closed:
+                    self.cond.wait()
+                if self.closed:
+                    return
+                anim, ops, generation = self.anim, self.ops, self.generation
+                chunk = self.pending[:RENDER_CHUNK]
+
+            try:
+                rendered = [(i, anim.render_frame(i, ops).to_bytes("horizontal")) for i in chunk]
+                error = None
+            except Exception as e:  # e.g. a half-typed sprite src; keep the thread alive
+                rendered, error = [], f"Render failed: {e}"
+
+            with self.cond:
+                if self.generation != generation:
+                    continue  # rescheduled meanwhile; chunk is still pending
+                if error is not None:
+                    # Stop until the next edit, which re-renders what was dropped
+                    self.error = error
+                    self.stale.update(self.pending)
+                    self.pending = []
+                else:
+                    del self.pending[:len(chunk)]
+                for i, data in rendered:
+                    if data != self.frames[i]:
+                        self.frames[i] = data
+                        self.frame_seq[i] = self.seq + 1
+                self.seq += 1
+                self.cond.notify_all()
+
+    def info(self) -> dict:
+        """Scene metadata (cond held)."""
+        anim = self.anim
+        return {
+            "id": self.id,
+            "version": self.version,
+            "width": anim.width if anim else 0,
+            "height": anim.height if anim else 0,
+            "fps": anim.fps if anim else 0,
+            "total": len(self.frames),
+        }
+
+    def events(self, heartbeat: float):
+        """Yield ("scene" | "update" | "closed", data) for one listener, or
+        None when nothing changed for `heartbeat` seconds.
+
+        "scene" starts a new frame layout (all frames zero); "update"
+        carries [index, base64 XOR delta] pairs against the frames this
+        listener was sent before.
+        """
+        sent, layout, seen = [], None, -1
+        while True:
+            with self.cond:
+                if self.seq == seen and not self.closed:
+                    self.cond.wait(heartbeat)
+                self.touch()
+                if self.closed:
+                    out = [("closed", {"id": self.id})]
+                elif self.seq == seen:
+                    out = [None]
+                else:
+                    out = []
+                    if self.layout != layout and self.anim is not None:
+                        layout = self.layout
+                        sent = [None] * len(self.frames)
+                        out.append(("scene", self.info()))
+
+                    deltas = []
+                    for i, data in enumerate(self.frames):
+                        if data is None or self.frame_seq[i] <= seen or data == sent[i]:
+                            continue
+                        delta = data if sent[i] is None else _xor(sent[i], data)
+                        deltas.append([i, base64.b64encode(delta).decode("ascii")])
+                        sent[i] = data
+
+                    seen = self.seq
+                    out.append(("update", {
+                        "version": self.version,
+                        "pending": len(self.pending),
+                        "error": self.error,
+                        "frames": deltas,
+                    }))
+
+            for item in out:
+                yield item
+                if item is not None and item[0] == "closed":
+                    return
+
+
+class LiveSessionManager:
+    """Creates sessions and evicts those idle for `idle_timeout` seconds
+    (a connected event stream counts as activity)."""
+
+    def __init__(self, base_dir: str, idle_timeout: float = IDLE_TIMEOUT_S):
+        self.base_dir = base_dir
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock()
+        self.sessions = OrderedDict()  # id -> LiveSession
+        self.janitor = None
+
+    def create(self, text: str, focus: int = 0) -> LiveSession:
+        session = LiveSession(self.base_dir)
+        with self.lock:
+            self.sessions[session.id] = session
+            while len(self.sessions) > MAX_LIVE_SESSIONS:
+                _, oldest = self.sessions.popitem(last=False)
+                oldest.close()
+            if self.janitor is None:
+                self.janitor = threading.Thread(target=self._sweep_forever, daemon=True)
+                self.janitor.start()
+        session.update(text, focus=focus)
+        return session
+
+    def get(self, session_id: str):
+        with self.lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                self.sessions.move_to_end(session_id)
+                session.touch()
+            return session
+
+    def close(self, session_id: str) -> bool:
+        with self.lock:
+            session = self.sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.close()
+        return True
+
+    def sweep(self):
+        """Close every session idle for longer than `idle_timeout`."""
+        deadline = time.monotonic() - self.idle_timeout
+        with self.lock:
+            idle = [s for s in self.sessions.values() if s.last_seen < deadline]
+            for session in idle:
+                del self.sessions[session.id]
+        for session in idle:
+            session.close()
+
+    def _sweep_forever(self):
+        while True:
+            time.sleep(max(1.0, min(self.idle_timeout / 4, 60.0)))
+            self.sweep()
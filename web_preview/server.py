@@ -9,46 +9,193 @@ import os
 import io
 import json
 import glob
+import gzip
 import base64
-import tempfile
 import subprocess
+import threading
 import traceback
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 
 from flask import (
-    Flask, render_template, jsonify, request, send_file, abort
+    Flask, Response, render_template, jsonify, request, send_file, abort,
+    stream_with_context,
 )
+from PIL import Image
 
 # Import the engine
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-from oled_animator.dsl import parse_scene, DSLError
+from oled_animator.canvas import Canvas
+from oled_animator.dsl import parse_scene_string, DSLError
+from oled_animator.incremental import IncrementalRenderer
 from oled_animator.exporters.c_array import export_c_array
 from oled_animator.exporters.delta import export_delta
 from oled_animator.exporters.gif_preview import save_gif
+from web_preview.jobs import JobManager
+from web_preview.live import LiveSessionManager, PatchConflict, IDLE_TIMEOUT_S
+from web_preview.catalog import Catalog, describe_scene, describe_asset, SCENE_EXTENSIONS
+from web_preview.thumbnails import ThumbnailCache
 
 # Paths
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 EXAMPLES_DIR = os.path.join(BASE_DIR, "examples")
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+THUMBNAIL_DIR = os.path.join(OUTPUT_DIR, "thumbnails")
 SVG_IMPORTER = os.path.join(BASE_DIR, "tools", "svg_importer", "svg2sprite.js")
 
 # Ensure directories exist
 os.makedirs(ASSETS_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-# Thread pool for non-blocking renders
-executor = ThreadPoolExecutor(max_workers=2)
-
-
-def create_app():
-    """Create Flask app for the Studio Dashboard."""
+# Process pool for non-blocking render jobs (created on first use)
+_job_manager = None
+_job_manager_lock = threading.Lock()
+SSE_HEARTBEAT_S = 15
+
+# Studio export types: (file name, mimetype)
+EXPORT_TYPES = {
+    "c_array": ("animation.h", "text/plain"),
+    "delta": ("animation_delta.h", "text/plain"),
+    "gif": ("preview.gif", "image/gif"),
+}
+
+
+def _get_job_manager() -> JobManager:
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+        return _job_manager
+
+# Incremental renderers, one per editor session (hot reload re-renders
+# only the frames touched by the last edit)
+MAX_RENDER_SESSIONS = 16
+_renderers = OrderedDict()
+_renderers_lock = threading.Lock()
+
+
+def _get_renderer(session: str):
+    """Return the (renderer, lock) pair for an editor session, evicting
+    the least recently used session when over the limit."""
+    with _renderers_lock:
+        entry = _renderers.pop(session, None)
+        if entry is None:
+            entry = (IncrementalRenderer(), threading.Lock())
+        _renderers[session] = entry
+        while len(_renderers) > MAX_RENDER_SESSIONS:
+            _renderers.popitem(last=False)
+        return entry
+
+
+def _render_payload(images, width: int, height: int, fps: int, scale: int) -> dict:
+    """JSON body shared by /api/render and finished jobs: base64 PNG frames
+    scaled up by `scale`, plus memory stats."""
+    frame_data = []
+    for img in images:
+        scaled = img.convert("L").resize((width * scale, height * scale), 0)
+        buf = io.BytesIO()
+        scaled.save(buf, format="PNG")
+        frame_data.append(base64.b64encode(buf.getvalue()).decode("ascii"))
+
+    return {
+        "fps": fps,
+        "width": width,
+        "height": height,
+        "scaled_width": width * scale,
+        "scaled_height": height * scale,
+        "frame_count": len(frame_data),
+        "frames": frame_data,
+        "memory": _memory_stats(width, height, len(frame_data)),
+    }
+
+
+def _memory_stats(width: int, height: int, frame_count: int) -> dict:
+    frame_bytes = (width * height) // 8
+    total_bytes = frame_bytes * frame_count
+    esp32_flash = 4 * 1024 * 1024  # 4MB
+    return {
+        "frame_bytes": frame_bytes,
+        "total_bytes": total_bytes,
+        "total_kb": round(total_bytes / 1024, 2),
+        "flash_pct": round((total_bytes / esp32_flash) * 100, 2),
+    }
+
+
+def _xor_frames(packed: list) -> list:
+    """Frame 0 as-is, then each frame XOR the previous one (mostly zeros,
+    so it gzips down to almost nothing)."""
+    if not packed:
+        return []
+    size = len(packed[0])
+    out = [packed[0]]
+    prev = int.from_bytes(packed[0], "big")
+    for data in packed[1:]:
+        curr = int.from_bytes(data, "big")
+        out.append((prev ^ curr).to_bytes(size, "big"))
+        prev = curr
+    return out
+
+
+def _frames_response(packed: list, width: int, height: int, fps: int,
+                     rendered: int, encoding: str = "raw", start: int = 0,
+                     step: int = 1, total: int = None) -> Response:
+    """Binary preview: frames packed horizontally (MSB = leftmost pixel,
+    width * height / 8 bytes each), concatenated; metadata in headers.
+    `start`/`step` locate the frames in a timeline of `total` frames.
+
+    `encoding="xor"` sends frames after the first as XOR deltas. The body
+    is gzipped when the client accepts it; browsers scale the frames.
+    """
+    if encoding not in ("raw", "xor"):
+        return jsonify({"error": f"Unknown encoding: {encoding}"}), 400
+    body = b"".join(_xor_frames(packed) if encoding == "xor" else packed)
+    total = len(packed) if total is None else total
+
+    headers = {
+        "X-Frame-Width": str(width),
+        "X-Frame-Height": str(height),
+        "X-Frame-Count": str(len(packed)),
+        "X-Frame-Start": str(start),
+        "X-Frame-Step": str(step),
+        "X-Total-Frames": str(total),
+        "X-Frame-Encoding": encoding,
+        "X-Fps": str(fps),
+        "X-Rendered-Frames": str(rendered),
+        "X-Memory": json.dumps(_memory_stats(width, height, total)),
+        "Cache-Control": "no-store",
+    }
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return Response(body, mimetype="application/octet-stream", headers=headers)
+
+
+def _frame_range_args():
+    """(start, stop, step) from the query string; stop None = to the end."""
+    start = request.args.get("start", 0, type=int)
+    stop = request.args.get("stop", None, type=int)
+    step = request.args.get("step", 1, type=int)
+    if step < 1:
+        raise ValueError("step must be >= 1")
+    return start, stop, step
+
+
+def create_app(live_idle_timeout: float = IDLE_TIMEOUT_S):
+    """Create Flask app for the Studio Dashboard.
+
+    Live preview sessions idle for `live_idle_timeout` seconds are evicted.
+    """
     template_dir = os.path.join(os.path.dirname(__file__), "templates")
     static_dir = os.path.join(os.path.dirname(__file__), "static")
     os.makedirs(static_dir, exist_ok=True)
     app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
     app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB max upload
+    live = LiveSessionManager(EXAMPLES_DIR, idle_timeout=live_idle_timeout)
+    scene_catalog = Catalog(EXAMPLES_DIR, describe_scene, SCENE_EXTENSIONS)
+    asset_catalog = Catalog(ASSETS_DIR, describe_asset, recursive=False)
+    thumbnails = ThumbnailCache(THUMBNAIL_DIR)
 
     # ───────────────────────────────────
     # Dashboard
@@ -62,19 +209,44 @@ def create_app():
     # ───────────────────────────────────
     @app.route("/api/scenes")
     def list_scenes():
-        """List all YAML scene files recursively."""
+        """List all YAML scene files recursively, with their screen size,
+        frame count, content hash and thumbnail URL (from the scene catalog)."""
         scenes = []
-        for root, dirs, files in os.walk(EXAMPLES_DIR):
-            for f in sorted(files):
-                if f.endswith((".yaml", ".yml")):
-                    full = os.path.join(root, f)
-                    rel = os.path.relpath(full, EXAMPLES_DIR)
-                    scenes.append({
-                        "name": rel,
-                        "path": full,
-                        "size": os.path.getsize(full),
-                    })
-        return jsonify(scenes)
+        for entry in scene_catalog.list():
+            key = thumbnails.key(entry)
+            scenes.append(dict(
+                entry,
+                thumbnail=f"/api/thumbnails/{entry['name']}?v={key}" if key else None,
+            ))
+        response = jsonify(scenes)
+        response.add_etag()
+        return response.make_conditional(request)
+
+    @app.route("/api/thumbnails/<path:name>")
+    def scene_thumbnail(name):
+        """Frame 0 of a scene as a 1:1 PNG, rendered once per content and
+        dependency hash. The hash is the ETag; URLs carrying it as `?v=`
+        (as listed by /api/scenes) may be cached forever."""
+        entry = scene_catalog.get(name)
+        if entry is None:
+            abort(404)
+        try:
+            path, key = thumbnails.path(entry)
+        except DSLError as e:
+            return jsonify({"error": f"DSL Error: {str(e)}"}), 400
+        except (OSError, ValueError) as e:
+            return jsonify({"error": str(e)}), 500
+        if path is None:
+            abort(404)
+
+        immutable = request.args.get("v") == key
+        response = send_file(
+            path, mimetype="image/png", etag=key,
+            max_age=365 * 24 * 3600 if immutable else 0,
+        )
+        if immutable:
+            response.cache_control.immutable = True
+        return response
 
     @app.route("/api/scenes/<path:name>", methods=["GET"])
     def get_scene(name):
@@ -95,6 +267,7 @@ def create_app():
         os.makedirs(os.path.dirname(fpath), exist_ok=True)
         with open(fpath, "w", encoding="utf-8") as f:
             f.write(content)
+        scene_catalog.invalidate()
         return jsonify({"status": "ok", "name": name})
 
     # ───────────────────────────────────
@@ -102,70 +275,254 @@ def create_app():
     # ───────────────────────────────────
     @app.route("/api/render", methods=["POST"])
     def render_scene():
-        """Render YAML content and return base64 frames."""
+        """Render YAML content and return base64 frames.
+
+        `?start=&stop=&step=` render only that frame range (e.g. the frame
+        under the scrub head); memory stats still cover the whole scene.
+        """
         data = request.get_json()
         yaml_content = data.get("yaml", "")
         scale = data.get("scale", 4)
+        session = str(data.get("session", "default"))
 
         if not yaml_content.strip():
             return jsonify({"error": "Empty YAML"}), 400
 
         try:
-            # Write to temp file for the DSL parser
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False, dir=EXAMPLES_DIR
-            ) as tmp:
-                tmp.write(yaml_content)
-                tmp_path = tmp.name
-
-            scene = parse_scene(tmp_path)
+            start, stop, step = _frame_range_args()
+            scene = parse_scene_string(yaml_content, EXAMPLES_DIR)
             anim = scene["animation"]
-            frames_canvas = anim.render_all()
-
-            # Convert to base64
-            frame_data = []
-            for canvas in frames_canvas:
-                img = canvas.get_image().convert("L")
-                scaled = img.resize(
-                    (anim.width * scale, anim.height * scale), 0
-                )
-                buf = io.BytesIO()
-                scaled.save(buf, format="PNG")
-                b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-                frame_data.append(b64)
-
-            # Calculate memory stats
-            frame_bytes = (anim.width * anim.height) // 8
-            total_bytes = frame_bytes * anim.total_frames
-            esp32_flash = 4 * 1024 * 1024  # 4MB
-
-            result = {
-                "fps": anim.fps,
-                "width": anim.width,
-                "height": anim.height,
-                "scaled_width": anim.width * scale,
-                "scaled_height": anim.height * scale,
-                "frame_count": len(frame_data),
-                "frames": frame_data,
-                "memory": {
-                    "frame_bytes": frame_bytes,
-                    "total_bytes": total_bytes,
-                    "total_kb": round(total_bytes / 1024, 2),
-                    "flash_pct": round((total_bytes / esp32_flash) * 100, 2),
-                },
-            }
+            renderer, lock = _get_renderer(session)
+            with lock:
+                frames_canvas = renderer.render(anim, start, stop, step)
+                rendered_frames = renderer.rendered
+
+            result = _render_payload(
+                (c.image for c in frames_canvas),
+                anim.width, anim.height, anim.fps, scale,
+            )
+            result["rendered_frames"] = rendered_frames
+            result["start"] = anim.frame_range(start, stop, step).start
+            result["step"] = step
+            result["total_frames"] = anim.total_frames
+            result["memory"] = _memory_stats(anim.width, anim.height, anim.total_frames)
             return jsonify(result)
 
         except DSLError as e:
             return jsonify({"error": f"DSL Error: {str(e)}"}), 400
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            traceback.print_exc()
+            return jsonify({"error": str(e)}), 500
+
+    @app.route("/api/render/frames", methods=["POST"])
+    def render_scene_frames():
+        """Render YAML content and return packed 1-bit frames as
+        application/octet-stream (see `_frames_response`). Accepts the
+        same `?start=&stop=&step=` range as /api/render."""
+        data = request.get_json()
+        yaml_content = data.get("yaml", "")
+        session = str(data.get("session", "default"))
+        encoding = request.args.get("encoding", "raw")
+
+        if not yaml_content.strip():
+            return jsonify({"error": "Empty YAML"}), 400
+
+        try:
+            start, stop, step = _frame_range_args()
+            scene = parse_scene_string(yaml_content, EXAMPLES_DIR)
+            anim = scene["animation"]
+            renderer, lock = _get_renderer(session)
+            with lock:
+                frames_canvas = renderer.render(anim, start, stop, step)
+                rendered_frames = renderer.rendered
+
+            packed = [c.to_bytes("horizontal") for c in frames_canvas]
+            return _frames_response(
+                packed, anim.width, anim.height, anim.fps, rendered_frames, encoding,
+                start=anim.frame_range(start, stop, step).start, step=step,
+                total=anim.total_frames,
+            )
+
+        except DSLError as e:
+            return jsonify({"error": f"DSL Error: {str(e)}"}), 400
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
             traceback.print_exc()
             return jsonify({"error": str(e)}), 500
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
+
+    # ───────────────────────────────────
+    # Render Jobs (non-blocking, process pool)
+    # ───────────────────────────────────
+    @app.route("/api/jobs", methods=["POST"])
+    def submit_job():
+        """Start a render job. A new job for the same session cancels the
+        previous one. Returns 202 with the job id."""
+        data = request.get_json()
+        yaml_content = data.get("yaml", "")
+        session = str(data.get("session", "default"))
+
+        if not yaml_content.strip():
+            return jsonify({"error": "Empty YAML"}), 400
+
+        try:
+            job = _get_job_manager().submit(yaml_content, EXAMPLES_DIR, session)
+        except DSLError as e:
+            return jsonify({"error": f"DSL Error: {str(e)}"}), 400
+        except Exception as e:
+            traceback.print_exc()
+            return jsonify({"error": str(e)}), 500
+
+        return jsonify(job.info()), 202
+
+    @app.route("/api/jobs/<job_id>", methods=["GET"])
+    def job_status(job_id):
+        job = _get_job_manager().get(job_id)
+        if job is None:
+            abort(404)
+        return jsonify(job.info())
+
+    @app.route("/api/jobs/<job_id>", methods=["DELETE"])
+    def cancel_job(job_id):
+        manager = _get_job_manager()
+        if manager.get(job_id) is None:
+            abort(404)
+        manager.cancel(job_id)
+        return jsonify(manager.get(job_id).info())
+
+    @app.route("/api/jobs/<job_id>/events")
+    def job_events(job_id):
+        """Server-Sent Events: `progress` while rendering, then one of
+        `done`, `error` or `cancelled`."""
+        job = _get_job_manager().get(job_id)
+        if job is None:
+            abort(404)
+
+        def stream():
+            version = -1
+            while True:
+                new_version = job.wait(version, SSE_HEARTBEAT_S)
+                if new_version == version:
+                    yield ": heartbeat\n\n"
+                    continue
+                version = new_version
+                event = "progress" if not job.finished else job.status
+                yield f"event: {event}\ndata: {json.dumps(job.info())}\n\n"
+                if job.finished:
+                    return
+
+        return Response(
+            stream_with_context(stream()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.route("/api/jobs/<job_id>/result")
+    def job_result(job_id):
+        """Frames of a finished job, in the same format as /api/render."""
+        job = _get_job_manager().get(job_id)
+        if job is None:
+            abort(404)
+        if job.status != "done":
+            return jsonify(job.info()), 409
+
+        scale = request.args.get("scale", 4, type=int)
+        images = (
+            Image.frombytes("1", (job.width, job.height), data)
+            for data in job.frames
+        )
+        result = _render_payload(images, job.width, job.height, job.fps, scale)
+        result["rendered_frames"] = job.rendered
+        return jsonify(result)
+
+    @app.route("/api/jobs/<job_id>/frames")
+    def job_frames(job_id):
+        """Frames of a finished job as packed binary (see `_frames_response`)."""
+        job = _get_job_manager().get(job_id)
+        if job is None:
+            abort(404)
+        if job.status != "done":
+            return jsonify(job.info()), 409
+
+        return _frames_response(
+            job.frames, job.width, job.height, job.fps, job.rendered,
+            request.args.get("encoding", "raw"),
+        )
+
+    # ───────────────────────────────────
+    # Live Preview (editor sessions: POST patches, SSE frame deltas)
+    # ───────────────────────────────────
+    @app.route("/api/live", methods=["POST"])
+    def create_live_session():
+        """Open a session with the editor's full text. Returns 201 with
+        the session id and text version."""
+        data = request.get_json()
+        session = live.create(data.get("yaml", ""), data.get("focus", 0))
+        return jsonify({"id": session.id, "version": session.version}), 201
+
+    @app.route("/api/live/<session_id>", methods=["PUT"])
+    def replace_live_text(session_id):
+        """Resynchronise a session with the editor's full text."""
+        session = live.get(session_id)
+        if session is None:
+            abort(404)
+        data = request.get_json()
+        version = session.update(data.get("yaml", ""), focus=data.get("focus", 0))
+        return jsonify({"id": session.id, "version": version})
+
+    @app.route("/api/live/<session_id>", methods=["PATCH"])
+    def patch_live_text(session_id):
+        """Apply edit batches made against version `base`. Returns 409
+        with the current version if the client is out of date."""
+        session = live.get(session_id)
+        if session is None:
+            abort(404)
+        data = request.get_json()
+        try:
+            version = session.update(
+                edits=data.get("edits", []), base=data.get("base"),
+                focus=data.get("focus", 0),
+            )
+        except PatchConflict as e:
+            return jsonify({"error": str(e), "version": session.version}), 409
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify({"error": f"Bad patch: {e}", "version": session.version}), 409
+        return jsonify({"id": session.id, "version": version})
+
+    @app.route("/api/live/<session_id>", methods=["DELETE"])
+    def close_live_session(session_id):
+        if not live.close(session_id):
+            abort(404)
+        return jsonify({"status": "ok"})
+
+    @app.route("/api/live/<session_id>/events")
+    def live_events(session_id):
+        """Server-Sent Events: `scene` when the frame layout changes,
+        `update` with changed frames as base64 XOR deltas (packed
+        horizontal), `closed` when the session is evicted."""
+        session = live.get(session_id)
+        if session is None:
+            abort(404)
+
+        def stream():
+            for item in session.events(SSE_HEARTBEAT_S):
+                if item is None:
+                    yield ": heartbeat\n\n"
+                    continue
+                event, payload = item
+                if event == "scene":
+                    payload["memory"] = _memory_stats(
+                        payload["width"], payload["height"], payload["total"],
+                    )
+                yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+        return Response(
+            stream_with_context(stream()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     # ───────────────────────────────────
     # SVG Import (calls Node.js)
@@ -183,6 +540,7 @@ def create_app():
         # Save uploaded SVG to assets
         svg_path = os.path.join(ASSETS_DIR, file.filename)
         file.save(svg_path)
+        asset_catalog.invalidate()
 
         # Options from form
         width = request.form.get("width", "64")
@@ -201,6 +559,7 @@ def create_app():
                 cmd, capture_output=True, text=True, timeout=30
             )
             output = result.stdout + result.stderr
+            asset_catalog.invalidate()
 
             # Find generated files
             basename = os.path.splitext(file.filename)[0]
@@ -241,20 +600,15 @@ def create_app():
     # ───────────────────────────────────
     @app.route("/api/assets")
     def list_assets():
-        """List all assets (sprites, PNGs, headers)."""
-        assets = []
-        if os.path.isdir(ASSETS_DIR):
-            for f in sorted(os.listdir(ASSETS_DIR)):
-                fpath = os.path.join(ASSETS_DIR, f)
-                if os.path.isfile(fpath):
-                    ext = os.path.splitext(f)[1].lower()
-                    assets.append({
-                        "name": f,
-                        "type": ext,
-                        "size": os.path.getsize(fpath),
-                        "url": f"/api/assets/{f}",
-                    })
-        return jsonify(assets)
+        """List all assets (sprites, PNGs, headers), with image dimensions
+        and content hash (from the asset catalog)."""
+        assets = [
+            dict(entry, url=f"/api/assets/{entry['name']}")
+            for entry in asset_catalog.list()
+        ]
+        response = jsonify(assets)
+        response.add_etag()
+        return response.make_conditional(request)
 
     @app.route("/api/assets/<path:name>")
     def get_asset(name):
@@ -269,75 +623,75 @@ def create_app():
     # ───────────────────────────────────
     @app.route("/api/export", methods=["POST"])
     def export_scene():
-        """Export current YAML to C-array, GIF, or Delta."""
+        """Start rendering the current YAML for export (C-array, GIF, or
+        Delta) as a render job. Returns 202 with the job; download the file
+        from /api/jobs/<id>/export once it is done."""
         data = request.get_json()
         yaml_content = data.get("yaml", "")
-        fmt = data.get("format", "horizontal")
         export_type = data.get("type", "c_array")  # c_array, gif, delta
+        session = str(data.get("session", "default"))
+
+        if export_type not in EXPORT_TYPES:
+            return jsonify({"error": f"Unknown export type: {export_type}"}), 400
 
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False, dir=EXAMPLES_DIR
-            ) as tmp:
-                tmp.write(yaml_content)
-                tmp_path = tmp.name
+            # Own session, so editing while exporting does not cancel it
+            job = _get_job_manager().submit(yaml_content, EXAMPLES_DIR, f"export:{session}")
+        except DSLError as e:
+            return jsonify({"error": f"DSL Error: {str(e)}"}), 400
+        except Exception as e:
+            traceback.print_exc()
+            return jsonify({"error": str(e)}), 500
 
-            scene = parse_scene(tmp_path)
-            anim = scene["animation"]
-            frames = anim.render_all()
+        return jsonify(job.info()), 202
 
-            if export_type == "c_array":
-                out_path = os.path.join(OUTPUT_DIR, "animation.h")
-                result = export_c_array(
-                    frames, out_path, anim.width, anim.height, anim.fps, fmt=fmt
-                )
-                return send_file(
-                    out_path,
-                    as_attachment=True,
-                    download_name="animation.h",
-                    mimetype="text/plain",
-                )
+    @app.route("/api/jobs/<job_id>/export")
+    def job_export(job_id):
+        """Export the frames of a finished job as `type` (c_array, delta,
+        gif) in byte order `format`."""
+        job = _get_job_manager().get(job_id)
+        if job is None:
+            abort(404)
+        if job.status != "done":
+            return jsonify(job.info()), 409
 
-            elif export_type == "delta":
-                out_path = os.path.join(OUTPUT_DIR, "animation_delta.h")
-                result = export_delta(
-                    frames, out_path, anim.width, anim.height, anim.fps
-                )
-                return send_file(
-                    out_path,
-                    as_attachment=True,
-                    download_name="animation_delta.h",
-                    mimetype="text/plain",
-                )
-
-            elif export_type == "gif":
-                out_path = os.path.join(OUTPUT_DIR, "preview.gif")
-                result = save_gif(frames, out_path, anim.fps, scale=4)
-                return send_file(
-                    out_path,
-                    as_attachment=True,
-                    download_name="preview.gif",
-                    mimetype="image/gif",
-                )
+        export_type = request.args.get("type", "c_array")
+        fmt = request.args.get("format", "horizontal")
+        if export_type not in EXPORT_TYPES:
+            return jsonify({"error": f"Unknown export type: {export_type}"}), 400
+        name, mimetype = EXPORT_TYPES[export_type]
+        out_path = os.path.join(OUTPUT_DIR, name)
 
-            else:
-                return jsonify({"error": f"Unknown export type: {export_type}"}), 400
+        try:
+            frames = []
+            for data in job.frames:
+                canvas = Canvas(job.width, job.height)
+                canvas.image = Image.frombytes("1", (job.width, job.height), data)
+                frames.append(canvas)
 
+            if export_type == "c_array":
+                export_c_array(frames, out_path, job.width, job.height, job.fps, fmt=fmt)
+            elif export_type == "delta":
+                export_delta(frames, out_path, job.width, job.height, job.fps)
+            else:
+                save_gif(frames, out_path, job.fps, scale=4)
         except Exception as e:
             traceback.print_exc()
             return jsonify({"error": str(e)}), 500
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
+
+        return send_file(out_path, as_attachment=True, download_name=name, mimetype=mimetype)
 
     # ───────────────────────────────────
     # Image2CPP Features
     # ───────────────────────────────────
     @app.route("/api/image2cpp/convert", methods=["POST"])
     def image2cpp_convert():
-        """Convert uploaded image(s) or ZIP to 1-bit Canvas & C-array."""
+        """Convert uploaded image(s) or ZIP to 1-bit Canvas & C-array.
+
+        ZIPs are converted in parallel and returned as one packed
+        multi-frame array (`data`, base64) plus, with `header=true`, a
+        combined C header; `results` only holds the first frame's preview.
+        """
         if "file" not in request.files:
             return jsonify({"error": "No file uploaded"}), 400
 
@@ -362,33 +716,56 @@ def create_app():
             filename = file.filename.lower()
 
             if filename.endswith(".zip"):
-                from oled_animator.image_converter import process_zip
-                # Read zip into memory
-                file_bytes = io.BytesIO(file.read())
-                processed_list = process_zip(file_bytes, settings)
-                
-                for item in processed_list:
-                    # Render to C-array
-                    c_data = item["canvas"].to_bytes("horizontal") # Default preview format
-                    
-                    # Convert preview to base64
+                import zipfile
+                from oled_animator.image_converter import convert_zip
+                from oled_animator.exporters.c_array import format_c_array
+
+                # Werkzeug spools large uploads to a temp file; the ZIP is
+                # read from it member by member instead of into memory
+                try:
+                    batch = convert_zip(file.stream, settings)
+                except zipfile.BadZipFile as e:
+                    return jsonify({"error": f"ZIP Error: {str(e)}"}), 400
+
+                names = batch["names"]
+                size = batch["frame_size"]
+                frames = [batch["data"][i * size:(i + 1) * size] for i in range(len(names))]
+                width, height = batch["width"], batch["height"]
+
+                if frames:
+                    # Rows hold width // 8 bytes (trailing pixels are dropped)
+                    first = Image.frombytes("1", (width // 8 * 8, height), frames[0])
                     buf = io.BytesIO()
-                    item["preview_image"].save(buf, format="PNG")
-                    b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-                    
+                    first.save(buf, format="PNG")
                     results.append({
-                        "name": item["name"],
-                        "preview": b64,
-                        "c_array": list(c_data), # Send as list of ints for frontend to format
-                        "width": item["width"],
-                        "height": item["height"]
+                        "name": names[0],
+                        "preview": base64.b64encode(buf.getvalue()).decode("ascii"),
+                        "c_array": list(frames[0]),
+                        "width": width,
+                        "height": height,
                     })
-            
+
+                response = {
+                    "results": results,
+                    "names": names,
+                    "errors": batch["errors"],
+                    "count": len(names),
+                    "width": width,
+                    "height": height,
+                    "frame_size": size,
+                    "data": base64.b64encode(batch["data"]).decode("ascii"),
+                }
+                if request.form.get("header", "false") == "true":
+                    response["header"] = format_c_array(
+                        frames, width, height, int(request.form.get("fps", 10)),
+                        var_prefix=request.form.get("name", "frame"), labels=names,
+                    )
+                return jsonify(response)
+
             else:
                 from oled_animator.image_converter import process_image
-                # Process single image
-                file_bytes = io.BytesIO(file.read())
-                item = process_image(file_bytes, file.filename, settings)
+                # Process single image (straight from the upload stream)
+                item = process_image(file.stream, file.filename, settings)
                 
                 if "error" in item:
                     return jsonify({"error": item["error"]}), 400
@@ -439,9 +816,9 @@ def create_app():
     return app
 
 
-def start_server(port: int = 5050):
+def start_server(port: int = 5050, live_idle_timeout: float = IDLE_TIMEOUT_S):
     """Start the Studio Dashboard server."""
-    app = create_app()
+    app = create_app(live_idle_timeout)
     print(f"\n🚀 remotionBinario Studio")
     print(f"   http://localhost:{port}")
     print(f"   Scenes: {EXAMPLES_DIR}")
@@ -0,0 +1,92 @@
+"""
+Thumbnails — frame 0 of each scene as a tiny 1:1 PNG, cached on disk.
+
+A thumbnail is keyed by the scene's content hash plus the hashes of its
+dependencies (sprites, fonts), so editing any of them yields a new key
+and an unchanged scene is never rendered twice. The key doubles as the
+HTTP ETag.
+"""
+
+import hashlib
+import os
+import threading
+
+from oled_animator.canvas import Canvas
+from oled_animator.dsl import parse_scene
+from oled_animator.manifest import hash_file
+
+MAX_THUMBNAILS = 1000
+
+
+class ThumbnailCache:
+    """Renders and stores scene thumbnails in `cache_dir`."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self._dep_hashes = {}  # path -> (size, mtime_ns, sha256)
+
+    def key(self, entry: dict):
+        """Cache key for a scene catalog entry, or None if it has no
+        thumbnail (invalid scene or missing dependency)."""
+        if entry.get("error") or not entry.get("sha256"):
+            return None
+        h = hashlib.sha256(entry["sha256"].encode("ascii"))
+        for path in entry.get("dependencies", []):
+            dep_hash = self._hash_dependency(path)
+            if dep_hash is None:
+                return None
+            h.update(b"\0" + dep_hash.encode("ascii"))
+        return h.hexdigest()[:32]
+
+    def path(self, entry: dict):
+        """Path of the scene's thumbnail PNG, rendering it if needed.
+        Returns (path, key), or (None, None) without a thumbnail."""
+        key = self.key(entry)
+        if key is None:
+            return None, None
+        path = os.path.join(self.cache_dir, f"{key}.png")
+        if os.path.isfile(path):
+            return path, key
+
+        with self.lock:
+            if not os.path.isfile(path):
+                self._render(entry["path"], path)
+                self._prune()
+        return path, key
+
+    def _hash_dependency(self, path: str) -> str:
+        """Content hash of a dependency, re-hashed only when its stat
+        changes; None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        cached = self._dep_hashes.get(path)
+        if cached is None or cached[:2] != (st.st_size, st.st_mtime_ns):
+            cached = (st.st_size, st.st_mtime_ns, hash_file(path))
+            self._dep_hashes[path] = cached
+        return cached[2]
+
+    def _render(self, scene_path: str, path: str):
+        anim = parse_scene(scene_path)["animation"]
+        frames = anim.render_range(0, 1)
+        frame = frames[0] if frames else Canvas(anim.width, anim.height)  # frames: 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = path + ".tmp"
+        frame.image.save(tmp_path, format="PNG", optimize=True)
+        os.replace(tmp_path, path)
+
+    def _prune(self):
+        """Drop the oldest thumbnails beyond MAX_THUMBNAILS (lock held)."""
+        names = [n for n in os.listdir(self.cache_dir) if n.endswith(".png")]
+        if len(names) <= MAX_THUMBNAILS:
+            return
+        paths = sorted(
+            (os.path.join(self.cache_dir, n) for n in names), key=os.path.getmtime,
+        )
+        for old in paths[:len(paths) - MAX_THUMBNAILS]:
+            try:
+                os.unlink(old)
+            except OSError:
+                pass